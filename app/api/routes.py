@@ -1,116 +1,147 @@
-﻿from sqlalchemy.orm import Session
+﻿import asyncio
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import (
     APIRouter,
     HTTPException,
     status,
-    BackgroundTasks,
     Depends,
+    Header,
     Query,
+    WebSocket,
+    WebSocketDisconnect,
+    Request,
 )
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 
-from config.db import get_db, SessionLocal
+from config.db import get_async_db
+from config.settings import settings
 from app.models.code import CodeUploadRequest
-from app.models.job import JobResponse, JobStatus, JobStatusResponse
+from app.models.job import (
+    Job,
+    JobListFilter,
+    JobResponse,
+    JobStatus,
+    JobStatusEvent,
+    JobStatusResponse,
+    TERMINAL_JOB_STATUSES,
+)
 from app.models.project import ProjectResponse
-from app.models.execution import ExecutionRequest
-from app.services.job import JobService
-from app.services.project import ProjectService
-from app.services.execution import ExecutionService
-from app.services.s3 import S3Service
-from app.services.cloudwatch import ResourceService, CloudWatchClient
+from app.models.execution import (
+    ExecutionRequest,
+    BatchExecutionRequest,
+    BatchExecutionItemResult,
+    BatchExecutionResponse,
+    ExecutionQueueStats,
+    EngineConnectionPoolStats,
+    ExecutionResultCacheStats,
+)
+from app.clients.engine import EngineHTTPClientPool, engine_http_pool
+from app.services.job import AsyncJobService
+from app.services.project import AsyncProjectService
+from app.services.execution import AsyncExecutionService
+from app.services.s3 import AsyncS3Service
+from app.services.cloudwatch import AsyncResourceService
+from app.clients.aws_io import AsyncCloudWatchClient, AWSCallTimeoutError
+from app.clients.s3 import LogNotFoundError, LogRangeNotSatisfiableError
+from app.models.log import LogCacheStats
+from app.services.log_cache import LogObjectCache, log_object_cache
+from app.services.pagination import InvalidCursorError, decode_project_cursor
+from app.services.profiling import ProfilerBusyError, profiling_token_valid, sampling_profiler
+from app.services.events import JobEventBus, job_event_bus
+from app.services.result_cache import ExecutionResultCache, execution_result_cache
+from app.services.dispatcher import (
+    ExecutionDispatcher,
+    ExecutionQueueFullError,
+    execution_dispatcher,
+)
 from app.models.cloudwatch import (
     AvailableMetricsResponse,
     ClusterMetricsResponse,
     CloudWatchMetricPoint,
+    MetricAggregationResponse,
 )
 
 router = APIRouter()
 
 
-def get_job_service(db: Session = Depends(get_db)) -> JobService:
-    return JobService(db)
+def _job_status_event(job: Job) -> JobStatusEvent:
+    """Job DTO를 현재 상태 이벤트로 변환합니다."""
+    return JobStatusEvent(
+        job_id=job.job_id,
+        status=job.status,
+        timestamp=job.updated_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
+        result=job.result if job.status in TERMINAL_JOB_STATUSES else None,
+    )
 
 
-def get_project_service(db: Session = Depends(get_db)) -> ProjectService:
-    return ProjectService(db)
+def get_job_service(db: AsyncSession = Depends(get_async_db)) -> AsyncJobService:
+    return AsyncJobService(db)
 
 
-def get_execution_service(db: Session = Depends(get_db)) -> ExecutionService:
-    return ExecutionService(db)
+def get_project_service(db: AsyncSession = Depends(get_async_db)) -> AsyncProjectService:
+    return AsyncProjectService(db)
 
 
-def get_s3_service(db: Session = Depends(get_db)) -> S3Service:
-    return S3Service(db)
+def get_execution_service(db: AsyncSession = Depends(get_async_db)) -> AsyncExecutionService:
+    return AsyncExecutionService(db)
 
 
-def get_cloudwatch_client() -> CloudWatchClient:
-    return CloudWatchClient()
+def get_s3_service(db: AsyncSession = Depends(get_async_db)) -> AsyncS3Service:
+    return AsyncS3Service(db)
 
 
-def get_resource_service(
-    cw_client: CloudWatchClient = Depends(get_cloudwatch_client),
-) -> ResourceService:
-    return ResourceService(cw_client=cw_client)
+def get_dispatcher() -> ExecutionDispatcher:
+    return execution_dispatcher
 
 
-async def run_execution_and_update_job(
-    jobId: str,
-    execution_request: ExecutionRequest,
-) -> None:
-    """Execution Engine 실행 후 Job 상태와 결과를 갱신하는 비동기 작업입니다.
-    
-    Background task에서 새로운 DB 세션을 생성하여 사용합니다.
-    """
-    # Background task에서 새로운 DB 세션 생성
-    db = SessionLocal()
-    try:
-        job_service = JobService(db)
-        execution_service = ExecutionService(db)
-        s3_service = S3Service(db)
-        
-        result = await execution_service.submit_execution(execution_request)
+def get_engine_http_pool() -> EngineHTTPClientPool:
+    return engine_http_pool
 
-        if not result:
-            job_service.update_job_status(jobId, JobStatus.FAILED)
-            return
 
-        result_dict = result.dict()
-        
-        if result_dict.get("completed_at"):
-            result_dict["completed_at"] = result_dict["completed_at"].isoformat()
-        
-        # 로그 메타데이터 저장
-        log_key = result_dict.get("log_key")
-        logs_url = result_dict.get("logs_url")
-        
-        # logs_url이 없으면 log_key로 S3 URL 생성
-        if log_key and not logs_url:
-            from config.settings import settings
-            logs_url = f"https://{settings.AWS_LOG_BUCKET}.s3.{settings.AWS_LOG_REGION}.amazonaws.com/{log_key}"
-            result_dict["logs_url"] = logs_url  # result에도 반영
-        
-        print(f"[DEBUG] log_key: {log_key}, logs_url: {logs_url}")  # 디버그 로그
-        if log_key:
-            saved = s3_service.save_log_metadata(jobId, log_key, logs_url or "")
-            print(f"[DEBUG] 로그 저장 결과: {saved}")  # 디버그 로그
-        
-        if result_dict.get("stderr") or result_dict.get("error_message"):
-            job_service.update_job_status(jobId, JobStatus.FAILED)
-        else:
-            job_service.update_job_status(jobId, JobStatus.SUCCESS)
-        
-        job_service.update_job_result(jobId, result_dict)
-    except Exception:
-        job_service.update_job_status(jobId, JobStatus.FAILED)
-    finally:
-        db.close()
+def get_job_event_bus() -> JobEventBus:
+    return job_event_bus
+
+
+def get_execution_result_cache() -> ExecutionResultCache:
+    return execution_result_cache
+
+
+def get_log_object_cache() -> LogObjectCache:
+    return log_object_cache
+
+
+def get_job_list_filter(
+    status: JobStatus | None = Query(None, description="Job 상태"),
+    language: str | None = Query(None, description="프로그래밍 언어"),
+    created_after: datetime | None = Query(None, description="이 시각 이후(포함)에 생성된 Job만 조회"),
+    created_before: datetime | None = Query(None, description="이 시각 이전에 생성된 Job만 조회"),
+) -> JobListFilter:
+    return JobListFilter(
+        status=status,
+        language=language,
+        created_after=created_after,
+        created_before=created_before,
+    )
+
+
+def get_cloudwatch_client() -> AsyncCloudWatchClient:
+    return AsyncCloudWatchClient()
+
+
+def get_resource_service(
+    cw_client: AsyncCloudWatchClient = Depends(get_cloudwatch_client),
+) -> AsyncResourceService:
+    return AsyncResourceService(cw_client=cw_client)
 
 
 @router.post("/upload", response_model=JobResponse)
 async def upload_code(
     code_request: CodeUploadRequest,
-    s3_service: S3Service = Depends(get_s3_service),
-    job_service: JobService = Depends(get_job_service),
+    s3_service: AsyncS3Service = Depends(get_s3_service),
+    job_service: AsyncJobService = Depends(get_job_service),
 ) -> JobResponse:
     """사용자 코드를 업로드하고 새로운 Job을 생성합니다."""
     if code_request.language not in ("python", "node", "java"):
@@ -131,8 +162,8 @@ async def upload_code(
                 detail="Failed to upload code to storage",
             )
 
-        job = job_service.create_job(code_request, code_key)
-        response = job_service.to_response(job, "Code uploaded successfully")
+        job = await job_service.create_job(code_request, code_key)
+        response = await job_service.to_response(job, "Code uploaded successfully")
         return JobResponse(**response.dict())
 
     except HTTPException:
@@ -144,46 +175,180 @@ async def upload_code(
         )
 
 
+@router.get("/execute/queue", response_model=ExecutionQueueStats)
+async def get_execution_queue_stats(
+    dispatcher: ExecutionDispatcher = Depends(get_dispatcher),
+) -> ExecutionQueueStats:
+    """실행 대기열의 깊이와 최근 대기 시간 통계를 조회합니다."""
+    return dispatcher.stats()
+
+
+@router.get("/execute/engine/pool", response_model=dict[str, EngineConnectionPoolStats])
+async def get_engine_pool_stats(
+    http_pool: EngineHTTPClientPool = Depends(get_engine_http_pool),
+) -> dict[str, EngineConnectionPoolStats]:
+    """Execution Engine HTTP 연결 풀 상태를 조회합니다."""
+    return {
+        key: EngineConnectionPoolStats(**stats)
+        for key, stats in http_pool.stats().items()
+    }
+
+
+@router.get("/execute/cache", response_model=ExecutionResultCacheStats)
+async def get_execution_cache_stats(
+    result_cache: ExecutionResultCache = Depends(get_execution_result_cache),
+) -> ExecutionResultCacheStats:
+    """실행 결과 캐시의 적중/미적중 통계를 조회합니다."""
+    return result_cache.stats()
+
+
+@router.post("/execute/batch", response_model=BatchExecutionResponse)
+async def execute_batch(
+    batch_request: BatchExecutionRequest,
+    job_service: AsyncJobService = Depends(get_job_service),
+    dispatcher: ExecutionDispatcher = Depends(get_dispatcher),
+    event_bus: JobEventBus = Depends(get_job_event_bus),
+) -> BatchExecutionResponse:
+    """여러 Job을 한 번에 실행 대기열에 넣습니다.
+
+    Job 조회와 RUNNING 전환은 각각 하나의 쿼리로 처리하며, 실제 엔진 호출은
+    디스패처의 언어별 동시성 한도 안에서 진행됩니다. 대기열 여유 공간을 넘는
+    Job과 이미 실행 중이라 RUNNING으로 전환되지 않은 Job은 거부됩니다.
+    """
+    if len(batch_request.jobs) > settings.EXECUTION_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch size exceeds limit of {settings.EXECUTION_BATCH_MAX_SIZE}",
+        )
+
+    try:
+        jobs = await job_service.get_jobs([item.job_id for item in batch_request.jobs])
+        slots = dispatcher.available_slots()
+
+        rejections: dict[int, str] = {}
+        execution_requests: list[ExecutionRequest] = []
+        seen: set[str] = set()
+
+        for index, item in enumerate(batch_request.jobs):
+            job = jobs.get(item.job_id)
+            if not job:
+                message = f"Job {item.job_id} not found"
+            elif item.job_id in seen:
+                message = "Duplicate job in batch"
+            elif len(execution_requests) >= slots:
+                message = "Execution queue is full"
+            else:
+                seen.add(item.job_id)
+                execution_requests.append(
+                    ExecutionRequest(
+                        job_id=job.job_id,
+                        code_key=job.code_key,
+                        code_hash=job.code_hash,
+                        language=job.language,
+                        input=item.input,
+                        timeout=job.timeout_ms,
+                    )
+                )
+                continue
+            rejections[index] = message
+
+        submitted: set[str] = set()
+        if execution_requests:
+            submitted = set(await dispatcher.submit_many(job_service.db, execution_requests))
+            for job_id in submitted:
+                event_bus.publish(JobStatusEvent(job_id=job_id, status=JobStatus.RUNNING))
+
+        # RUNNING 전환에 성공한 Job만 접수된 것으로 응답합니다.
+        results: list[BatchExecutionItemResult] = []
+        for index, item in enumerate(batch_request.jobs):
+            job = jobs.get(item.job_id)
+            if index in rejections:
+                results.append(
+                    BatchExecutionItemResult(
+                        job_id=item.job_id,
+                        accepted=False,
+                        status=job.status if job else None,
+                        message=rejections[index],
+                    )
+                )
+            else:
+                results.append(
+                    BatchExecutionItemResult(
+                        job_id=item.job_id,
+                        accepted=item.job_id in submitted,
+                        status=JobStatus.RUNNING,
+                        message="Execution started" if item.job_id in submitted else "Job is already running",
+                    )
+                )
+
+        accepted = len(submitted)
+        return BatchExecutionResponse(
+            accepted=accepted,
+            rejected=len(results) - accepted,
+            results=results,
+        )
+
+    except HTTPException:
+        raise
+    except ExecutionQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Execution queue is full",
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to trigger batch execution",
+        )
+
+
 @router.post("/execute/{jobId}", response_model=JobResponse)
 async def execute_code(
     jobId: str,
-    background_tasks: BackgroundTasks,
     input_data: str = "",
-    job_service: JobService = Depends(get_job_service),
+    job_service: AsyncJobService = Depends(get_job_service),
+    dispatcher: ExecutionDispatcher = Depends(get_dispatcher),
+    event_bus: JobEventBus = Depends(get_job_event_bus),
 ) -> JobResponse:
-    """기존 Job에 대해 코드 실행을 비동기로 트리거합니다."""
+    """기존 Job에 대해 코드 실행을 실행 대기열에 넣습니다."""
     try:
-        job = job_service.get_job(jobId)
+        job = await job_service.get_job(jobId)
         if not job:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Job {jobId} not found",
             )
 
-        job_service.update_job_status(jobId, JobStatus.RUNNING)
-
         execution_request = ExecutionRequest(
             job_id=jobId,
             code_key=job.code_key,
+            code_hash=job.code_hash,
             language=job.language,
             input=input_data,
             timeout=job.timeout_ms,
         )
 
-        # Background task에서 새로운 DB 세션을 사용하므로 의존성 주입 제거
-        background_tasks.add_task(
-            run_execution_and_update_job,
-            jobId,
-            execution_request,
-        )
+        # RUNNING 전환과 대기열 기록을 함께 커밋하므로 재시작 후에도 디스패처가 이어서 실행합니다.
+        if not await dispatcher.submit(job_service.db, execution_request):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Job {jobId} is already running",
+            )
 
-        job = job_service.get_job(jobId) or job
-        return job_service.to_response(job, "Execution started")
+        job = await job_service.get_job(jobId) or job
+        event_bus.publish(_job_status_event(job))
+        return await job_service.to_response(job, "Execution started")
 
     except HTTPException:
         raise
+    except ExecutionQueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Execution queue is full",
+        )
     except Exception:
-        job_service.update_job_status(jobId, JobStatus.FAILED)
+        await job_service.db.rollback()
+        await job_service.update_job_status(jobId, JobStatus.FAILED)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to trigger execution",
@@ -192,34 +357,48 @@ async def execute_code(
 
 @router.get("/projects", response_model=list[ProjectResponse])
 async def list_projects(
-    project_service: ProjectService = Depends(get_project_service),
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
+    project_service: AsyncProjectService = Depends(get_project_service),
 ) -> list[ProjectResponse]:
-    """저장된 모든 프로젝트를 조회합니다."""
+    """프로젝트 목록을 프로젝트 ID 순으로 한 페이지씩 조회합니다.
+
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더에 커서를 담아 반환합니다.
+    """
     try:
-        projects_orm = project_service.get_all_projects()
-        return [project_service._orm_to_dto(p) for p in projects_orm]
+        after_id = decode_project_cursor(cursor) if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    try:
+        projects, next_cursor = await project_service.list_projects(limit=limit, after_id=after_id)
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list projects",
         )
 
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return projects
+
 
 @router.post("/project", response_model=ProjectResponse)
 async def create_project(
     project_name: str,
     description: str = "",
-    project_service: ProjectService = Depends(get_project_service),
+    project_service: AsyncProjectService = Depends(get_project_service),
 ) -> ProjectResponse:
     """새로운 프로젝트를 생성합니다."""
     try:
-        project_orm = project_service.get_or_create_project(project_name, description)
-        if not project_orm:
+        project = await project_service.get_or_create_project(project_name, description)
+        if not project:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Failed to create or retrieve project",
             )
-        return project_service._orm_to_dto(project_orm)
+        return project
     except HTTPException:
         raise
     except Exception:
@@ -232,43 +411,69 @@ async def create_project(
 @router.get("/projects/{project}/jobs", response_model=list[JobResponse])
 async def list_jobs_by_project(
     project: str,
-    limit: int = 100,
-    job_service: JobService = Depends(get_job_service),
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
+    filters: JobListFilter = Depends(get_job_list_filter),
+    job_service: AsyncJobService = Depends(get_job_service),
 ) -> list[JobResponse]:
-    """특정 프로젝트에 속한 Job 목록을 조회합니다."""
+    """특정 프로젝트에 속한 Job 목록을 최신순으로 한 페이지씩 조회합니다.
+
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더에 커서를 담아 반환합니다.
+    """
     try:
-        jobs = job_service.list_jobs_by_project(project, limit=limit)
-        return [job_service.to_response(j) for j in jobs]
+        jobs, next_cursor = await job_service.list_job_responses_by_project(
+            project, limit=limit, cursor=cursor, filters=filters
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list jobs for project",
         )
 
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return jobs
+
 
 @router.get("/jobs", response_model=list[JobResponse])
 async def list_jobs(
-    limit: int = 100,
-    job_service: JobService = Depends(get_job_service),
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = None,
+    filters: JobListFilter = Depends(get_job_list_filter),
+    job_service: AsyncJobService = Depends(get_job_service),
 ) -> list[JobResponse]:
-    """전체 Job 목록을 조회합니다."""
+    """전체 Job 목록을 최신순으로 한 페이지씩 조회합니다.
+
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더에 커서를 담아 반환합니다.
+    """
     try:
-        jobs = job_service.list_jobs(limit=limit)
-        return [job_service.to_response(j) for j in jobs]
+        jobs, next_cursor = await job_service.list_job_responses(
+            limit=limit, cursor=cursor, filters=filters
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list jobs",
         )
 
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return jobs
+
 
 @router.get("/log", response_model=str)
 async def get_log_file(
     log_key: str,
-    s3_service: S3Service = Depends(get_s3_service),
+    s3_service: AsyncS3Service = Depends(get_s3_service),
 ) -> str:
     """S3에 저장된 로그 파일을 조회합니다."""
-    content = s3_service.get_log_file(log_key)
+    content = await s3_service.get_log_file(log_key)
     if content is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -277,13 +482,71 @@ async def get_log_file(
     return content
 
 
+@router.get("/log/cache", response_model=LogCacheStats)
+async def get_log_cache_stats(
+    log_cache: LogObjectCache = Depends(get_log_object_cache),
+) -> LogCacheStats:
+    """로그 객체 캐시의 계층별 크기와 적중/미적중 통계를 조회합니다."""
+    return log_cache.stats()
+
+
+@router.get("/log/stream")
+async def stream_log_file(
+    log_key: str,
+    request: Request,
+    tail: int | None = Query(None, ge=1, le=100000, description="마지막 N줄만 조회"),
+    s3_service: AsyncS3Service = Depends(get_s3_service),
+) -> Response:
+    """S3에 저장된 로그 파일을 청크 단위로 스트리밍합니다.
+
+    `Range` 헤더로 바이트 범위를 지정하면 206으로 해당 범위만 전달하고,
+    `tail`을 지정하면 객체 끝부분만 읽어 마지막 N줄을 반환합니다.
+    gzip으로 저장된 로그는 클라이언트가 gzip을 받을 수 있으면 그대로 전달합니다.
+    """
+    accept_gzip = "gzip" in request.headers.get("accept-encoding", "").lower()
+    try:
+        if tail is not None:
+            content = await s3_service.get_log_tail(log_key, tail)
+            return Response(content=content, media_type="text/plain; charset=utf-8")
+
+        log_stream = await s3_service.open_log_stream(
+            log_key,
+            byte_range=request.headers.get("range"),
+            accept_gzip=accept_gzip,
+        )
+    except LogNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Log file {log_key} not found",
+        )
+    except LogRangeNotSatisfiableError:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail=f"Requested range not satisfiable for {log_key}",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except AWSCallTimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="S3 request timed out",
+        )
+
+    return StreamingResponse(
+        log_stream.body,
+        status_code=status.HTTP_206_PARTIAL_CONTENT if log_stream.partial else status.HTTP_200_OK,
+        media_type=log_stream.media_type,
+        headers=log_stream.headers,
+    )
+
+
 @router.get("/cloudwatch/{clusterName}/metrics", response_model=AvailableMetricsResponse)
-def get_available_ecs_metrics(
+async def get_available_ecs_metrics(
     clusterName: str,
-    resource_service: ResourceService = Depends(get_resource_service),
+    resource_service: AsyncResourceService = Depends(get_resource_service),
 ) -> AvailableMetricsResponse:
     """ECS 클러스터의 사용 가능한 CloudWatch 메트릭 목록을 조회합니다."""
-    metric_names = resource_service.list_cluster_metric_names(clusterName)
+    metric_names = await resource_service.list_cluster_metric_names(clusterName)
 
     if not metric_names:
         raise HTTPException(
@@ -297,16 +560,47 @@ def get_available_ecs_metrics(
     )
 
 
+@router.get("/cloudwatch/{clusterName}/aggregate", response_model=MetricAggregationResponse)
+async def aggregate_ecs_cluster_metrics(
+    clusterName: str,
+    minutes: int = Query(60, ge=1, le=1440),
+    period: int = Query(60, ge=10, description="원본 시계열 주기(초)"),
+    bucket: int = Query(300, ge=10, description="집계 구간 크기(초)"),
+    stats: str = Query("mean,p50,p95,max", description="쉼표로 구분한 통계 (mean, min, max, sum, count, std, rolling_mean, pNN)"),
+    metrics: str = Query("cpu,memory", description="쉼표로 구분한 메트릭 (cpu, memory)"),
+    rolling: int = Query(3, ge=1, le=100, description="rolling_mean 구간 수"),
+    resource_service: AsyncResourceService = Depends(get_resource_service),
+) -> MetricAggregationResponse:
+    """ECS 클러스터의 CPU/메모리 시계열을 구간별로 집계해 여러 통계를 한 번에 반환합니다."""
+    try:
+        return await resource_service.aggregate_cpu_memory_utilization(
+            cluster_name=clusterName,
+            minutes=minutes,
+            period=period,
+            bucket_seconds=bucket,
+            metrics=[m.strip() for m in metrics.split(",") if m.strip()],
+            stats=[s.strip() for s in stats.split(",") if s.strip()],
+            rolling_window=rolling,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except AWSCallTimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="CloudWatch request timed out",
+        )
+
+
 @router.get("/cloudwatch/{clusterName}", response_model=ClusterMetricsResponse)
-def read_ecs_cluster_metrics(
+async def read_ecs_cluster_metrics(
     clusterName: str,
     minutes: int = Query(10, ge=1, le=60),
     period: int = Query(60, ge=10),
-    resource_service: ResourceService = Depends(get_resource_service),
+    resource_service: AsyncResourceService = Depends(get_resource_service),
 ) -> ClusterMetricsResponse:
     """ECS 클러스터의 최근 CPU 및 메모리 사용률 메트릭을 조회합니다."""
     try:
-        points = resource_service.get_recent_cpu_memory_utilization(
+        points = await resource_service.get_recent_cpu_memory_utilization(
             cluster_name=clusterName,
             minutes=minutes,
             period=period,
@@ -325,6 +619,11 @@ def read_ecs_cluster_metrics(
 
     except HTTPException:
         raise
+    except AWSCallTimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="CloudWatch request timed out",
+        )
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -341,10 +640,38 @@ async def health_check() -> dict:
     }
 
 
+@router.get("/admin/profile", response_class=PlainTextResponse)
+async def sample_profile(
+    seconds: float = Query(10.0, gt=0, description="수집 시간(초)"),
+    interval_ms: float = Query(10.0, ge=1, le=1000, description="샘플 간격(밀리초)"),
+    x_profile_token: str | None = Header(None),
+) -> PlainTextResponse:
+    """샘플링 프로파일러를 N초 동안 실행하고 collapsed stack 형식으로 반환합니다.
+
+    결과는 `flamegraph.pl`이나 speedscope에 그대로 넣어 플레임 그래프로 볼 수 있습니다.
+    """
+    if not settings.PROFILING_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiling is disabled")
+    if not profiling_token_valid(x_profile_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid profiling token")
+    if seconds > settings.PROFILING_MAX_SECONDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"seconds must be <= {settings.PROFILING_MAX_SECONDS}",
+        )
+
+    try:
+        stacks = await asyncio.to_thread(sampling_profiler.sample, seconds, interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    return PlainTextResponse(stacks)
+
+
 @router.get("/jobs/{jobId}/status", response_model=JobStatusResponse)
 async def get_job_status(
     jobId: str,
-    job_service: JobService = Depends(get_job_service),
+    job_service: AsyncJobService = Depends(get_job_service),
 ) -> JobStatusResponse:
     """Job의 현재 상태를 조회합니다.
     
@@ -358,34 +685,13 @@ async def get_job_status(
         HTTPException: Job을 찾을 수 없으면 404 반환.
     """
     try:
-        job = job_service.get_job(jobId)
-        if not job:
+        job_status = await job_service.get_job_status(jobId)
+        if not job_status:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Job {jobId} not found",
             )
-        
-        # 최신 execution 정보 조회
-        log_key = None
-        logs_url = None
-        from app.schemas.job import JobORM
-        job_orm = job_service.db.query(JobORM).filter(JobORM.job_id == jobId).first()
-        if job_orm and job_orm.executions:
-            latest_execution = max(job_orm.executions, key=lambda e: e.completed_at)
-            log_key = latest_execution.log_key
-            logs_url = latest_execution.logs_url
-        
-        return JobStatusResponse(
-            job_id=job.job_id,
-            status=job.status,
-            project=job.project,
-            created_at=job.created_at,
-            started_at=job.started_at,
-            completed_at=job.completed_at,
-            timeout_ms=job.timeout_ms,
-            log_key=log_key,
-            logs_url=logs_url,
-        )
+        return job_status
     except HTTPException:
         raise
     except Exception:
@@ -393,3 +699,89 @@ async def get_job_status(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve job status",
         )
+
+
+@router.get("/jobs/{jobId}/events")
+async def stream_job_events(
+    jobId: str,
+    job_service: AsyncJobService = Depends(get_job_service),
+    event_bus: JobEventBus = Depends(get_job_event_bus),
+) -> StreamingResponse:
+    """Job 상태 전이를 Server-Sent Events로 전달합니다.
+
+    현재 상태를 먼저 보내고, 이후 실행 워커가 기록하는 상태 전이와 최종 결과를
+    종료 상태가 될 때까지 전달합니다. 스트림 동안에는 DB를 조회하지 않습니다.
+    """
+    queue = event_bus.subscribe(jobId)
+    try:
+        job = await job_service.get_job(jobId)
+    except Exception:
+        event_bus.unsubscribe(jobId, queue)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve job status",
+        )
+    finally:
+        # 스트림이 끝날 때까지 DB 연결을 붙잡지 않도록 바로 반환합니다.
+        await job_service.db.close()
+
+    if not job:
+        event_bus.unsubscribe(jobId, queue)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {jobId} not found",
+        )
+
+    async def event_source():
+        async for event in event_bus.stream(
+            jobId, queue, _job_status_event(job), settings.JOB_EVENTS_HEARTBEAT_SECONDS
+        ):
+            if event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: status\ndata: {event.model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/jobs/{jobId}/ws")
+async def job_events_websocket(
+    websocket: WebSocket,
+    jobId: str,
+    job_service: AsyncJobService = Depends(get_job_service),
+    event_bus: JobEventBus = Depends(get_job_event_bus),
+) -> None:
+    """Job 상태 전이를 WebSocket으로 전달합니다.
+
+    메시지 형식은 SSE의 `data`와 같은 `JobStatusEvent` JSON이며,
+    종료 상태를 보낸 뒤 서버가 연결을 닫습니다.
+    """
+    queue = event_bus.subscribe(jobId)
+    try:
+        job = await job_service.get_job(jobId)
+    except Exception:
+        job = None
+    finally:
+        await job_service.db.close()
+
+    if not job:
+        event_bus.unsubscribe(jobId, queue)
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    try:
+        async for event in event_bus.stream(
+            jobId, queue, _job_status_event(job), settings.JOB_EVENTS_HEARTBEAT_SECONDS
+        ):
+            if event is None:
+                await websocket.send_json({"type": "heartbeat"})
+            else:
+                await websocket.send_text(event.model_dump_json())
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
@@ -0,0 +1,111 @@
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple
+
+from config.settings import settings
+
+if TYPE_CHECKING:
+    import boto3
+    from botocore.config import Config
+
+
+class AWSClientRegistry:
+    """프로세스 전체에서 공유하는 boto3 클라이언트 레지스트리입니다.
+
+    boto3 클라이언트는 생성 비용이 크지만 생성된 뒤에는 스레드 간에 공유해도
+    안전하므로, 서비스와 리전별로 하나만 만들어 재사용합니다. 생성은 하나의
+    `boto3.session.Session`에서 잠금을 잡고 수행하며, 연결 풀 크기와 재시도,
+    타임아웃은 botocore `Config`로 한 곳에서 정합니다. boto3는 가져오는 데만
+    수백 밀리초가 걸리므로 첫 클라이언트를 만들 때 가져옵니다.
+    """
+
+    def __init__(self, config: Optional["Config"] = None) -> None:
+        """공통 botocore 설정을 초기화합니다. 없으면 첫 클라이언트 생성 시 만듭니다."""
+        self._config = config
+        self._session: Optional["boto3.session.Session"] = None
+        self._clients: Dict[Tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+
+    def client(self, service_name: str, region_name: str) -> Any:
+        """서비스와 리전에 해당하는 공유 클라이언트를 반환합니다. 없으면 생성합니다.
+
+        Args:
+            service_name: AWS 서비스 이름 (예: `s3`, `cloudwatch`).
+            region_name: 리전 이름.
+
+        Returns:
+            boto3 클라이언트.
+        """
+        key = (service_name, region_name)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                # app.services는 이 모듈을 간접적으로 가져오므로 순환 import를 피해 여기서 가져옵니다.
+                from app.services.telemetry import instrument_boto3_client
+
+                client = self._get_session().client(
+                    service_name,
+                    region_name=region_name,
+                    config=self._get_config(),
+                )
+                instrument_boto3_client(client)
+                self._clients[key] = client
+            return client
+
+    def warmup(self, specs: Optional[Iterable[Tuple[str, str]]] = None) -> None:
+        """클라이언트를 미리 생성합니다. 없으면 애플리케이션이 쓰는 클라이언트를 만듭니다."""
+        if specs is None:
+            specs = [
+                ("s3", settings.AWS_CODE_REGION),
+                ("s3", settings.AWS_LOG_REGION),
+                ("cloudwatch", settings.AWS_REGION),
+            ]
+        for service_name, region_name in specs:
+            self.client(service_name, region_name)
+
+    def close(self) -> None:
+        """생성된 클라이언트의 연결 풀을 닫고 레지스트리를 비웁니다."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._session = None
+        for client in clients:
+            client.close()
+
+    def _get_config(self) -> "Config":
+        """설정값으로 botocore `Config`를 만듭니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        if self._config is None:
+            from botocore.config import Config
+
+            self._config = Config(
+                max_pool_connections=settings.AWS_MAX_POOL_CONNECTIONS,
+                connect_timeout=settings.AWS_CONNECT_TIMEOUT_SECONDS,
+                read_timeout=settings.AWS_READ_TIMEOUT_SECONDS,
+                retries={
+                    "max_attempts": settings.AWS_MAX_ATTEMPTS,
+                    "mode": settings.AWS_RETRY_MODE,
+                },
+            )
+        return self._config
+
+    def _get_session(self) -> "boto3.session.Session":
+        """자격 증명 설정으로 boto3 세션을 만듭니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        if self._session is None:
+            import boto3
+
+            session_kwargs: Dict[str, Any] = {}
+            if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
+                session_kwargs.update(
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                )
+            if settings.AWS_SESSION_TOKEN:
+                session_kwargs["aws_session_token"] = settings.AWS_SESSION_TOKEN
+            self._session = boto3.session.Session(**session_kwargs)
+        return self._session
+
+
+aws_clients = AWSClientRegistry()
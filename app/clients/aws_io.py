@@ -0,0 +1,174 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from app.clients.cloudwatch import CloudWatchClient
+from app.clients.s3 import CodeS3Client, LogS3Client
+from config.settings import settings
+
+T = TypeVar("T")
+
+
+class AWSCallTimeoutError(Exception):
+    """AWS 호출이 제한 시간 안에 끝나지 않았을 때 발생합니다."""
+
+
+class AWSExecutor:
+    """blocking boto3 호출을 전용 스레드 풀에서 실행하는 실행기입니다.
+
+    동시에 대기하거나 실행 중인 호출 수를 제한하고, 호출마다 제한 시간을 둡니다.
+    호출이 취소되거나 시간이 초과되면 아직 시작하지 않은 작업은 실행되지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """스레드 수와 대기 한도, 기본 제한 시간을 초기화합니다."""
+        self.max_workers = max_workers or settings.AWS_IO_MAX_WORKERS
+        self.max_pending = max_pending or settings.AWS_IO_MAX_PENDING
+        self.timeout = timeout or settings.AWS_IO_TIMEOUT_SECONDS
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = asyncio.Semaphore(self.max_pending)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """스레드 풀을 필요할 때 생성합니다."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="aws-io",
+            )
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> T:
+        """함수를 스레드 풀에서 실행하고 결과를 기다립니다.
+
+        Args:
+            fn: 실행할 blocking 함수.
+            *args: 함수 인자.
+            timeout: 제한 시간(초). 없으면 기본값을 사용합니다.
+            **kwargs: 함수 키워드 인자.
+
+        Returns:
+            함수의 반환값.
+
+        Raises:
+            AWSCallTimeoutError: 제한 시간 안에 끝나지 않은 경우.
+        """
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, functools.partial(fn, *args, **kwargs))
+            try:
+                return await asyncio.wait_for(future, timeout or self.timeout)
+            except asyncio.TimeoutError:
+                raise AWSCallTimeoutError(f"AWS call {getattr(fn, '__name__', fn)} timed out")
+
+    def shutdown(self) -> None:
+        """대기 중인 작업을 취소하고 스레드 풀을 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+aws_executor = AWSExecutor()
+
+
+class AsyncCodeS3Client:
+    """`CodeS3Client`를 AWS 실행기에서 호출하는 비동기 래퍼입니다."""
+
+    def __init__(self, client: Optional[CodeS3Client] = None, executor: Optional[AWSExecutor] = None) -> None:
+        self.client = client or CodeS3Client()
+        self.executor = executor or aws_executor
+
+    async def upload_code(self, project: str, code: str, language: str) -> str:
+        """소스 코드를 코드 버킷에 업로드하고 객체 키를 반환합니다."""
+        return await self.executor.run(self.client.upload_code, project, code, language)
+
+
+class AsyncLogS3Client:
+    """`LogS3Client`를 AWS 실행기에서 호출하는 비동기 래퍼입니다."""
+
+    def __init__(self, client: Optional[LogS3Client] = None, executor: Optional[AWSExecutor] = None) -> None:
+        self.client = client or LogS3Client()
+        self.executor = executor or aws_executor
+
+    async def get_log(self, key: str) -> str | None:
+        """로그 버킷에서 지정한 키의 로그 파일을 조회합니다."""
+        return await self.executor.run(self.client.get_log, key)
+
+    async def put_log(self, key: str, body: Any, content_type: str = "text/plain; charset=utf-8") -> None:
+        """파일 객체의 내용을 로그 버킷에 업로드합니다."""
+        await self.executor.run(self.client.put_log, key, body, content_type)
+
+    async def open_log(self, key: str, byte_range: Optional[str] = None) -> Dict[str, Any]:
+        """로그 객체를 열어 본문 스트림과 메타데이터를 반환합니다."""
+        return await self.executor.run(self.client.open_log, key, byte_range)
+
+    async def get_log_tail(self, key: str, lines: int) -> Tuple[bytes, Dict[str, Any]]:
+        """로그 객체의 마지막 N줄을 반환합니다."""
+        return await self.executor.run(self.client.get_log_tail, key, lines)
+
+    async def iter_body(self, body: Any, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """`StreamingBody`를 청크 단위로 읽어 비동기로 내보냅니다.
+
+        청크마다 한 번씩 실행기에서 읽으므로 큰 객체도 메모리에 한꺼번에 올리지
+        않으며, 소비가 끝나거나 중단되면 본문을 닫습니다.
+        """
+        chunk_size = chunk_size or settings.LOG_STREAM_CHUNK_BYTES
+        try:
+            while True:
+                chunk = await self.executor.run(body.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
+
+
+class AsyncCloudWatchClient:
+    """`CloudWatchClient`를 AWS 실행기에서 호출하는 비동기 래퍼입니다."""
+
+    def __init__(self, client: Optional[CloudWatchClient] = None, executor: Optional[AWSExecutor] = None) -> None:
+        self.client = client or CloudWatchClient()
+        self.executor = executor or aws_executor
+
+    async def list_cluster_metric_names(self, cluster_name: str) -> List[str]:
+        """특정 ECS 클러스터에서 사용 가능한 CloudWatch 메트릭 이름 목록을 조회합니다."""
+        return await self.executor.run(self.client.list_cluster_metric_names, cluster_name)
+
+    async def get_cpu_memory_timeseries(
+        self,
+        cluster_name: str,
+        minutes: int = 10,
+        period: int = 60,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """CPU/Memory Utilization 시계열 RAW 데이터를 그대로 반환합니다."""
+        return await self.executor.run(
+            self.client.get_cpu_memory_timeseries,
+            cluster_name=cluster_name,
+            minutes=minutes,
+            period=period,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    async def get_latest_cpu_memory_snapshot(
+        self,
+        cluster_name: str,
+        minutes: int = 5,
+        period: int = 60,
+    ) -> Dict[str, float | None]:
+        """최근 N분 동안의 메트릭에서 가장 최신 CPU/Memory 값만 요약해서 반환합니다."""
+        return await self.executor.run(
+            self.client.get_latest_cpu_memory_snapshot,
+            cluster_name=cluster_name,
+            minutes=minutes,
+            period=period,
+        )
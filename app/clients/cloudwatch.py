@@ -1,29 +1,15 @@
-import boto3
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+from app.clients.aws import aws_clients
 from config.settings import settings
 
 
 class CloudWatchClient:
     """ECS 관련 CloudWatch 메트릭을 조회하기 위한 저수준 클라이언트입니다."""
 
-    def __init__(self, region_name: str | None = None) -> None:
-        if region_name is None:
-            region_name = getattr(settings, "AWS_REGION", "ap-northeast-2")
-
-        client_kwargs: Dict[str, Any] = {
-            "region_name": region_name,
-        }
-
-        if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
-            client_kwargs.update(
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            )
-        if settings.AWS_SESSION_TOKEN:
-            client_kwargs["aws_session_token"] = settings.AWS_SESSION_TOKEN
-
-        self.client = boto3.client("cloudwatch", **client_kwargs)
+    def __init__(self, region_name: str | None = None, client: Any = None) -> None:
+        """공유 CloudWatch 클라이언트를 사용합니다. 테스트 등에서는 직접 주입할 수 있습니다."""
+        self.client = client or aws_clients.client("cloudwatch", region_name or settings.AWS_REGION)
 
     def list_cluster_metric_names(self, cluster_name: str) -> List[str]:
         """특정 ECS 클러스터에서 사용 가능한 CloudWatch 메트릭 이름 목록을 조회합니다."""
@@ -43,10 +29,15 @@ class CloudWatchClient:
         cluster_name: str,
         minutes: int = 10,
         period: int = 60,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
     ) -> Dict[str, Any]:
-        """CPU/Memory Utilization 시계열 RAW 데이터를 그대로 반환합니다."""
-        end_time = datetime.now(timezone.utc)
-        start_time = end_time - timedelta(minutes=minutes)
+        """CPU/Memory Utilization 시계열 RAW 데이터를 그대로 반환합니다.
+
+        `start_time`/`end_time`을 주면 최근 N분 대신 그 구간만 조회합니다.
+        """
+        end_time = end_time or datetime.now(timezone.utc)
+        start_time = start_time or end_time - timedelta(minutes=minutes)
 
         resp = self.client.get_metric_data(
             MetricDataQueries=[
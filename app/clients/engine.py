@@ -0,0 +1,136 @@
+import asyncio
+import importlib.util
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from config.settings import settings
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class EngineHTTPClientPool:
+    """Execution Engine 호출에 사용하는 앱 수명 단위의 HTTP 클라이언트 풀입니다.
+
+    언어별 실행 엔드포인트마다 keep-alive 연결을 재사용하는 `httpx.AsyncClient`를
+    하나씩 두고, 취소 등 공통 엔드포인트는 `default` 클라이언트를 사용합니다.
+    클라이언트는 처음 요청될 때 생성되며 `aclose()`로 한꺼번에 닫습니다.
+    """
+
+    DEFAULT = "default"
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        max_connections: Optional[Dict[str, int]] = None,
+        max_keepalive: Optional[Dict[str, int]] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ) -> None:
+        """풀 설정을 초기화합니다."""
+        self.timeout = timeout or settings.EXECUTION_ENGINE_TIMEOUT / 1000
+        self.max_connections = dict(max_connections or settings.EXECUTION_ENGINE_MAX_CONNECTIONS)
+        self.max_keepalive = dict(max_keepalive or settings.EXECUTION_ENGINE_MAX_KEEPALIVE)
+        self.keepalive_expiry = keepalive_expiry or settings.EXECUTION_ENGINE_KEEPALIVE_EXPIRY
+        if http2 is None:
+            http2 = settings.EXECUTION_ENGINE_HTTP2
+        # h2 패키지가 없으면 HTTP/1.1로 동작합니다.
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._clients: Dict[str, "httpx.AsyncClient"] = {}
+        self._requests: Dict[str, int] = {}
+        self._in_flight: Dict[str, int] = {}
+
+    def client(self, key: str = DEFAULT) -> "httpx.AsyncClient":
+        """언어(또는 `default`)에 해당하는 공유 클라이언트를 반환합니다."""
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = self._create_client(key)
+            self._clients[key] = client
+        return client
+
+    async def request(self, key: str, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """공유 클라이언트로 요청을 보내고 요청 수를 집계합니다.
+
+        Args:
+            key: 언어 이름 또는 `default`.
+            method: HTTP 메서드.
+            url: 요청 URL.
+            **kwargs: `httpx.AsyncClient.request`에 전달할 인자.
+
+        Returns:
+            HTTP 응답.
+        """
+        client = self.client(key)
+        self._requests[key] = self._requests.get(key, 0) + 1
+        self._in_flight[key] = self._in_flight.get(key, 0) + 1
+        try:
+            return await client.request(method, url, **kwargs)
+        finally:
+            self._in_flight[key] -= 1
+
+    async def warmup(self, keys: list[str], connect_urls: Optional[Dict[str, str]] = None) -> None:
+        """지정한 키의 클라이언트를 미리 생성합니다.
+
+        `connect_urls`(키 → URL)를 주면 키마다 `HEAD` 요청을 동시에 보내 keep-alive
+        연결까지 맺어 두므로 첫 실행 요청이 TCP/TLS 연결 비용을 치르지 않습니다.
+        """
+        for key in keys:
+            self.client(key)
+        if connect_urls:
+            await asyncio.gather(*(self._connect(key, url) for key, url in connect_urls.items()))
+
+    async def _connect(self, key: str, url: str) -> None:
+        """연결을 맺기 위한 요청을 보냅니다. 응답 코드나 실패는 무시합니다."""
+        try:
+            await self.client(key).head(url, timeout=min(self.timeout, 3.0))
+        except Exception:
+            # 엔진이 아직 준비되지 않았어도 기동은 계속하고, 연결은 첫 요청 때 맺습니다.
+            pass
+
+    async def aclose(self) -> None:
+        """모든 클라이언트의 연결을 닫습니다."""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients = {}
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """클라이언트별 연결 풀 상태를 반환합니다."""
+        result: Dict[str, Dict[str, Any]] = {}
+        for key, client in self._clients.items():
+            connections = self._pool_connections(client)
+            result[key] = {
+                "max_connections": self._limit(self.max_connections, key),
+                "max_keepalive": self._limit(self.max_keepalive, key),
+                "http2": self.http2,
+                "requests_total": self._requests.get(key, 0),
+                "in_flight": self._in_flight.get(key, 0),
+                "open_connections": len(connections) if connections is not None else None,
+                "idle_connections": (
+                    sum(1 for c in connections if c.is_idle()) if connections is not None else None
+                ),
+            }
+        return result
+
+    def _create_client(self, key: str) -> "httpx.AsyncClient":
+        """설정된 한도로 새 클라이언트를 생성합니다."""
+        import httpx
+
+        limits = httpx.Limits(
+            max_connections=self._limit(self.max_connections, key),
+            max_keepalive_connections=self._limit(self.max_keepalive, key),
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        return httpx.AsyncClient(timeout=self.timeout, limits=limits, http2=self.http2)
+
+    def _limit(self, limits: Dict[str, int], key: str) -> int:
+        """키별 한도가 없으면 `default` 한도를 사용합니다."""
+        return limits.get(key, limits.get(self.DEFAULT, 10))
+
+    @staticmethod
+    def _pool_connections(client: "httpx.AsyncClient") -> Optional[list]:
+        """httpcore 연결 풀의 연결 목록을 반환합니다. 확인할 수 없으면 None."""
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        return list(connections) if connections is not None else None
+
+
+engine_http_pool = EngineHTTPClientPool()
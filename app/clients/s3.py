@@ -1,66 +1,115 @@
-﻿import boto3
-import uuid as uuid_lib
+﻿from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Optional, Tuple
+import hashlib
+import threading
+from collections import OrderedDict
+from app.clients.aws import aws_clients
 from config.settings import settings
 
+if TYPE_CHECKING:
+    from botocore.exceptions import ClientError
+
+
+CODE_FILE_POSTFIX = {
+    "python": ".py",
+    "node": ".js",
+    "java": ".java",
+}
+
+
+class LogNotFoundError(Exception):
+    """요청한 로그 객체가 버킷에 없을 때 발생합니다."""
+
+
+class LogRangeNotSatisfiableError(Exception):
+    """요청한 바이트 범위가 로그 객체 크기를 벗어날 때 발생합니다."""
+
 
 class CodeS3Client:
     """사용자 코드를 위한 S3 클라이언트입니다.
 
     코드 객체는 `AWS_CODE_REGION` / `AWS_CODE_BUCKET` 설정을 사용합니다.
+    객체 키는 코드 내용의 SHA-256 해시로 정해지므로 같은 코드는 하나의 객체를 공유합니다.
     """
 
-    def __init__(self) -> None:
-        client_kwargs = {
-            "region_name": settings.AWS_CODE_REGION,
-        }
-        if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
-            client_kwargs.update(
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            )
-        if settings.AWS_SESSION_TOKEN:
-            client_kwargs["aws_session_token"] = settings.AWS_SESSION_TOKEN
+    # 이미 버킷에 있는 것으로 확인된 키 (프로세스 전체에서 공유)
+    _known_keys: "OrderedDict[str, None]" = OrderedDict()
+    _known_keys_lock = threading.Lock()
 
-        self.s3_client = boto3.client("s3", **client_kwargs)
+    def __init__(self, s3_client: Any = None) -> None:
+        """공유 S3 클라이언트를 사용합니다. 테스트 등에서는 직접 주입할 수 있습니다."""
+        self.s3_client = s3_client or aws_clients.client("s3", settings.AWS_CODE_REGION)
         self.bucket_name = settings.AWS_CODE_BUCKET
 
     def upload_code(self, project: str, code: str, language: str) -> str:
         """소스 코드를 코드 버킷에 업로드하고 객체 키를 반환합니다.
 
+        키는 `{language}/{sha256}{postfix}` 형식이며, 같은 내용의 객체가 이미 있으면
+        업로드를 건너뜁니다. 존재 여부는 먼저 로컬 인덱스에서 확인하고, 없으면
+        `head_object`로 확인합니다.
+
         Args:
-            project: 프로젝트 이름.
+            project: 프로젝트 이름 (객체 메타데이터에만 기록됩니다).
             code: 업로드할 소스 코드 문자열.
             language: 프로그래밍 언어 이름.
 
         Returns:
-            생성된 S3 객체 키.
+            코드 내용에 해당하는 S3 객체 키.
 
         Raises:
             Exception: 업로드 실패 시 예외를 발생합니다.
         """
         try:
-            filename = f"{uuid_lib.uuid4()}"
-            postfix = {
-                "python": ".py",
-                "node": ".js",
-                "java": ".java"
-            }[language.lower()]
+            body = code.encode("utf-8")
+            postfix = CODE_FILE_POSTFIX[language.lower()]
+            s3_key = f"{language.lower()}/{hashlib.sha256(body).hexdigest()}{postfix}"
 
-            s3_key = f"{project}/{language.lower()}/{filename}{postfix}"
+            if self._is_known(s3_key) or self._object_exists(s3_key):
+                self._remember(s3_key)
+                return s3_key
 
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=s3_key,
-                Body=code.encode("utf-8"),
+                Body=body,
                 ContentType="text/plain",
-                Metadata={"language": language},
+                Metadata={"language": language, "project": project},
             )
+            self._remember(s3_key)
 
             return s3_key
 
         except Exception as e:
             raise Exception(f"S3 upload failed: {str(e)}")
 
+    def _object_exists(self, key: str) -> bool:
+        """버킷에 객체가 있는지 확인합니다. 확인할 수 없으면 False를 반환합니다."""
+        # botocore는 클라이언트를 만들 때 로드되므로 앱 import 시점에는 불러오지 않습니다.
+        from botocore.exceptions import ClientError
+
+        try:
+            self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+            return True
+        except ClientError:
+            return False
+
+    @classmethod
+    def _is_known(cls, key: str) -> bool:
+        """로컬 인덱스에 있는 키인지 확인합니다."""
+        with cls._known_keys_lock:
+            if key in cls._known_keys:
+                cls._known_keys.move_to_end(key)
+                return True
+            return False
+
+    @classmethod
+    def _remember(cls, key: str) -> None:
+        """키를 로컬 인덱스에 기록하고 한도를 넘으면 오래된 키를 제거합니다."""
+        with cls._known_keys_lock:
+            cls._known_keys[key] = None
+            cls._known_keys.move_to_end(key)
+            while len(cls._known_keys) > settings.AWS_CODE_KNOWN_KEYS_MAX:
+                cls._known_keys.popitem(last=False)
+
 
 class LogS3Client:
     """실행 로그를 위한 S3 클라이언트입니다.
@@ -68,21 +117,28 @@ class LogS3Client:
     로그 객체는 `AWS_LOG_REGION` / `AWS_LOG_BUCKET` 설정을 사용합니다.
     """
 
-    def __init__(self) -> None:
-        client_kwargs = {
-            "region_name": settings.AWS_LOG_REGION,
-        }
-        if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
-            client_kwargs.update(
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            )
-        if settings.AWS_SESSION_TOKEN:
-            client_kwargs["aws_session_token"] = settings.AWS_SESSION_TOKEN
-
-        self.s3_client = boto3.client("s3", **client_kwargs)
+    def __init__(self, s3_client: Any = None) -> None:
+        """공유 S3 클라이언트를 사용합니다. 테스트 등에서는 직접 주입할 수 있습니다."""
+        self.s3_client = s3_client or aws_clients.client("s3", settings.AWS_LOG_REGION)
         self.bucket_name = settings.AWS_LOG_BUCKET
 
+    def put_log(self, key: str, body: BinaryIO, content_type: str = "text/plain; charset=utf-8") -> None:
+        """파일 객체의 내용을 로그 버킷에 스트리밍 업로드합니다.
+
+        큰 본문은 멀티파트 업로드로 나누어 전송됩니다.
+
+        Args:
+            key: 저장할 S3 객체 키.
+            body: 업로드할 바이너리 파일 객체.
+            content_type: 객체 Content-Type.
+        """
+        self.s3_client.upload_fileobj(
+            body,
+            self.bucket_name,
+            key,
+            ExtraArgs={"ContentType": content_type},
+        )
+
     def get_log(self, key: str) -> str | None:
         """로그 버킷에서 지정한 키의 로그 파일을 조회합니다.
 
@@ -97,3 +153,104 @@ class LogS3Client:
             return response["Body"].read().decode("utf-8")
         except Exception:
             return None
+
+    def open_log(self, key: str, byte_range: Optional[str] = None) -> Dict[str, Any]:
+        """로그 객체를 열어 본문 스트림과 메타데이터를 반환합니다.
+
+        본문은 읽지 않은 `StreamingBody` 그대로 반환되므로 호출자가 청크 단위로
+        읽고 닫아야 합니다. 저장된 객체가 gzip이면 압축된 바이트가 그대로 전달됩니다.
+
+        Args:
+            key: 조회할 로그 파일의 S3 객체 키.
+            byte_range: HTTP Range 헤더 값 (예: `bytes=0-1023`). 없으면 전체.
+
+        Returns:
+            `get_object` 응답 딕셔너리.
+
+        Raises:
+            LogNotFoundError: 객체가 없는 경우.
+            LogRangeNotSatisfiableError: 범위가 객체 크기를 벗어난 경우.
+        """
+        from botocore.exceptions import ClientError
+
+        kwargs: Dict[str, Any] = {"Bucket": self.bucket_name, "Key": key}
+        if byte_range:
+            kwargs["Range"] = byte_range
+        try:
+            return self.s3_client.get_object(**kwargs)
+        except ClientError as e:
+            self._raise_for_error(e, key)
+            raise
+
+    def get_log_tail(
+        self,
+        key: str,
+        lines: int,
+        initial_bytes: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        """로그 객체의 마지막 N줄을 객체 끝부분만 읽어 반환합니다.
+
+        끝에서 `initial_bytes`만큼 읽고, 줄 수가 모자라면 읽는 범위를 두 배씩
+        늘립니다. 범위는 `max_bytes`를 넘지 않으므로 그 이상 긴 줄은 잘릴 수 있습니다.
+
+        Args:
+            key: 조회할 로그 파일의 S3 객체 키.
+            lines: 반환할 줄 수.
+            initial_bytes: 처음 읽을 바이트 수.
+            max_bytes: 최대로 읽을 바이트 수.
+
+        Returns:
+            마지막 N줄의 바이트와 `head_object` 메타데이터.
+
+        Raises:
+            LogNotFoundError: 객체가 없는 경우.
+            ValueError: gzip으로 저장된 객체인 경우.
+        """
+        initial_bytes = initial_bytes or settings.LOG_TAIL_INITIAL_BYTES
+        max_bytes = max_bytes or settings.LOG_TAIL_MAX_BYTES
+
+        from botocore.exceptions import ClientError
+
+        try:
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            self._raise_for_error(e, key)
+            raise
+        if head.get("ContentEncoding") == "gzip":
+            raise ValueError("tail is not supported for gzip-encoded logs")
+
+        size = head["ContentLength"]
+        if size == 0:
+            return b"", head
+
+        window = min(initial_bytes, size, max_bytes)
+        while True:
+            start = size - window
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Range=f"bytes={start}-{size - 1}",
+            )
+            data = response["Body"].read()
+            body = data[:-1] if data.endswith(b"\n") else data
+            if start == 0 or body.count(b"\n") >= lines or window >= max_bytes:
+                break
+            window = min(window * 2, size, max_bytes)
+
+        # 뒤에서부터 줄바꿈을 N번 찾아 그 다음 위치부터 잘라냅니다.
+        cut = len(body)
+        for _ in range(lines):
+            cut = body.rfind(b"\n", 0, cut)
+            if cut == -1:
+                return data, head
+        return data[cut + 1:], head
+
+    @staticmethod
+    def _raise_for_error(error: "ClientError", key: str) -> None:
+        """S3 오류 코드를 로그 조회 예외로 변환합니다."""
+        code = error.response.get("Error", {}).get("Code")
+        if code in ("NoSuchKey", "404", "NotFound"):
+            raise LogNotFoundError(key) from error
+        if code == "InvalidRange":
+            raise LogRangeNotSatisfiableError(key) from error
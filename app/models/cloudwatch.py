@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 
 
@@ -17,3 +17,18 @@ class ClusterMetricsResponse(BaseModel):
 class AvailableMetricsResponse(BaseModel):
     cluster_name: str
     metric_names: List[str]
+
+
+class MetricAggregationBucket(BaseModel):
+    timestamp: datetime
+    # 메트릭 이름 → 통계 이름 → 값
+    values: Dict[str, Dict[str, Optional[float]]]
+
+
+class MetricAggregationResponse(BaseModel):
+    cluster_name: str
+    source_period: int
+    bucket_seconds: int
+    metrics: List[str]
+    stats: List[str]
+    buckets: List[MetricAggregationBucket]
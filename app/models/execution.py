@@ -1,13 +1,16 @@
 ﻿from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 
+from app.models.job import JobStatus
+
 
 class ExecutionRequest(BaseModel):
     """Execution Engine으로 전달하는 실행 요청 스키마입니다."""
 
     job_id: str = Field(..., description="고유 Job ID")
     code_key: str = Field(..., description="실행할 S3 코드 키")
+    code_hash: Optional[str] = Field(None, description="코드 내용 SHA-256 해시")
     language: str = Field(..., description="프로그래밍 언어")
     input: Optional[str] = Field("", description="코드 입력 데이터")
     timeout: int = Field(default=5000, description="타임아웃(밀리초)")
@@ -17,13 +20,99 @@ class ExecutionRequest(BaseModel):
             "example": {
                 "job_id": "abcd-1234",
                 "language": "python",
-                "code_key": "python/550e8400-e29b-41d4-a716-446655440000",
+                "code_key": "python/2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824.py",
                 "input": "",
                 "timeout": 5000,
             }
         }
 
 
+class BatchExecutionItem(BaseModel):
+    """일괄 실행 요청에 포함되는 개별 Job 항목입니다."""
+
+    job_id: str = Field(..., description="실행할 Job ID")
+    input: Optional[str] = Field("", description="코드 입력 데이터")
+
+
+class BatchExecutionRequest(BaseModel):
+    """여러 Job을 한 번에 실행하는 요청 스키마입니다."""
+
+    jobs: List[BatchExecutionItem] = Field(..., min_length=1, description="실행할 Job 목록")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "jobs": [
+                    {"job_id": "abcd-1234", "input": ""},
+                    {"job_id": "efgh-5678", "input": "3 4"},
+                ]
+            }
+        }
+
+
+class BatchExecutionItemResult(BaseModel):
+    """일괄 실행 요청에서 개별 Job의 접수 결과입니다."""
+
+    job_id: str = Field(..., description="Job ID")
+    accepted: bool = Field(..., description="실행 대기열 접수 여부")
+    status: Optional[JobStatus] = Field(None, description="접수 후 Job 상태")
+    message: str = Field(..., description="상태 메시지")
+
+
+class BatchExecutionResponse(BaseModel):
+    """일괄 실행 응답 스키마입니다."""
+
+    accepted: int = Field(..., description="접수된 Job 수")
+    rejected: int = Field(..., description="거부된 Job 수")
+    results: List[BatchExecutionItemResult] = Field(..., description="Job별 접수 결과")
+
+
+class LanguageQueueStats(BaseModel):
+    """언어별 실행 대기열 상태입니다."""
+
+    concurrency: int = Field(..., description="동시 실행 한도")
+    queued: int = Field(..., description="대기 중인 Job 수")
+    in_flight: int = Field(..., description="실행 중인 Job 수")
+
+
+class ExecutionQueueStats(BaseModel):
+    """실행 디스패처의 대기열 깊이와 대기 시간 통계입니다."""
+
+    queued: int = Field(..., description="전체 대기 중인 Job 수")
+    in_flight: int = Field(..., description="전체 실행 중인 Job 수")
+    max_queue_size: int = Field(..., description="대기열 최대 크기")
+    languages: dict[str, LanguageQueueStats] = Field(default_factory=dict, description="언어별 상태")
+    wait_avg_ms: Optional[float] = Field(None, description="최근 대기 시간 평균(ms)")
+    wait_p95_ms: Optional[float] = Field(None, description="최근 대기 시간 p95(ms)")
+    wait_max_ms: Optional[float] = Field(None, description="최근 대기 시간 최댓값(ms)")
+
+
+class EngineConnectionPoolStats(BaseModel):
+    """Execution Engine HTTP 클라이언트의 연결 풀 상태입니다."""
+
+    max_connections: int = Field(..., description="최대 연결 수")
+    max_keepalive: int = Field(..., description="최대 keep-alive 연결 수")
+    http2: bool = Field(..., description="HTTP/2 사용 여부")
+    requests_total: int = Field(..., description="누적 요청 수")
+    in_flight: int = Field(..., description="진행 중인 요청 수")
+    open_connections: Optional[int] = Field(None, description="열린 연결 수")
+    idle_connections: Optional[int] = Field(None, description="유휴 연결 수")
+
+
+class ExecutionResultCacheStats(BaseModel):
+    """실행 결과 캐시 상태입니다."""
+
+    enabled: bool = Field(..., description="캐시 사용 여부")
+    entries: int = Field(..., description="저장된 항목 수")
+    size_bytes: int = Field(..., description="저장된 결과의 추정 크기(byte)")
+    max_entries: int = Field(..., description="최대 항목 수")
+    max_bytes: int = Field(..., description="최대 크기(byte)")
+    ttl_seconds: float = Field(..., description="항목 유효 시간(초)")
+    hits: int = Field(..., description="적중 횟수")
+    misses: int = Field(..., description="미적중 횟수")
+    evictions: int = Field(..., description="제거 횟수")
+
+
 class ResourceMetrics(BaseModel):
     """실행 시 리소스 사용량 메트릭입니다."""
 
@@ -39,11 +128,16 @@ class ExecutionResult(BaseModel):
     status: str = Field(..., description="실행 상태")
     stdout: str = Field(default="", description="표준 출력")
     stderr: str = Field(default="", description="표준 에러")
+    stdout_key: Optional[str] = Field(None, description="잘린 표준 출력 전체가 저장된 S3 키")
+    stdout_bytes: Optional[int] = Field(None, description="표준 출력 전체 길이(byte)")
+    stderr_key: Optional[str] = Field(None, description="잘린 표준 에러 전체가 저장된 S3 키")
+    stderr_bytes: Optional[int] = Field(None, description="표준 에러 전체 길이(byte)")
     resource: Optional[ResourceMetrics] = Field(None, description="리소스 사용량")
     code_key: Optional[str] = Field(None, description="실행한 코드 S3 키")
     log_key: Optional[str] = Field(None, description="로그 파일 식별자")
     logs_url: Optional[str] = Field(None, description="실행 로그 S3 URL")
     error_message: Optional[str] = Field(None, description="실패 시 에러 메시지")
+    cached: bool = Field(default=False, description="결과 캐시 적중 여부")
     completed_at: datetime = Field(default_factory=datetime.utcnow, description="완료 시각")
     
     class Config:
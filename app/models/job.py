@@ -1,7 +1,7 @@
 ﻿from pydantic import BaseModel, Field
 from enum import Enum
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, FrozenSet
 import uuid
 
 
@@ -16,12 +16,39 @@ class JobStatus(str, Enum):
     CANCELLED = "CANCELLED"
 
 
+TERMINAL_JOB_STATUSES = frozenset({
+    JobStatus.SUCCESS,
+    JobStatus.FAILED,
+    JobStatus.TIMEOUT,
+    JobStatus.CANCELLED,
+})
+
+
+# 상태별로 전이할 수 있는 다음 상태 (종료된 Job은 다시 실행할 수 있습니다)
+JOB_STATUS_TRANSITIONS: Dict[JobStatus, FrozenSet[JobStatus]] = {
+    JobStatus.PENDING: frozenset({JobStatus.RUNNING, JobStatus.FAILED, JobStatus.CANCELLED}),
+    JobStatus.RUNNING: TERMINAL_JOB_STATUSES,
+    JobStatus.SUCCESS: frozenset({JobStatus.RUNNING}),
+    JobStatus.FAILED: frozenset({JobStatus.RUNNING}),
+    JobStatus.TIMEOUT: frozenset({JobStatus.RUNNING}),
+    JobStatus.CANCELLED: frozenset({JobStatus.RUNNING}),
+}
+
+
+def job_status_sources(status: JobStatus) -> FrozenSet[JobStatus]:
+    """지정한 상태로 전이할 수 있는 이전 상태 집합을 반환합니다."""
+    return frozenset(
+        source for source, targets in JOB_STATUS_TRANSITIONS.items() if status in targets
+    )
+
+
 class Job(BaseModel):
     """코드 실행 Job을 표현하는 모델입니다."""
 
     job_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="고유 Job ID")
     project: str = Field(..., description="프로젝트 이름")
     code_key: str = Field(..., description="실행할 S3 코드 키")
+    code_hash: Optional[str] = Field(None, description="코드 내용 SHA-256 해시")
     language: str = Field(..., description="프로그래밍 언어")
     status: JobStatus = Field(default=JobStatus.PENDING, description="현재 상태")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="생성 시각")
@@ -55,6 +82,15 @@ class JobResponse(BaseModel):
         }
 
 
+class JobListFilter(BaseModel):
+    """Job 목록 조회 조건입니다."""
+
+    status: Optional[JobStatus] = Field(None, description="Job 상태")
+    language: Optional[str] = Field(None, description="프로그래밍 언어")
+    created_after: Optional[datetime] = Field(None, description="이 시각 이후(포함)에 생성된 Job만 조회")
+    created_before: Optional[datetime] = Field(None, description="이 시각 이전에 생성된 Job만 조회")
+
+
 class JobStatusResponse(BaseModel):
     """Job 상태 조회 응답 스키마입니다."""
 
@@ -72,3 +108,24 @@ class JobStatusResponse(BaseModel):
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
+
+
+class JobStatusEvent(BaseModel):
+    """Job 상태 전이를 구독자에게 전달하는 이벤트 스키마입니다."""
+
+    job_id: str = Field(..., description="고유 Job ID")
+    status: JobStatus = Field(..., description="전이된 상태")
+    timestamp: datetime = Field(default_factory=datetime.utcnow, description="이벤트 발생 시각")
+    started_at: Optional[datetime] = Field(None, description="실행 시작 시각")
+    completed_at: Optional[datetime] = Field(None, description="실행 완료 시각")
+    result: Optional[Dict[str, Any]] = Field(None, description="최종 실행 결과(종료 상태에서만)")
+
+    @property
+    def is_terminal(self) -> bool:
+        """종료 상태 이벤트인지 여부를 반환합니다."""
+        return self.status in TERMINAL_JOB_STATUSES
+
+    class Config:
+        json_encoders = {
+            datetime: lambda v: v.isoformat()
+        }
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+
+
+class LogCacheStats(BaseModel):
+    """로그 객체 캐시 상태입니다."""
+
+    memory_entries: int = Field(..., description="메모리 계층 항목 수")
+    memory_bytes: int = Field(..., description="메모리 계층 크기(byte)")
+    memory_max_bytes: int = Field(..., description="메모리 계층 최대 크기(byte)")
+    disk_entries: int = Field(..., description="디스크 계층 항목 수")
+    disk_bytes: int = Field(..., description="디스크 계층 크기(byte)")
+    disk_max_bytes: int = Field(..., description="디스크 계층 최대 크기(byte)")
+    memory_hits: int = Field(..., description="메모리 계층 적중 횟수")
+    disk_hits: int = Field(..., description="디스크 계층 적중 횟수")
+    misses: int = Field(..., description="미적중 횟수")
+    evictions: int = Field(..., description="디스크 계층에서 제거된 횟수")
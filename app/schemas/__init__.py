@@ -2,5 +2,6 @@ from app.schemas.project import ProjectORM
 from app.schemas.job import JobORM
 from app.schemas.execution import ExecutionORM
 from app.schemas.log import LogORM
+from app.schemas.execution_queue import ExecutionQueueORM
 
-__all__ = ["ProjectORM", "JobORM", "ExecutionORM", "LogORM"]
+__all__ = ["ProjectORM", "JobORM", "ExecutionORM", "LogORM", "ExecutionQueueORM"]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Text, Float, ForeignKey, Index
+from sqlalchemy import Column, String, DateTime, Text, Float, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -15,9 +15,13 @@ class ExecutionORM(Base):
     __tablename__ = "executions"
 
     execution_id: str = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
-    job_id: str = Column(String(36), ForeignKey("jobs.job_id"), nullable=False, index=True)
+    job_id: str = Column(String(36), ForeignKey("jobs.job_id"), nullable=False)
     stdout: str = Column(Text, default="", nullable=False)
     stderr: str = Column(Text, default="", nullable=False)
+    stdout_key: str = Column(String(500), nullable=True)
+    stdout_bytes: int = Column(Integer, nullable=True)
+    stderr_key: str = Column(String(500), nullable=True)
+    stderr_bytes: int = Column(Integer, nullable=True)
     code_key: str = Column(String(500), nullable=True)
     log_key: str = Column(String(500), nullable=True)
     logs_url: str = Column(String(500), nullable=True)
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, String, DateTime, Integer, Text, ForeignKey, Index
+from datetime import datetime
+
+from config.db import Base
+
+
+class ExecutionQueueORM(Base):
+    """실행 대기열 항목을 저장하는 ORM 엔티티입니다.
+
+    디스패처에 들어간 실행 요청을 영속화하여, 서버가 재시작되더라도
+    대기 중이거나 실행 중이던 Job을 다시 디스패치할 수 있게 합니다.
+    항목은 맡은 인스턴스(`claimed_by`)가 주기적으로 `claimed_at`을 갱신하는 임대로
+    소유되며, 임대가 만료된 항목만 다른 인스턴스가 가져갑니다.
+    실행이 끝나면 항목은 삭제됩니다.
+    """
+
+    __tablename__ = "execution_queue"
+
+    job_id: str = Column(String(36), ForeignKey("jobs.job_id"), primary_key=True, nullable=False)
+    code_key: str = Column(String(500), nullable=False)
+    code_hash: str = Column(String(64), nullable=True)
+    language: str = Column(String(50), nullable=False)
+    input_data: str = Column(Text, nullable=True)
+    timeout_ms: int = Column(Integer, default=5000, nullable=False)
+    attempts: int = Column(Integer, default=0, nullable=False)
+    enqueued_at: datetime = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    claimed_by: str = Column(String(100), nullable=True)
+    claimed_at: datetime = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_execution_queue_enqueued_at", "enqueued_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ExecutionQueueORM(job_id={self.job_id}, language={self.language})>"
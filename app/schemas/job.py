@@ -18,6 +18,7 @@ class JobORM(Base):
     job_id: str = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False)
     project_id: int = Column(Integer, ForeignKey("projects.project_id"), nullable=False, index=True)
     code_key: str = Column(String(500), nullable=False)
+    code_hash: str = Column(String(64), nullable=True)
     language: str = Column(String(50), nullable=False)
     status: JobStatus = Column(Enum(JobStatus), default=JobStatus.PENDING, nullable=False, index=True)
     created_at: datetime = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
@@ -26,10 +27,18 @@ class JobORM(Base):
     completed_at: datetime = Column(DateTime(timezone=True), nullable=True)
     timeout_ms: int = Column(Integer, default=5000, nullable=False)
     result: dict = Column(JSON, nullable=True)
+    # 가장 최근 Execution을 가리키는 비정규화 포인터 (목록 조회 시 executions 전체를 읽지 않기 위함)
+    latest_execution_id: str = Column(String(36), nullable=True)
 
     # 관계 정의
     project_rel = relationship("ProjectORM", backref="jobs")
     executions = relationship("ExecutionORM", back_populates="job", cascade="all, delete-orphan")
+    latest_execution = relationship(
+        "ExecutionORM",
+        primaryjoin="foreign(JobORM.latest_execution_id) == ExecutionORM.execution_id",
+        viewonly=True,
+        uselist=False,
+    )
     logs = relationship("LogORM", back_populates="job", cascade="all, delete-orphan")
 
     # 복합 인덱스
@@ -14,9 +14,9 @@ class LogORM(Base):
     __tablename__ = "logs"
 
     log_key: str = Column(String(500), primary_key=True, nullable=False)
-    job_id: str = Column(String(36), ForeignKey("jobs.job_id"), nullable=False, index=True)
+    job_id: str = Column(String(36), ForeignKey("jobs.job_id"), nullable=False)
     logs_url: str = Column(String(500), nullable=False)
-    created_at: datetime = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False, index=True)
+    created_at: datetime = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
 
     job = relationship("JobORM", back_populates="logs")
 
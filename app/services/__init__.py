@@ -1,8 +1,8 @@
-from app.services.job import JobService
-from app.services.project import ProjectService
-from app.services.execution import ExecutionService
-from app.services.s3 import S3Service
-from app.services.cloudwatch import ResourceService
+from app.services.job import JobService, AsyncJobService
+from app.services.project import ProjectService, AsyncProjectService
+from app.services.execution import ExecutionService, AsyncExecutionService
+from app.services.s3 import S3Service, AsyncS3Service
+from app.services.cloudwatch import ResourceService, AsyncResourceService
 
 __all__ = [
     "JobService",
@@ -10,4 +10,9 @@ __all__ = [
     "ExecutionService",
     "S3Service",
     "ResourceService",
+    "AsyncJobService",
+    "AsyncProjectService",
+    "AsyncExecutionService",
+    "AsyncS3Service",
+    "AsyncResourceService",
 ]
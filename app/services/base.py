@@ -0,0 +1,24 @@
+from typing import Any, Callable, Generic, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+
+class AsyncServiceAdapter(Generic[S]):
+    """동기 서비스를 `AsyncSession` 위에서 실행하는 비동기 서비스의 기반 클래스입니다.
+
+    동기 서비스는 `AsyncSession.sync_session`에 바인딩되고, 메서드 호출은
+    `run_sync`를 통해 비동기 드라이버 위에서 실행되므로 이벤트 루프를 막지 않습니다.
+    비즈니스 로직은 동기 서비스 한 곳에만 두고 스크립트에서도 그대로 사용합니다.
+    """
+
+    def __init__(self, db: AsyncSession, service: S) -> None:
+        """비동기 세션과 그 세션에 바인딩된 동기 서비스를 초기화합니다."""
+        self.db = db
+        self.sync = service
+
+    async def _run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """동기 서비스 메서드를 비동기 세션의 greenlet 안에서 실행합니다."""
+        return await self.db.run_sync(lambda _session: fn(*args, **kwargs))
@@ -1,8 +1,20 @@
-from datetime import datetime
-from typing import List
+import math
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Sequence
 
+from app.clients.aws_io import AsyncCloudWatchClient
 from app.clients.cloudwatch import CloudWatchClient 
-from app.models.cloudwatch import CloudWatchMetricPoint
+from app.models.cloudwatch import (
+    CloudWatchMetricPoint,
+    MetricAggregationBucket,
+    MetricAggregationResponse,
+)
+from app.services.metrics_cache import MetricsCache, cluster_metrics_cache
+from app.services.metrics_store import (
+    ClusterMetricsPoller,
+    cluster_metrics_poller,
+    merge_cpu_memory_series,
+)
 
 
 class ResourceService:
@@ -27,38 +39,33 @@ class ResourceService:
             minutes=minutes,
             period=period,
         )
+        return self._to_points(raw)
 
-        # timestamp 기준으로 cpu / memory merge
-        result_map: dict[datetime, dict] = {}
-
-        for metric_result in raw.get("MetricDataResults", []):
-            metric_id = metric_result["Id"]  # "cpu" or "memory"
-            timestamps = metric_result.get("Timestamps", [])
-            values = metric_result.get("Values", [])
-            
-            for ts, value in zip(timestamps, values):
-                if ts not in result_map:
-                    result_map[ts] = {
-                        "timestamp": ts,
-                        "cpu_utilization": None,
-                        "memory_utilization": None,
-                    }
-                if metric_id == "cpu":
-                    result_map[ts]["cpu_utilization"] = value
-                else:
-                    result_map[ts]["memory_utilization"] = value
-
-        points = [
+    @staticmethod
+    def _to_points(raw: dict) -> list[CloudWatchMetricPoint]:
+        """GetMetricData 응답을 타임스탬프별 CPU/Memory 포인트로 병합합니다."""
+        timestamps, cpu_values, memory_values = merge_cpu_memory_series(raw)
+        return [
+            CloudWatchMetricPoint(timestamp=ts, cpu_utilization=cpu, memory_utilization=memory)
+            for ts, cpu, memory in zip(timestamps, cpu_values, memory_values)
+        ]
+
+    @staticmethod
+    def _buffer_to_points(
+        timestamps: Iterable[float],
+        cpu_values: Iterable[float],
+        memory_values: Iterable[float],
+    ) -> list[CloudWatchMetricPoint]:
+        """링 버퍼 배열을 포인트 리스트로 변환합니다. NaN은 None으로 바꿉니다."""
+        return [
             CloudWatchMetricPoint(
-                timestamp=ts,
-                cpu_utilization=data["cpu_utilization"],
-                memory_utilization=data["memory_utilization"],
+                timestamp=datetime.fromtimestamp(ts, timezone.utc),
+                cpu_utilization=None if math.isnan(cpu) else cpu,
+                memory_utilization=None if math.isnan(memory) else memory,
             )
-            for ts, data in sorted(result_map.items(), key=lambda x: x[0])
+            for ts, cpu, memory in zip(timestamps, cpu_values, memory_values)
         ]
 
-        return points
-
     def get_latest_cpu_memory_snapshot(
         self,
         cluster_name: str,
@@ -71,3 +78,147 @@ class ResourceService:
             minutes=minutes,
             period=period,
         )
+
+
+class AsyncResourceService:
+    """AWS 전용 스레드 풀에서 CloudWatch를 호출하는 ResourceService의 비동기 버전입니다.
+
+    백그라운드 폴러가 보관 중인 클러스터·주기의 시계열은 메모리에서 바로 응답하고,
+    그 밖의 조회는 `(cluster, minutes, period)` 단위로 캐시되어 여러 대시보드가
+    같은 클러스터를 폴링해도 주기마다 `GetMetricData`를 한 번만 호출합니다.
+    """
+
+    def __init__(
+        self,
+        cw_client: AsyncCloudWatchClient,
+        metrics_cache: Optional[MetricsCache] = None,
+        poller: Optional[ClusterMetricsPoller] = None,
+    ) -> None:
+        self.cw_client = cw_client
+        self.metrics_cache = metrics_cache or cluster_metrics_cache
+        self.poller = poller or cluster_metrics_poller
+
+    async def list_cluster_metric_names(self, cluster_name: str) -> List[str]:
+        """클러스터에서 사용 가능한 메트릭 이름 리스트를 반환합니다."""
+        return await self.cw_client.list_cluster_metric_names(cluster_name)
+
+    async def get_recent_cpu_memory_utilization(
+        self,
+        cluster_name: str,
+        minutes: int = 10,
+        period: int = 60,
+    ) -> list[CloudWatchMetricPoint]:
+        """최근 N분 동안의 CPU/Memory 사용률을 도메인 모델로 반환합니다."""
+        if self.poller.covers(cluster_name, minutes, period):
+            return ResourceService._buffer_to_points(*self.poller.window(cluster_name, minutes))
+
+        async def fetch() -> list[CloudWatchMetricPoint]:
+            raw = await self.cw_client.get_cpu_memory_timeseries(
+                cluster_name=cluster_name,
+                minutes=minutes,
+                period=period,
+            )
+            return ResourceService._to_points(raw)
+
+        return await self.metrics_cache.get_or_fetch((cluster_name, minutes, period), period, fetch)
+
+    async def get_latest_cpu_memory_snapshot(
+        self,
+        cluster_name: str,
+        minutes: int = 5,
+        period: int = 60,
+    ) -> dict:
+        """가장 최신 CPU/Memory 값 요약본을 반환합니다."""
+        return await self.cw_client.get_latest_cpu_memory_snapshot(
+            cluster_name=cluster_name,
+            minutes=minutes,
+            period=period,
+        )
+
+    async def aggregate_cpu_memory_utilization(
+        self,
+        cluster_name: str,
+        minutes: int,
+        period: int,
+        bucket_seconds: int,
+        metrics: Sequence[str],
+        stats: Sequence[str],
+        rolling_window: int = 3,
+    ) -> MetricAggregationResponse:
+        """CPU/Memory 시계열을 구간별로 다시 묶어 여러 통계를 한 번에 계산합니다.
+
+        원본 시계열은 `period` 주기로 한 번만 가져오고(폴러 버퍼 또는 캐시된 조회),
+        구간 크기와 통계 조합은 NumPy로 계산하므로 주기별 CloudWatch 호출이 필요 없습니다.
+
+        Args:
+            cluster_name: ECS 클러스터 이름.
+            minutes: 조회할 최근 구간(분).
+            period: 원본 시계열 주기(초).
+            bucket_seconds: 집계 구간 크기(초).
+            metrics: 집계할 메트릭 (`cpu`, `memory`).
+            stats: 계산할 통계 이름 목록.
+            rolling_window: `rolling_mean`에 사용할 구간 수.
+
+        Returns:
+            구간별 통계 응답.
+
+        Raises:
+            ValueError: 지원하지 않는 메트릭이나 통계가 있거나 구간이 원본 주기보다 짧은 경우.
+        """
+        # NumPy는 가져오는 비용이 커서 집계 요청이 처음 들어올 때 가져옵니다.
+        import numpy as np
+
+        from app.services.metrics_aggregation import SUPPORTED_METRICS, aggregate_series, validate_stats
+
+        unknown = [name for name in metrics if name not in SUPPORTED_METRICS]
+        if unknown:
+            raise ValueError(f"Unsupported metrics: {', '.join(unknown)}")
+        if bucket_seconds < period:
+            raise ValueError("bucket must be greater than or equal to period")
+        metrics = list(dict.fromkeys(metrics))
+        stats = validate_stats(stats)
+
+        if self.poller.covers(cluster_name, minutes, period):
+            ts_array, cpu_array, memory_array = self.poller.window(cluster_name, minutes)
+            timestamps = np.frombuffer(ts_array, dtype=np.float64)
+            columns = {
+                "cpu": np.frombuffer(cpu_array, dtype=np.float64),
+                "memory": np.frombuffer(memory_array, dtype=np.float64),
+            }
+        else:
+            points = await self.get_recent_cpu_memory_utilization(cluster_name, minutes, period)
+            timestamps = np.fromiter((p.timestamp.timestamp() for p in points), dtype=np.float64, count=len(points))
+            columns = {
+                "cpu": np.array([p.cpu_utilization for p in points], dtype=np.float64),
+                "memory": np.array([p.memory_utilization for p in points], dtype=np.float64),
+            }
+
+        bucket_starts, results = aggregate_series(
+            timestamps,
+            {name: columns[name] for name in metrics},
+            bucket_seconds,
+            stats,
+            rolling_window,
+        )
+
+        # NaN은 JSON으로 표현할 수 없으므로 None으로 바꿉니다.
+        values = {
+            name: {stat: [None if math.isnan(v) else v for v in array.tolist()] for stat, array in per_stat.items()}
+            for name, per_stat in results.items()
+        }
+        buckets = [
+            MetricAggregationBucket(
+                timestamp=datetime.fromtimestamp(start, timezone.utc),
+                values={name: {stat: values[name][stat][i] for stat in stats} for name in metrics},
+            )
+            for i, start in enumerate(bucket_starts.tolist())
+        ]
+
+        return MetricAggregationResponse(
+            cluster_name=cluster_name,
+            source_period=period,
+            bucket_seconds=bucket_seconds,
+            metrics=list(metrics),
+            stats=list(stats),
+            buckets=buckets,
+        )
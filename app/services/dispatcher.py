@@ -0,0 +1,569 @@
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.execution import ExecutionRequest, ExecutionQueueStats, LanguageQueueStats
+from app.models.job import JobStatus, JobStatusEvent
+from app.schemas.execution import ExecutionORM
+from app.schemas.execution_queue import ExecutionQueueORM
+from app.schemas.job import JobORM
+from app.schemas.log import LogORM
+from app.services.events import job_event_bus
+from app.services.execution import AsyncExecutionService
+from app.services.job import AsyncJobService, JobService
+from app.services.s3 import S3Service
+from app.services.write_behind import completion_writer
+from config.db import AsyncSessionLocal
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionQueueFullError(Exception):
+    """실행 대기열이 가득 차 새 요청을 받을 수 없을 때 발생합니다."""
+
+
+@dataclass
+class QueuedExecution:
+    """메모리 대기열에 들어가는 실행 항목입니다."""
+
+    request: ExecutionRequest
+    enqueued_at: datetime
+
+
+def _publish_completion(job_id: str, status: JobStatus, result: Optional[Dict[str, Any]] = None) -> None:
+    """종료 상태와 결과를 Job 이벤트 구독자에게 발행합니다."""
+    now = datetime.utcnow()
+    job_event_bus.publish(
+        JobStatusEvent(
+            job_id=job_id,
+            status=status,
+            timestamp=now,
+            completed_at=now,
+            result=result,
+        )
+    )
+
+
+async def run_execution_and_update_job(
+    jobId: str,
+    execution_request: ExecutionRequest,
+) -> None:
+    """Execution Engine 실행 후 Job 상태와 결과를 갱신하는 비동기 작업입니다.
+
+    디스패처 워커에서 새로운 DB 세션을 생성하여 사용합니다. Execution 행, 로그
+    메타데이터, Job 상태·결과는 하나의 조건부 UPDATE와 함께 한 번에 커밋되며,
+    그 사이 Job이 RUNNING이 아니게 되었으면(예: 취소) 결과를 반영하지 않습니다.
+    쓰기 지연 단계가 켜져 있으면 다른 완료 기록과 묶어 저장하고, 커밋이 확정된
+    뒤에 종료 이벤트를 발행합니다.
+    """
+    async with AsyncSessionLocal() as db:
+        job_service = AsyncJobService(db)
+        try:
+            execution_service = AsyncExecutionService(db)
+
+            prepared = await execution_service.run_execution(execution_request)
+
+            if not prepared:
+                if await job_service.transition_job(jobId, JobStatus.FAILED):
+                    _publish_completion(jobId, JobStatus.FAILED)
+                return
+
+            execution_orm, result = prepared
+            result_dict = result.dict()
+
+            if result_dict.get("completed_at"):
+                result_dict["completed_at"] = result_dict["completed_at"].isoformat()
+
+            # 로그 메타데이터 (logs_url이 없으면 log_key로 S3 URL 생성)
+            log_key = result_dict.get("log_key")
+            log_orm = None
+            if log_key:
+                log_orm = S3Service.build_log_metadata(jobId, log_key, result_dict.get("logs_url"))
+                result_dict["logs_url"] = log_orm.logs_url  # result에도 반영
+                # 캐시 적중 결과의 로그는 원본 실행에서 이미 저장되었습니다.
+                if result.cached:
+                    log_orm = None
+
+            logger.debug("Job %s log_key=%s logs_url=%s", jobId, log_key, result_dict.get("logs_url"))
+
+            if result_dict.get("stderr") or result_dict.get("error_message"):
+                final_status = JobStatus.FAILED
+            else:
+                final_status = JobStatus.SUCCESS
+
+            if completion_writer.running:
+                # 다른 완료 기록과 함께 저장되며, 커밋이 끝난 뒤에 반환됩니다.
+                applied = await completion_writer.submit(
+                    jobId,
+                    final_status,
+                    result=result_dict,
+                    execution_orm=execution_orm,
+                    log_orm=log_orm,
+                )
+            else:
+                applied = await _complete_job(job_service, jobId, final_status, result_dict, execution_orm, log_orm)
+
+            if applied:
+                _publish_completion(jobId, final_status, result_dict)
+            else:
+                logger.warning("Job %s is no longer RUNNING; discarding its result", jobId)
+        except Exception:
+            await db.rollback()
+            if await job_service.transition_job(jobId, JobStatus.FAILED):
+                _publish_completion(jobId, JobStatus.FAILED)
+
+
+async def _complete_job(
+    job_service: AsyncJobService,
+    job_id: str,
+    status: JobStatus,
+    result: Dict[str, Any],
+    execution_orm: ExecutionORM,
+    log_orm: Optional[LogORM],
+) -> bool:
+    """완료 기록을 바로 한 트랜잭션으로 저장합니다."""
+    try:
+        return await job_service.transition_job(
+            job_id,
+            status,
+            result=result,
+            execution_orm=execution_orm,
+            log_orm=log_orm,
+        )
+    except IntegrityError:
+        # 같은 log_key의 메타데이터가 이미 있으면 로그 행 없이 다시 반영합니다.
+        await job_service.db.rollback()
+        return await job_service.transition_job(
+            job_id,
+            status,
+            result=result,
+            execution_orm=execution_orm,
+        )
+
+
+class ExecutionDispatcher:
+    """언어별 동시성 한도를 가진 실행 워커 풀입니다.
+
+    실행 요청은 `execution_queue` 테이블에 먼저 기록된 뒤 언어별 메모리 대기열에
+    들어갑니다. 언어마다 동시성 한도만큼의 워커가 대기열을 소비하므로 요청이
+    몰려도 Execution Engine 호출 수는 일정하게 유지됩니다.
+
+    테이블 항목은 기록한 인스턴스가 임대(`claimed_by`/`claimed_at`)로 소유하고
+    주기적으로 갱신합니다. 임대가 만료된 항목(인스턴스가 죽은 경우)만 다른
+    인스턴스가 `SELECT ... FOR UPDATE SKIP LOCKED`로 가져가 실행을 이어가므로,
+    여러 인스턴스가 같은 항목을 동시에 실행하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[Dict[str, int]] = None,
+        max_queue_size: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        instance_id: Optional[str] = None,
+        lease_seconds: Optional[float] = None,
+    ) -> None:
+        """언어별 동시성 한도, 대기열 크기와 대기열 임대 설정을 초기화합니다."""
+        self.concurrency = dict(concurrency or settings.EXECUTION_WORKER_CONCURRENCY)
+        self.max_queue_size = max_queue_size or settings.EXECUTION_QUEUE_MAX_SIZE
+        self.max_attempts = max_attempts or settings.EXECUTION_MAX_ATTEMPTS
+        self.instance_id = (
+            instance_id
+            or settings.EXECUTION_INSTANCE_ID
+            or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        )
+        self.lease_seconds = lease_seconds or settings.EXECUTION_QUEUE_LEASE_SECONDS
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._in_flight: Dict[str, int] = {lang: 0 for lang in self.concurrency}
+        self._wait_times_ms: deque[float] = deque(maxlen=1000)
+        self._reserved = 0
+        self._workers: List[asyncio.Task] = []
+        # 메모리 대기열에 있거나 실행 중인 Job ID. 임대 갱신 대상입니다.
+        self._held: Set[str] = set()
+
+    @property
+    def running(self) -> bool:
+        """워커가 실행 중인지 여부를 반환합니다."""
+        return bool(self._workers)
+
+    def queue_depth(self) -> int:
+        """전체 대기 중인 항목 수를 반환합니다."""
+        return sum(q.qsize() for q in self._queues.values())
+
+    def available_slots(self) -> int:
+        """대기열에 추가로 넣을 수 있는 항목 수를 반환합니다."""
+        return max(self.max_queue_size - self.queue_depth() - self._reserved, 0)
+
+    async def start(self) -> None:
+        """영속화된 대기열을 복구하고 언어별 워커를 시작합니다."""
+        if self.running:
+            return
+
+        self._queues = {lang: asyncio.Queue() for lang in self.concurrency}
+        await self._recover(include_own=True)
+
+        for lang, limit in self.concurrency.items():
+            for index in range(max(limit, 1)):
+                task = asyncio.create_task(
+                    self._worker(lang),
+                    name=f"execution-worker-{lang}-{index}",
+                )
+                self._workers.append(task)
+        self._workers.append(asyncio.create_task(self._lease_loop(), name="execution-queue-lease"))
+
+    async def stop(self) -> None:
+        """워커를 중지하고 이 인스턴스가 가진 대기열 임대를 반납합니다.
+
+        대기 중이거나 실행 중이던 항목은 테이블에 남아 있으므로 다른 인스턴스나
+        다음 기동 시 복구됩니다.
+        """
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await self._release_leases()
+
+    async def submit(self, db: AsyncSession, execution_request: ExecutionRequest) -> bool:
+        """Job을 RUNNING으로 바꾸고 실행 요청을 대기열에 넣습니다.
+
+        Args:
+            db: 요청 범위의 비동기 데이터베이스 세션.
+            execution_request: 실행할 Job 정보.
+
+        Returns:
+            접수 여부. Job이 이미 RUNNING이라 전이할 수 없으면 False.
+
+        Raises:
+            ExecutionQueueFullError: 대기열이 가득 찬 경우.
+            ValueError: 지원하지 않는 언어인 경우.
+        """
+        return bool(await self.submit_many(db, [execution_request]))
+
+    async def submit_many(self, db: AsyncSession, execution_requests: List[ExecutionRequest]) -> List[str]:
+        """여러 Job을 RUNNING으로 바꾸고 실행 요청을 대기열에 넣습니다.
+
+        대기열 테이블 기록과 상태 변경은 하나의 트랜잭션으로 커밋되며, 커밋이 끝난 뒤에
+        메모리 대기열에 넣으므로 워커가 RUNNING 기록보다 먼저 결과를 쓰지 않습니다.
+        RUNNING으로 전이하지 못한 Job(이미 실행 중인 Job 등)은 대기열에 넣지 않습니다.
+
+        Args:
+            db: 요청 범위의 비동기 데이터베이스 세션.
+            execution_requests: 실행할 Job 정보 목록.
+
+        Returns:
+            실제로 접수된 Job ID 목록.
+
+        Raises:
+            ExecutionQueueFullError: 대기열에 모두 넣을 공간이 없는 경우.
+            ValueError: 지원하지 않는 언어가 포함된 경우.
+        """
+        for execution_request in execution_requests:
+            if execution_request.language.lower() not in self.concurrency:
+                raise ValueError(f"Unsupported language: {execution_request.language}")
+
+        count = len(execution_requests)
+        if count > self.available_slots():
+            raise ExecutionQueueFullError("Execution queue is full")
+
+        # 커밋을 기다리는 동안 다른 요청이 같은 자리를 차지하지 않도록 예약합니다.
+        self._reserved += count
+        try:
+            now = datetime.utcnow()
+            accepted = await db.run_sync(self._persist, execution_requests, now)
+        finally:
+            self._reserved -= count
+
+        for execution_request in execution_requests:
+            if execution_request.job_id in accepted:
+                self._put(QueuedExecution(request=execution_request, enqueued_at=now))
+        return [r.job_id for r in execution_requests if r.job_id in accepted]
+
+    def _persist(self, session: Session, execution_requests: List[ExecutionRequest], now: datetime) -> Set[str]:
+        """Job을 RUNNING으로 바꾸고 전이된 Job만 대기열에 기록한 뒤 한 번에 커밋합니다."""
+        accepted = set(
+            JobService(session).update_jobs_status(
+                [r.job_id for r in execution_requests], JobStatus.RUNNING, commit=False
+            )
+        )
+        execution_requests = [r for r in execution_requests if r.job_id in accepted]
+        if not execution_requests:
+            session.commit()
+            return accepted
+
+        session.query(ExecutionQueueORM).filter(
+            ExecutionQueueORM.job_id.in_(accepted)
+        ).delete(synchronize_session=False)
+        session.add_all([
+            ExecutionQueueORM(
+                job_id=r.job_id,
+                code_key=r.code_key,
+                code_hash=r.code_hash,
+                language=r.language.lower(),
+                input_data=r.input,
+                timeout_ms=r.timeout,
+                attempts=0,
+                enqueued_at=now,
+                claimed_by=self.instance_id,
+                claimed_at=now,
+            )
+            for r in execution_requests
+        ])
+        session.commit()
+        return accepted
+
+    def stats(self) -> ExecutionQueueStats:
+        """대기열 깊이와 최근 대기 시간 통계를 반환합니다."""
+        languages = {
+            lang: LanguageQueueStats(
+                concurrency=limit,
+                queued=self._queues[lang].qsize() if lang in self._queues else 0,
+                in_flight=self._in_flight.get(lang, 0),
+            )
+            for lang, limit in self.concurrency.items()
+        }
+
+        waits = sorted(self._wait_times_ms)
+        wait_avg = wait_p95 = wait_max = None
+        if waits:
+            wait_avg = sum(waits) / len(waits)
+            wait_p95 = waits[min(len(waits) - 1, int(len(waits) * 0.95))]
+            wait_max = waits[-1]
+
+        return ExecutionQueueStats(
+            queued=sum(s.queued for s in languages.values()),
+            in_flight=sum(s.in_flight for s in languages.values()),
+            max_queue_size=self.max_queue_size,
+            languages=languages,
+            wait_avg_ms=wait_avg,
+            wait_p95_ms=wait_p95,
+            wait_max_ms=wait_max,
+        )
+
+    def _put(self, item: QueuedExecution) -> None:
+        """항목을 언어별 메모리 대기열에 넣습니다."""
+        lang = item.request.language.lower()
+        if lang not in self._queues:
+            self._queues[lang] = asyncio.Queue()
+        self._held.add(item.request.job_id)
+        self._queues[lang].put_nowait(item)
+
+    async def _recover(self, include_own: bool = False) -> None:
+        """임대가 만료된 대기열 항목을 가져와 메모리 대기열로 복구합니다."""
+        limit = self.available_slots()
+        if limit <= 0:
+            return
+
+        async with AsyncSessionLocal() as db:
+            try:
+                recovered = await db.run_sync(self._claim_recoverable, limit, include_own)
+            except Exception:
+                await db.rollback()
+                logger.exception("Failed to recover execution queue")
+                return
+
+        for item in recovered:
+            self._put(item)
+        if recovered:
+            logger.info("Recovered %d queued executions", len(recovered))
+
+    def _claim_recoverable(self, session: Session, limit: int, include_own: bool) -> List[QueuedExecution]:
+        """임대가 만료된 대기열 항목을 이 인스턴스 앞으로 가져오고 시도 횟수를 늘립니다.
+
+        다른 인스턴스가 같은 항목을 가져가는 중이면 `SKIP LOCKED`로 건너뜁니다.
+        Job이 이미 RUNNING이 아니면(다른 곳에서 끝난 경우) 다시 실행하지 않고
+        항목만 제거하며, 재시도 한도를 넘긴 항목은 Job을 FAILED로 바꾸고 제거합니다.
+
+        Args:
+            session: 동기 데이터베이스 세션.
+            limit: 가져올 최대 항목 수.
+            include_own: 이 인스턴스 ID로 남은 항목도 가져올지 여부. 같은 ID로
+                재시작한 경우 임대 만료를 기다리지 않도록 기동 시에만 사용합니다.
+        """
+        now = datetime.utcnow()
+        expired = or_(
+            ExecutionQueueORM.claimed_by.is_(None),
+            ExecutionQueueORM.claimed_at.is_(None),
+            ExecutionQueueORM.claimed_at < now - timedelta(seconds=self.lease_seconds),
+        )
+        if include_own:
+            expired = or_(expired, ExecutionQueueORM.claimed_by == self.instance_id)
+
+        rows = (
+            session.query(ExecutionQueueORM)
+            .filter(expired)
+            .order_by(ExecutionQueueORM.enqueued_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        if not rows:
+            session.commit()
+            return []
+
+        statuses = dict(
+            session.query(JobORM.job_id, JobORM.status).filter(
+                JobORM.job_id.in_([row.job_id for row in rows])
+            )
+        )
+        job_service = JobService(session)
+        recovered: List[QueuedExecution] = []
+        for row in rows:
+            if row.job_id in self._held:
+                # 임대 갱신이 늦어져 만료됐을 뿐 이 인스턴스가 아직 가지고 있는 항목입니다.
+                row.claimed_by = self.instance_id
+                row.claimed_at = now
+                continue
+            if statuses.get(row.job_id) != JobStatus.RUNNING:
+                session.delete(row)
+                continue
+
+            row.attempts += 1
+            row.claimed_by = self.instance_id
+            row.claimed_at = now
+            if row.attempts > self.max_attempts or row.language not in self.concurrency:
+                job_service.transition_job(row.job_id, JobStatus.FAILED, commit=False)
+                session.delete(row)
+                continue
+
+            recovered.append(
+                QueuedExecution(
+                    request=ExecutionRequest(
+                        job_id=row.job_id,
+                        code_key=row.code_key,
+                        code_hash=row.code_hash,
+                        language=row.language,
+                        input=row.input_data or "",
+                        timeout=row.timeout_ms,
+                    ),
+                    enqueued_at=row.enqueued_at,
+                )
+            )
+        session.commit()
+        return recovered
+
+    async def _lease_loop(self) -> None:
+        """주기적으로 이 인스턴스의 임대를 갱신하고 만료된 항목을 가져옵니다."""
+        while True:
+            await asyncio.sleep(settings.EXECUTION_QUEUE_HEARTBEAT_SECONDS)
+            try:
+                await self._renew_leases()
+                await self._recover()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Execution queue lease maintenance failed")
+
+    async def _renew_leases(self) -> None:
+        """메모리 대기열에 있거나 실행 중인 항목의 임대 시각만 갱신합니다.
+
+        삭제에 실패해 남은 항목은 갱신하지 않으므로 임대가 만료되어 복구 단계에서 정리됩니다.
+        """
+        held = list(self._held)
+        if not held:
+            return
+
+        async with AsyncSessionLocal() as db:
+            try:
+                await db.execute(
+                    update(ExecutionQueueORM)
+                    .where(
+                        ExecutionQueueORM.claimed_by == self.instance_id,
+                        ExecutionQueueORM.job_id.in_(held),
+                    )
+                    .values(claimed_at=datetime.utcnow())
+                )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+    async def _release_leases(self) -> None:
+        """이 인스턴스의 임대를 반납해 다른 인스턴스가 바로 가져갈 수 있게 합니다."""
+        async with AsyncSessionLocal() as db:
+            try:
+                await db.execute(
+                    update(ExecutionQueueORM)
+                    .where(ExecutionQueueORM.claimed_by == self.instance_id)
+                    .values(claimed_by=None, claimed_at=None)
+                )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                logger.exception("Failed to release execution queue leases")
+
+    async def _release(self, job_id: str) -> None:
+        """항목의 임대를 반납해 복구 단계에서 다시 시도하거나 정리하게 합니다."""
+        async with AsyncSessionLocal() as db:
+            try:
+                await db.execute(
+                    update(ExecutionQueueORM)
+                    .where(
+                        ExecutionQueueORM.job_id == job_id,
+                        ExecutionQueueORM.claimed_by == self.instance_id,
+                    )
+                    .values(claimed_by=None, claimed_at=None)
+                )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                logger.exception("Failed to release queue entry for job %s", job_id)
+
+    async def _remove(self, job_id: str) -> None:
+        """실행이 끝난 항목을 대기열 테이블에서 삭제합니다.
+
+        그 사이 같은 Job이 다시 제출되어 다른 인스턴스가 새 항목을 가졌을 수 있으므로
+        이 인스턴스가 임대한 항목만 삭제합니다.
+        """
+        async with AsyncSessionLocal() as db:
+            try:
+                await db.execute(
+                    delete(ExecutionQueueORM).where(
+                        ExecutionQueueORM.job_id == job_id,
+                        ExecutionQueueORM.claimed_by == self.instance_id,
+                    )
+                )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                logger.exception("Failed to remove queue entry for job %s", job_id)
+
+    async def _worker(self, language: str) -> None:
+        """언어별 대기열에서 항목을 꺼내 실행하는 워커 루프입니다."""
+        queue = self._queues[language]
+        while True:
+            item = await queue.get()
+            job_id = item.request.job_id
+            self._in_flight[language] = self._in_flight.get(language, 0) + 1
+            try:
+                wait_ms = (datetime.utcnow() - item.enqueued_at).total_seconds() * 1000
+                self._wait_times_ms.append(max(wait_ms, 0.0))
+
+                await run_execution_and_update_job(job_id, item.request)
+            except asyncio.CancelledError:
+                # 중지 중에는 항목을 남겨 두고 stop()이 임대를 반납합니다.
+                self._held.discard(job_id)
+                raise
+            except Exception:
+                logger.exception("Execution worker failed for job %s", job_id)
+                self._held.discard(job_id)
+                await self._release(job_id)
+            else:
+                self._held.discard(job_id)
+                await self._remove(job_id)
+            finally:
+                self._in_flight[language] -= 1
+                queue.task_done()
+
+
+execution_dispatcher = ExecutionDispatcher()
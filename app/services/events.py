@@ -0,0 +1,132 @@
+import asyncio
+import threading
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from app.models.job import JobStatusEvent
+
+
+class JobEventBus:
+    """Job ID를 키로 하는 프로세스 내부 pub/sub입니다.
+
+    SSE/WebSocket 구독자는 Job마다 전용 큐를 받고, 실행 워커가 상태를 기록할 때
+    발행한 이벤트가 해당 Job의 모든 구독자 큐로 전달됩니다. 구독자가 느려 큐가
+    가득 차면 가장 오래된 이벤트를 버립니다.
+    """
+
+    def __init__(self, max_queue_size: int = 100) -> None:
+        """구독자 큐 크기를 초기화합니다."""
+        self.max_queue_size = max_queue_size
+        self._subscribers: Dict[str, Dict[int, Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, job_id: str) -> asyncio.Queue:
+        """Job 이벤트를 받을 큐를 등록합니다.
+
+        현재 상태를 조회하기 전에 구독해야 조회와 구독 사이의 전이를 놓치지 않습니다.
+        사용이 끝나면 반드시 `unsubscribe`로 해제해야 합니다.
+
+        Args:
+            job_id: 구독할 Job ID.
+
+        Returns:
+            `JobStatusEvent`가 들어오는 asyncio 큐.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        with self._lock:
+            self._subscribers.setdefault(job_id, {})[id(queue)] = (asyncio.get_running_loop(), queue)
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue) -> None:
+        """등록한 구독 큐를 해제합니다."""
+        with self._lock:
+            subscribers = self._subscribers.get(job_id)
+            if subscribers is not None:
+                subscribers.pop(id(queue), None)
+                if not subscribers:
+                    del self._subscribers[job_id]
+
+    async def stream(
+        self,
+        job_id: str,
+        queue: asyncio.Queue,
+        initial: JobStatusEvent,
+        heartbeat: float,
+    ) -> AsyncIterator[Optional[JobStatusEvent]]:
+        """현재 상태부터 종료 상태까지 이벤트를 순서대로 내보냅니다.
+
+        `heartbeat`초 동안 이벤트가 없으면 연결 유지를 위해 None을 내보냅니다.
+        종료 상태 이벤트를 내보내거나 스트림이 닫히면 구독을 해제합니다.
+
+        Args:
+            job_id: 구독 중인 Job ID.
+            queue: `subscribe`로 받은 큐.
+            initial: 구독 직후 조회한 현재 상태.
+            heartbeat: 하트비트 간격(초).
+
+        Yields:
+            상태 이벤트 또는 하트비트(None).
+        """
+        try:
+            yield initial
+            if initial.is_terminal:
+                return
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+
+                yield event
+                if event.is_terminal:
+                    return
+        finally:
+            self.unsubscribe(job_id, queue)
+
+    def publish(self, event: JobStatusEvent) -> int:
+        """이벤트를 해당 Job의 모든 구독자에게 전달합니다.
+
+        다른 스레드에서 호출되어도 구독자의 이벤트 루프에서 큐에 넣습니다.
+
+        Args:
+            event: 발행할 상태 이벤트.
+
+        Returns:
+            이벤트를 전달한 구독자 수.
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(event.job_id, {}).values())
+
+        for loop, queue in subscribers:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+
+            if running is loop:
+                self._offer(queue, event)
+            else:
+                loop.call_soon_threadsafe(self._offer, queue, event)
+
+        return len(subscribers)
+
+    def subscriber_count(self, job_id: str | None = None) -> int:
+        """구독자 수를 반환합니다. job_id가 없으면 전체 구독자 수입니다."""
+        with self._lock:
+            if job_id is not None:
+                return len(self._subscribers.get(job_id, ()))
+            return sum(len(s) for s in self._subscribers.values())
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, event: JobStatusEvent) -> None:
+        """큐가 가득 차면 가장 오래된 이벤트를 버리고 새 이벤트를 넣습니다."""
+        if queue.full():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait(event)
+
+
+job_event_bus = JobEventBus()
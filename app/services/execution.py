@@ -1,23 +1,42 @@
-import ast
-import httpx
-from typing import Optional, Dict, Any
+import logging
+import time
+
+from typing import Optional, Dict, Any, Tuple
+from app.clients.aws_io import aws_executor
+from app.clients.engine import EngineHTTPClientPool, engine_http_pool
 from app.models.execution import ExecutionRequest, ExecutionResult, ResourceMetrics
 from app.schemas.execution import ExecutionORM
+from app.services.ingestion import ResultIngestor, decode_engine_response
+from app.services.result_cache import ExecutionResultCache, execution_result_cache
+from app.services.telemetry import ENGINE_REQUEST_SECONDS
 from app.schemas.job import JobORM
 from config.settings import settings
+from app.services.base import AsyncServiceAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime
 import uuid
 
+logger = logging.getLogger(__name__)
+
 
 class ExecutionService:
     """코드 실행 요청을 위임하고 Execution Engine과 통신하는 서비스입니다."""
 
-    def __init__(self, db: Session) -> None:
-        """엔진 URL과 타임아웃, 데이터베이스 세션을 초기화합니다."""
+    def __init__(
+        self,
+        db: Session,
+        http_pool: Optional[EngineHTTPClientPool] = None,
+        result_cache: Optional[ExecutionResultCache] = None,
+        ingestor: Optional[ResultIngestor] = None,
+    ) -> None:
+        """엔진 URL과 타임아웃, 데이터베이스 세션, 공유 HTTP 클라이언트 풀과 결과 캐시를 초기화합니다."""
         self.engine_url = settings.EXECUTION_ENGINE_URL
         self.timeout = settings.EXECUTION_ENGINE_TIMEOUT / 1000
         self.db = db
+        self.http_pool = http_pool or engine_http_pool
+        self.result_cache = result_cache or execution_result_cache
+        self.ingestor = ingestor or ResultIngestor()
 
     async def submit_execution(self, execution_request: ExecutionRequest) -> Optional[ExecutionResult]:
         """Execution Engine으로 코드 실행을 트리거하고 결과를 저장합니다.
@@ -28,6 +47,86 @@ class ExecutionService:
         Returns:
             저장된 ExecutionResult DTO 또는 실패 시 None.
         """
+        prepared = await self.run_execution(execution_request)
+        if prepared is None:
+            return None
+
+        execution_orm, result = prepared
+        try:
+            saved = self.save_execution(execution_orm)
+        except Exception:
+            self.db.rollback()
+            return None
+        saved.cached = result.cached
+        return saved
+
+    async def run_execution(
+        self, execution_request: ExecutionRequest, offload_uploads: bool = False
+    ) -> Optional[Tuple[ExecutionORM, ExecutionResult]]:
+        """코드를 실행하고 저장할 ExecutionORM과 결과 DTO를 만듭니다. DB에는 쓰지 않습니다.
+
+        결과 캐시가 켜져 있고 같은 코드·언어·입력의 결과가 캐시에 있으면
+        엔진을 호출하지 않고 캐시된 결과를 이 Job의 실행 기록으로 복사합니다.
+
+        Args:
+            execution_request: 실행할 Job과 코드 키, 언어 정보.
+            offload_uploads: True이면 큰 출력 업로드를 포함한 ExecutionORM 생성을
+                AWS 전용 스레드 풀에서 수행해 이벤트 루프를 막지 않습니다.
+
+        Returns:
+            저장 전 ExecutionORM과 ExecutionResult DTO, 또는 실패 시 None.
+        """
+        try:
+            cache_key = self.cache_key(execution_request)
+            cached = self.result_cache.get(cache_key) if cache_key else None
+            if cached:
+                execution_orm = self.build_cached_execution(execution_request.job_id, cached)
+                result = self._orm_to_dto(execution_orm)
+                result.cached = True
+                return execution_orm, result
+
+            data = await self.request_engine(execution_request)
+            if data is None:
+                return None
+
+            if offload_uploads:
+                execution_orm = await aws_executor.run(self.build_execution, execution_request.job_id, data)
+            else:
+                execution_orm = self.build_execution(execution_request.job_id, data)
+            result = self._orm_to_dto(execution_orm)
+            self.cache_result(cache_key, data, result)
+            return execution_orm, result
+
+        except Exception:
+            return None
+
+    def cache_key(self, execution_request: ExecutionRequest) -> Optional[str]:
+        """결과 캐시가 켜져 있으면 요청의 캐시 키를 반환합니다."""
+        if not self.result_cache.enabled or not execution_request.code_hash:
+            return None
+        return ExecutionResultCache.make_key(
+            execution_request.code_hash,
+            execution_request.language,
+            execution_request.input,
+        )
+
+    def cache_result(self, cache_key: Optional[str], data: Dict[str, Any], result: ExecutionResult) -> None:
+        """에러 없이 끝난 엔진 결과를 캐시에 저장합니다."""
+        if cache_key and not data.get("error_message"):
+            self.result_cache.put(cache_key, result)
+
+    async def request_engine(self, execution_request: ExecutionRequest) -> Optional[Dict[str, Any]]:
+        """Execution Engine을 호출하고 응답을 디코딩합니다. DB에는 접근하지 않습니다.
+
+        Args:
+            execution_request: 실행할 Job과 코드 키, 언어 정보.
+
+        Returns:
+            디코딩된 엔진 응답 또는 실패 시 None.
+        """
+        # 기동 시간을 줄이기 위해 모듈 로드 시점이 아니라 첫 호출 때 가져옵니다.
+        import httpx
+
         try:
             lang = execution_request.language.lower()
 
@@ -39,44 +138,91 @@ class ExecutionService:
                 "python": settings.EXECUTION_ENGINE_PYTHON_RUN_URL, 
                 "node": settings.EXECUTION_ENGINE_NODE_RUN_URL
             }[lang]
-                
+
             params = {"code_key": execution_request.code_key}
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(run_url, params=params)
-
-                if response.status_code != 200:
-                    return None
-                
-                text = response.text.strip()
-                print(f"[DEBUG] Execution Engine 응답: {text}")  # 디버그 로그
-
-                if text.startswith("{") and text.endswith("}"):
-                    data = ast.literal_eval(text)
-                    if isinstance(data, dict):
-                        execution_orm = ExecutionORM(
-                            execution_id=str(uuid.uuid4()),
-                            job_id=execution_request.job_id,
-                            stdout=data.get("stdout", ""),
-                            stderr=data.get("stderr", ""),
-                            code_key=data.get("code_key"),
-                            log_key=data.get("log_key"),
-                            logs_url=data.get("logs_url"),
-                            cpu_percent=data.get("cpu_percent"),
-                            memory_mb=data.get("memory_mb"),
-                            execution_time_ms=data.get("execution_time_ms"),
-                            completed_at=datetime.utcnow()
-                        )
-                        self.db.add(execution_orm)
-                        self.db.commit()
-                        
-                        return self._orm_to_dto(execution_orm)
+            started_at = time.perf_counter()
+            outcome = "error"
+            try:
+                response = await self.http_pool.request(lang, "GET", run_url, params=params)
+                outcome = "ok" if response.status_code == 200 else f"http_{response.status_code // 100}xx"
+            except httpx.TimeoutException:
+                outcome = "timeout"
+                raise
+            finally:
+                ENGINE_REQUEST_SECONDS.labels(lang, outcome).observe(time.perf_counter() - started_at)
+
+            if response.status_code != 200:
+                return None
+
+            logger.debug("Execution Engine response: %d bytes", len(response.content))
+
+            return decode_engine_response(response.content)
 
         except httpx.TimeoutException:
             return None
         except Exception:
             return None
 
+    def build_execution(self, job_id: str, data: Dict[str, Any]) -> ExecutionORM:
+        """엔진 응답으로 저장할 ExecutionORM을 만듭니다.
+
+        큰 stdout/stderr는 이 단계에서 로그 버킷으로 업로드됩니다.
+        """
+        execution_id = str(uuid.uuid4())
+        stdout = self.ingestor.ingest_output(job_id, execution_id, "stdout", data.get("stdout", ""))
+        stderr = self.ingestor.ingest_output(job_id, execution_id, "stderr", data.get("stderr", ""))
+        return ExecutionORM(
+            execution_id=execution_id,
+            job_id=job_id,
+            stdout=stdout.text,
+            stderr=stderr.text,
+            stdout_key=stdout.key,
+            stdout_bytes=stdout.size_bytes,
+            stderr_key=stderr.key,
+            stderr_bytes=stderr.size_bytes,
+            code_key=data.get("code_key"),
+            log_key=data.get("log_key"),
+            logs_url=data.get("logs_url"),
+            cpu_percent=data.get("cpu_percent"),
+            memory_mb=data.get("memory_mb"),
+            execution_time_ms=data.get("execution_time_ms"),
+            completed_at=datetime.utcnow()
+        )
+
+    def build_cached_execution(self, job_id: str, cached: ExecutionResult) -> ExecutionORM:
+        """캐시된 결과를 대상 Job의 ExecutionORM으로 복사합니다."""
+        return ExecutionORM(
+            execution_id=str(uuid.uuid4()),
+            job_id=job_id,
+            stdout=cached.stdout,
+            stderr=cached.stderr,
+            stdout_key=cached.stdout_key,
+            stdout_bytes=cached.stdout_bytes,
+            stderr_key=cached.stderr_key,
+            stderr_bytes=cached.stderr_bytes,
+            code_key=cached.code_key,
+            log_key=cached.log_key,
+            logs_url=cached.logs_url,
+            cpu_percent=cached.resource.cpu_percent if cached.resource else None,
+            memory_mb=cached.resource.memory_mb if cached.resource else None,
+            execution_time_ms=cached.resource.execution_time_ms if cached.resource else None,
+            completed_at=datetime.utcnow()
+        )
+
+    def save_execution(self, execution_orm: ExecutionORM) -> ExecutionResult:
+        """ExecutionORM을 저장하고 DTO로 반환합니다.
+
+        같은 트랜잭션에서 Job의 최신 Execution 포인터도 갱신합니다.
+        """
+        self.db.add(execution_orm)
+        self.db.flush()
+        self.db.query(JobORM).filter(
+            JobORM.job_id == execution_orm.job_id
+        ).update({JobORM.latest_execution_id: execution_orm.execution_id})
+        self.db.commit()
+        return self._orm_to_dto(execution_orm)
+
     async def get_execution_status(self, job_id: str) -> Optional[dict]:
         """데이터베이스에서 Job의 가장 최근 Execution 결과를 조회합니다.
 
@@ -87,19 +233,20 @@ class ExecutionService:
             상태/결과 JSON 딕셔너리 또는 None.
         """
         try:
-            execution_orm = self.db.query(ExecutionORM).filter(
-                ExecutionORM.job_id == job_id
-            ).order_by(ExecutionORM.completed_at.desc()).first()
-
-            if execution_orm:
-                result = self._orm_to_dto(execution_orm)
-                return result.dict()
-
-            return None
+            result = self.get_latest_execution(job_id)
+            return result.dict() if result else None
 
         except Exception:
             return None
 
+    def get_latest_execution(self, job_id: str) -> Optional[ExecutionResult]:
+        """Job의 가장 최근 Execution 결과를 DTO로 반환합니다."""
+        execution_orm = self.db.query(ExecutionORM).filter(
+            ExecutionORM.job_id == job_id
+        ).order_by(ExecutionORM.completed_at.desc()).first()
+
+        return self._orm_to_dto(execution_orm) if execution_orm else None
+
     async def cancel_execution(self, job_id: str) -> bool:
         """진행 중인 실행을 취소합니다.
 
@@ -110,13 +257,14 @@ class ExecutionService:
             취소 성공 여부.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.engine_url}/cancel/{job_id}",
-                    headers={"Content-Type": "application/json"}
-                )
+            response = await self.http_pool.request(
+                EngineHTTPClientPool.DEFAULT,
+                "POST",
+                f"{self.engine_url}/cancel/{job_id}",
+                headers={"Content-Type": "application/json"}
+            )
 
-                return response.status_code == 200
+            return response.status_code == 200
 
         except Exception:
             return False
@@ -138,9 +286,88 @@ class ExecutionService:
             status="COMPLETED",
             stdout=execution_orm.stdout,
             stderr=execution_orm.stderr,
+            stdout_key=execution_orm.stdout_key,
+            stdout_bytes=execution_orm.stdout_bytes,
+            stderr_key=execution_orm.stderr_key,
+            stderr_bytes=execution_orm.stderr_bytes,
             resource=resource_metrics,
             code_key=execution_orm.code_key,
             log_key=execution_orm.log_key,
             logs_url=execution_orm.logs_url,
             completed_at=execution_orm.completed_at
         )
+
+
+class AsyncExecutionService(AsyncServiceAdapter[ExecutionService]):
+    """`AsyncSession` 위에서 동작하는 ExecutionService의 비동기 버전입니다.
+
+    엔진 호출은 그대로 비동기로, 결과 업로드는 AWS 전용 스레드 풀에서, DB 저장은
+    비동기 세션에서 수행합니다.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        http_pool: Optional[EngineHTTPClientPool] = None,
+        result_cache: Optional[ExecutionResultCache] = None,
+        ingestor: Optional[ResultIngestor] = None,
+    ) -> None:
+        """비동기 데이터베이스 세션과 공유 HTTP 클라이언트 풀, 결과 캐시를 초기화합니다."""
+        super().__init__(
+            db,
+            ExecutionService(
+                db.sync_session,
+                http_pool=http_pool,
+                result_cache=result_cache,
+                ingestor=ingestor,
+            ),
+        )
+
+    async def submit_execution(self, execution_request: ExecutionRequest) -> Optional[ExecutionResult]:
+        """Execution Engine으로 코드 실행을 트리거하고 결과를 저장합니다.
+
+        Args:
+            execution_request: 실행할 Job과 코드 키, 언어 정보.
+
+        Returns:
+            저장된 ExecutionResult DTO 또는 실패 시 None.
+        """
+        prepared = await self.run_execution(execution_request)
+        if prepared is None:
+            return None
+
+        execution_orm, result = prepared
+        try:
+            saved = await self._run(self.sync.save_execution, execution_orm)
+        except Exception:
+            await self.db.rollback()
+            return None
+        saved.cached = result.cached
+        return saved
+
+    async def run_execution(
+        self, execution_request: ExecutionRequest
+    ) -> Optional[Tuple[ExecutionORM, ExecutionResult]]:
+        """코드를 실행하고 저장할 ExecutionORM과 결과 DTO를 만듭니다. DB에는 쓰지 않습니다.
+
+        엔진 호출은 그대로 비동기로, 큰 출력 업로드는 AWS 전용 스레드 풀에서 수행합니다.
+
+        Args:
+            execution_request: 실행할 Job과 코드 키, 언어 정보.
+
+        Returns:
+            저장 전 ExecutionORM과 ExecutionResult DTO, 또는 실패 시 None.
+        """
+        return await self.sync.run_execution(execution_request, offload_uploads=True)
+
+    async def get_execution_status(self, job_id: str) -> Optional[dict]:
+        """데이터베이스에서 Job의 가장 최근 Execution 결과를 조회합니다."""
+        try:
+            result = await self._run(self.sync.get_latest_execution, job_id)
+            return result.dict() if result else None
+        except Exception:
+            return None
+
+    async def cancel_execution(self, job_id: str) -> bool:
+        """진행 중인 실행을 취소합니다."""
+        return await self.sync.cancel_execution(job_id)
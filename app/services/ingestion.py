@@ -0,0 +1,98 @@
+import ast
+import io
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import orjson
+
+from app.clients.s3 import LogS3Client
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def decode_engine_response(raw: bytes) -> Optional[Dict[str, Any]]:
+    """Execution Engine 응답 본문을 딕셔너리로 디코딩합니다.
+
+    JSON은 orjson으로 파싱하고, 엔진이 파이썬 dict 표현을 돌려준 경우에만
+    `ast.literal_eval`로 대체합니다.
+
+    Args:
+        raw: 응답 본문 바이트.
+
+    Returns:
+        디코딩된 딕셔너리 또는 형식이 맞지 않으면 None.
+    """
+    raw = raw.strip()
+    if not (raw.startswith(b"{") and raw.endswith(b"}")):
+        return None
+
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        data = ast.literal_eval(raw.decode("utf-8"))
+
+    return data if isinstance(data, dict) else None
+
+
+@dataclass
+class IngestedOutput:
+    """DB에 저장할 출력 스트림 하나의 정보입니다."""
+
+    text: str
+    key: Optional[str]
+    size_bytes: int
+
+
+class ResultIngestor:
+    """실행 결과의 stdout/stderr을 DB 저장용으로 정리하는 단계입니다.
+
+    출력이 인라인 한도 이하이면 그대로 두고, 한도를 넘으면 전체 내용을 로그
+    버킷에 올린 뒤 앞부분 미리보기와 객체 키, 바이트 길이만 남깁니다.
+    """
+
+    def __init__(
+        self,
+        log_client: Optional[LogS3Client] = None,
+        inline_max_bytes: Optional[int] = None,
+        preview_bytes: Optional[int] = None,
+    ) -> None:
+        """로그 버킷 클라이언트와 인라인 한도를 초기화합니다."""
+        self._log_client = log_client
+        self.inline_max_bytes = inline_max_bytes or settings.EXECUTION_OUTPUT_INLINE_MAX_BYTES
+        self.preview_bytes = preview_bytes or settings.EXECUTION_OUTPUT_PREVIEW_BYTES
+
+    @property
+    def log_client(self) -> LogS3Client:
+        """로그 버킷 클라이언트를 필요할 때 생성합니다."""
+        if self._log_client is None:
+            self._log_client = LogS3Client()
+        return self._log_client
+
+    def ingest_output(self, job_id: str, execution_id: str, name: str, text: str) -> IngestedOutput:
+        """출력 하나를 인라인으로 둘지 S3로 보낼지 결정합니다.
+
+        Args:
+            job_id: 대상 Job ID.
+            execution_id: 대상 Execution ID.
+            name: 출력 이름 (`stdout` 또는 `stderr`).
+            text: 출력 전체 문자열.
+
+        Returns:
+            DB에 저장할 텍스트와 객체 키, 전체 바이트 길이.
+        """
+        body = (text or "").encode("utf-8")
+        if len(body) <= self.inline_max_bytes:
+            return IngestedOutput(text=text or "", key=None, size_bytes=len(body))
+
+        key = f"outputs/{job_id}/{execution_id}/{name}.txt"
+        try:
+            self.log_client.put_log(key, io.BytesIO(body))
+        except Exception:
+            # 업로드에 실패하면 출력을 잃지 않도록 전체 내용을 그대로 저장합니다.
+            logger.exception("Failed to spill %s of job %s to S3", name, job_id)
+            return IngestedOutput(text=text, key=None, size_bytes=len(body))
+
+        preview = body[: self.preview_bytes].decode("utf-8", errors="ignore")
+        return IngestedOutput(text=preview, key=key, size_bytes=len(body))
@@ -1,10 +1,26 @@
-﻿from typing import Optional, Dict, List, Any
-from app.models.job import Job, JobStatus, JobResponse
+﻿from typing import Optional, Dict, List, Any, Tuple
+from app.models.job import (
+    Job,
+    JobListFilter,
+    JobStatus,
+    JobResponse,
+    JobStatusResponse,
+    TERMINAL_JOB_STATUSES,
+    job_status_sources,
+)
 from app.models.code import CodeUploadRequest
+from app.schemas.execution import ExecutionORM
 from app.schemas.job import JobORM
+from app.schemas.log import LogORM
+from app.services.base import AsyncServiceAdapter
+from app.services.pagination import decode_job_cursor, encode_job_cursor
 from app.services.project import ProjectService
+from app.services.telemetry import record_job_transition
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Query, Session, joinedload
+import hashlib
 import uuid
 
 
@@ -29,15 +45,16 @@ class JobService:
         Returns:
             생성된 Job 객체.
         """
-        project_orm = self.project_service.get_or_create_project(
+        project_id = self.project_service.get_or_create_project_id(
             code_request.project,
             code_request.description
         )
 
         job_orm = JobORM(
             job_id=str(uuid.uuid4()),
-            project_id=project_orm.project_id,
+            project_id=project_id,
             code_key=code_key,
+            code_hash=hashlib.sha256(code_request.code.encode("utf-8")).hexdigest(),
             language=code_request.language,
             status=JobStatus.PENDING,
             timeout_ms=30000  
@@ -45,14 +62,34 @@ class JobService:
         self.db.add(job_orm)
         self.db.commit()
         
-        return self._orm_to_dto(job_orm)
+        return self._orm_to_dto(job_orm, project=code_request.project)
     
     def get_job(self, job_id: str) -> Optional[Job]:
         """Job ID로 Job을 조회합니다."""
-        job_orm = self.db.query(JobORM).filter(JobORM.job_id == job_id).first()
+        job_orm = self.db.query(JobORM).options(
+            joinedload(JobORM.project_rel)
+        ).filter(JobORM.job_id == job_id).first()
         return self._orm_to_dto(job_orm) if job_orm else None
     
     
+    def get_jobs(self, job_ids: List[str]) -> Dict[str, Job]:
+        """여러 Job을 한 번의 쿼리로 조회합니다.
+
+        Args:
+            job_ids: 조회할 Job ID 목록.
+
+        Returns:
+            Job ID를 키로 하는 Job 딕셔너리. 존재하지 않는 ID는 포함되지 않습니다.
+        """
+        if not job_ids:
+            return {}
+
+        job_orms = self.db.query(JobORM).options(
+            joinedload(JobORM.project_rel)
+        ).filter(JobORM.job_id.in_(job_ids)).all()
+
+        return {job_orm.job_id: self._orm_to_dto(job_orm) for job_orm in job_orms}
+
     def list_jobs_by_project(self, project: str, limit: int = 100) -> List[Job]:
         """특정 프로젝트에 속한 Job 목록을 조회합니다.
 
@@ -63,41 +100,181 @@ class JobService:
         Returns:
             Job 객체 리스트.
         """
-        project_orm = self.project_service.get_project(project)
-        if not project_orm:
+        project_id = self.project_service.get_project_id(project)
+        if project_id is None:
             return []
         
-        job_orms = self.db.query(JobORM).filter(
-            JobORM.project_id == project_orm.project_id
+        job_orms = self._job_query().filter(
+            JobORM.project_id == project_id
         ).order_by(JobORM.created_at.desc()).limit(limit).all()
         
         return [self._orm_to_dto(job_orm) for job_orm in job_orms]
+
+    def list_job_responses(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: Optional[JobListFilter] = None,
+    ) -> Tuple[List[JobResponse], Optional[str]]:
+        """Job 목록 한 페이지를 최신 Execution 정보와 함께 응답 DTO로 반환합니다.
+
+        `(created_at, job_id)` 내림차순 keyset 페이지네이션을 사용하므로 깊은 페이지도
+        앞 페이지와 같은 비용으로 조회됩니다. 프로젝트와 최신 Execution을 함께 읽어
+        페이지 크기와 관계없이 쿼리 수가 일정합니다.
+
+        Args:
+            limit: 페이지 크기.
+            cursor: 이전 페이지가 반환한 커서. 없으면 첫 페이지.
+            filters: 상태/언어/생성 시각 조건.
+
+        Returns:
+            JobResponse 리스트와 다음 페이지 커서(마지막 페이지면 None).
+
+        Raises:
+            InvalidCursorError: 커서 형식이 맞지 않는 경우.
+        """
+        job_orms, next_cursor = self._list_page(self._job_query(), limit, cursor, filters)
+        return self._to_responses(job_orms), next_cursor
+
+    def list_job_responses_by_project(
+        self,
+        project: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: Optional[JobListFilter] = None,
+    ) -> Tuple[List[JobResponse], Optional[str]]:
+        """특정 프로젝트의 Job 목록 한 페이지를 응답 DTO로 반환합니다.
+
+        Args:
+            project: 프로젝트 이름.
+            limit: 페이지 크기.
+            cursor: 이전 페이지가 반환한 커서. 없으면 첫 페이지.
+            filters: 상태/언어/생성 시각 조건.
+
+        Returns:
+            JobResponse 리스트와 다음 페이지 커서(마지막 페이지면 None).
+
+        Raises:
+            InvalidCursorError: 커서 형식이 맞지 않는 경우.
+        """
+        project_id = self.project_service.get_project_id(project)
+        if project_id is None:
+            return [], None
+
+        query = self._job_query().filter(JobORM.project_id == project_id)
+        job_orms, next_cursor = self._list_page(query, limit, cursor, filters)
+        return self._to_responses(job_orms), next_cursor
     
-    def update_job_status(self, job_id: str, status: JobStatus) -> bool:
-        """Job 상태를 업데이트합니다.
+    def transition_job(
+        self,
+        job_id: str,
+        status: JobStatus,
+        result: Optional[Dict[str, Any]] = None,
+        execution_orm: Optional[ExecutionORM] = None,
+        log_orm: Optional[LogORM] = None,
+        commit: bool = True,
+    ) -> bool:
+        """Job 상태를 전이 규칙에 따라 하나의 조건부 UPDATE로 변경합니다.
+
+        현재 상태가 `status`로 전이할 수 있는 상태일 때만 상태, 시각, 결과, 최신
+        Execution 포인터를 함께 갱신합니다(compare-and-set). 함께 전달된 Execution과
+        로그 행은 같은 트랜잭션에서 INSERT되므로 완료 처리는 한 번의 커밋으로 끝납니다.
 
         Args:
             job_id: 대상 Job ID.
             status: 변경할 상태.
+            result: Job에 저장할 실행 결과 딕셔너리.
+            execution_orm: 함께 저장할 Execution 행.
+            log_orm: 함께 저장할 로그 메타데이터 행.
+            commit: False이면 커밋하지 않고 호출자의 트랜잭션에 남겨 둡니다.
 
         Returns:
-            업데이트 성공 여부.
+            전이 적용 여부. Job이 없거나 현재 상태에서 전이할 수 없으면 False.
         """
-        job_orm = self.db.query(JobORM).filter(JobORM.job_id == job_id).first()
-        if not job_orm:
+        values = self.status_values(status)
+        if result is not None:
+            values[JobORM.result] = result
+
+        pending = [orm for orm in (execution_orm, log_orm) if orm is not None]
+        if execution_orm is not None:
+            values[JobORM.latest_execution_id] = execution_orm.execution_id
+        self.db.add_all(pending)
+
+        updated = self.db.query(JobORM).filter(
+            JobORM.job_id == job_id,
+            JobORM.status.in_(job_status_sources(status)),
+        ).update(values)
+        record_job_transition(status, bool(updated))
+
+        if not updated:
+            for orm in pending:
+                self.db.expunge(orm)
             return False
-        
-        job_orm.status = status
-        job_orm.updated_at = datetime.utcnow()
-        
-        if status == JobStatus.RUNNING:
-            job_orm.started_at = datetime.utcnow()
-        elif status in [JobStatus.SUCCESS, JobStatus.FAILED, JobStatus.TIMEOUT, JobStatus.CANCELLED]:
-            job_orm.completed_at = datetime.utcnow()
-        
-        self.db.commit()
+
+        if commit:
+            self.db.commit()
         return True
+
+    def update_job_status(self, job_id: str, status: JobStatus) -> bool:
+        """Job 상태를 업데이트합니다.
+
+        Args:
+            job_id: 대상 Job ID.
+            status: 변경할 상태.
+
+        Returns:
+            업데이트 성공 여부. 현재 상태에서 전이할 수 없으면 False.
+        """
+        return self.transition_job(job_id, status)
     
+    def update_jobs_status(self, job_ids: List[str], status: JobStatus, commit: bool = True) -> List[str]:
+        """여러 Job의 상태를 전이 규칙에 따라 한 번에 변경하고 실제로 바뀐 Job ID를 반환합니다.
+
+        전이할 수 있는 행을 잠금 읽기(`FOR UPDATE`)로 먼저 골라 동시에 들어온 같은
+        요청이 같은 Job을 두 번 전이시키지 않게 한 뒤, 고른 행만 하나의 UPDATE 문으로
+        변경합니다.
+
+        Args:
+            job_ids: 대상 Job ID 목록.
+            status: 변경할 상태.
+            commit: False이면 커밋하지 않고 호출자의 트랜잭션에 남겨 둡니다.
+
+        Returns:
+            상태가 바뀐 Job ID 목록. 현재 상태에서 전이할 수 없는 Job은 빠집니다.
+        """
+        if not job_ids:
+            return []
+
+        sources = job_status_sources(status)
+        applied = [
+            job_id
+            for (job_id,) in self.db.query(JobORM.job_id).filter(
+                JobORM.job_id.in_(job_ids),
+                JobORM.status.in_(sources),
+            ).with_for_update()
+        ]
+        if applied:
+            self.db.query(JobORM).filter(
+                JobORM.job_id.in_(applied),
+                JobORM.status.in_(sources),
+            ).update(self.status_values(status), synchronize_session=False)
+        if commit:
+            self.db.commit()
+        record_job_transition(status, True, len(applied))
+        record_job_transition(status, False, len(set(job_ids)) - len(applied))
+        return applied
+
+    @staticmethod
+    def status_values(status: JobStatus) -> Dict[Any, Any]:
+        """상태 변경 시 함께 갱신할 컬럼 값을 만듭니다."""
+        now = datetime.utcnow()
+        values: Dict[Any, Any] = {JobORM.status: status, JobORM.updated_at: now}
+        if status == JobStatus.RUNNING:
+            values[JobORM.started_at] = now
+        elif status in TERMINAL_JOB_STATUSES:
+            values[JobORM.completed_at] = now
+        return values
+
     def update_job_result(self, job_id: str, result: Dict[str, Any]) -> bool:
         """실행 결과를 Job에 저장합니다.
 
@@ -126,7 +303,7 @@ class JobService:
         Returns:
             Job 객체 리스트.
         """
-        job_orms = self.db.query(JobORM).order_by(JobORM.created_at.desc()).limit(limit).all()
+        job_orms = self._job_query().order_by(JobORM.created_at.desc()).limit(limit).all()
         return [self._orm_to_dto(job_orm) for job_orm in job_orms]
     
     def to_response(self, job: Job, message: str = "") -> JobResponse:
@@ -134,16 +311,20 @@ class JobService:
         
         최신 execution 정보(log_key, logs_url)도 포함합니다.
         """
-        # 최신 execution 조회
-        job_orm = self.db.query(JobORM).filter(JobORM.job_id == job.job_id).first()
-        log_key = None
-        logs_url = None
-        
-        if job_orm and job_orm.executions:
-            latest_execution = max(job_orm.executions, key=lambda e: e.completed_at)
-            log_key = latest_execution.log_key
-            logs_url = latest_execution.logs_url
-        
+        job_orm = self._job_query().filter(JobORM.job_id == job.job_id).first()
+        latest_execution = self._latest_executions([job_orm]).get(job.job_id) if job_orm else None
+        return self._build_response(job, latest_execution, message)
+
+    def _build_response(
+        self,
+        job: Job,
+        latest_execution: Optional[ExecutionORM],
+        message: str = "",
+    ) -> JobResponse:
+        """Job DTO와 최신 Execution으로 JobResponse를 만듭니다."""
+        log_key = latest_execution.log_key if latest_execution else None
+        logs_url = latest_execution.logs_url if latest_execution else None
+
         data: Dict[str, Any] = {
             "created_at": job.created_at.isoformat(),
             "updated_at": job.updated_at.isoformat(),
@@ -167,12 +348,139 @@ class JobService:
             data=data,
         )
     
-    def _orm_to_dto(self, job_orm: JobORM) -> Job:
-        """JobORM을 Job DTO로 변환합니다."""
+    def get_job_status(self, job_id: str) -> Optional[JobStatusResponse]:
+        """Job의 현재 상태와 최신 실행의 로그 정보를 조회합니다.
+
+        Args:
+            job_id: 조회할 Job ID.
+
+        Returns:
+            Job 상태 응답 DTO 또는 None.
+        """
+        job_orm = self._job_query().filter(JobORM.job_id == job_id).first()
+        if not job_orm:
+            return None
+
+        job = self._orm_to_dto(job_orm)
+
+        latest_execution = self._latest_executions([job_orm]).get(job_id)
+        log_key = latest_execution.log_key if latest_execution else None
+        logs_url = latest_execution.logs_url if latest_execution else None
+
+        return JobStatusResponse(
+            job_id=job.job_id,
+            status=job.status,
+            project=job.project,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            completed_at=job.completed_at,
+            timeout_ms=job.timeout_ms,
+            log_key=log_key,
+            logs_url=logs_url,
+        )
+
+    def _job_query(self) -> Query:
+        """프로젝트와 최신 Execution을 함께 읽는 Job 쿼리를 만듭니다."""
+        return self.db.query(JobORM).options(
+            joinedload(JobORM.project_rel),
+            joinedload(JobORM.latest_execution),
+        )
+
+    def _list_page(
+        self,
+        query: Query,
+        limit: int,
+        cursor: Optional[str],
+        filters: Optional[JobListFilter],
+    ) -> Tuple[List[JobORM], Optional[str]]:
+        """조건과 커서를 적용해 Job 한 페이지와 다음 커서를 조회합니다.
+
+        정렬 키 `(created_at, job_id)`는 `ix_jobs_created_at` 인덱스(InnoDB 보조 인덱스는
+        기본 키를 포함)로 그대로 탐색되고, 상태 조건은 `ix_jobs_project_id_status`를
+        사용할 수 있습니다. 다음 페이지 존재 여부는 한 행을 더 읽어 판단합니다.
+        """
+        if filters is not None:
+            if filters.status is not None:
+                query = query.filter(JobORM.status == filters.status)
+            if filters.language:
+                query = query.filter(JobORM.language == filters.language)
+            if filters.created_after is not None:
+                query = query.filter(JobORM.created_at >= filters.created_after)
+            if filters.created_before is not None:
+                query = query.filter(JobORM.created_at < filters.created_before)
+
+        if cursor:
+            created_at, job_id = decode_job_cursor(cursor)
+            query = query.filter(or_(
+                JobORM.created_at < created_at,
+                and_(JobORM.created_at == created_at, JobORM.job_id < job_id),
+            ))
+
+        job_orms = query.order_by(
+            JobORM.created_at.desc(),
+            JobORM.job_id.desc(),
+        ).limit(limit + 1).all()
+
+        if len(job_orms) <= limit:
+            return job_orms, None
+        job_orms = job_orms[:limit]
+        last = job_orms[-1]
+        return job_orms, encode_job_cursor(last.created_at, last.job_id)
+
+    def _to_responses(self, job_orms: List[JobORM]) -> List[JobResponse]:
+        """JobORM 목록을 JobResponse 목록으로 변환합니다."""
+        latest = self._latest_executions(job_orms)
+        return [
+            self._build_response(self._orm_to_dto(job_orm), latest.get(job_orm.job_id))
+            for job_orm in job_orms
+        ]
+
+    def _latest_executions(self, job_orms: List[JobORM]) -> Dict[str, ExecutionORM]:
+        """Job별 최신 Execution을 조회합니다.
+
+        `latest_execution_id` 포인터가 있으면 함께 읽어 둔 관계를 사용하고,
+        포인터가 없는 이전 데이터만 Job별 최대 `completed_at` 기준으로 한 번에 조회합니다.
+
+        Args:
+            job_orms: `_job_query`로 읽은 JobORM 목록.
+
+        Returns:
+            Job ID를 키로 하는 ExecutionORM 딕셔너리.
+        """
+        latest: Dict[str, ExecutionORM] = {}
+        missing: List[str] = []
+        for job_orm in job_orms:
+            if job_orm.latest_execution is not None:
+                latest[job_orm.job_id] = job_orm.latest_execution
+            else:
+                missing.append(job_orm.job_id)
+
+        if missing:
+            newest = self.db.query(
+                ExecutionORM.job_id,
+                func.max(ExecutionORM.completed_at).label("completed_at"),
+            ).filter(ExecutionORM.job_id.in_(missing)).group_by(ExecutionORM.job_id).subquery()
+
+            execution_orms = self.db.query(ExecutionORM).join(
+                newest,
+                (ExecutionORM.job_id == newest.c.job_id)
+                & (ExecutionORM.completed_at == newest.c.completed_at),
+            ).all()
+            for execution_orm in execution_orms:
+                latest[execution_orm.job_id] = execution_orm
+
+        return latest
+
+    def _orm_to_dto(self, job_orm: JobORM, project: Optional[str] = None) -> Job:
+        """JobORM을 Job DTO로 변환합니다.
+
+        프로젝트 이름을 이미 알고 있으면 `project_rel`을 로딩하지 않습니다.
+        """
         return Job(
             job_id=job_orm.job_id,
-            project=job_orm.project_rel.project,
+            project=project or job_orm.project_rel.project,
             code_key=job_orm.code_key,
+            code_hash=job_orm.code_hash,
             language=job_orm.language,
             status=job_orm.status,
             created_at=job_orm.created_at,
@@ -182,3 +490,80 @@ class JobService:
             timeout_ms=job_orm.timeout_ms,
             result=job_orm.result
         )
+
+
+class AsyncJobService(AsyncServiceAdapter[JobService]):
+    """`AsyncSession` 위에서 동작하는 JobService의 비동기 버전입니다."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        """비동기 데이터베이스 세션을 초기화합니다."""
+        super().__init__(db, JobService(db.sync_session))
+
+    async def create_job(self, code_request: CodeUploadRequest, code_key: str) -> Job:
+        """코드 업로드 요청으로 Job을 생성합니다."""
+        return await self._run(self.sync.create_job, code_request, code_key)
+
+    async def get_job(self, job_id: str) -> Optional[Job]:
+        """Job ID로 Job을 조회합니다."""
+        return await self._run(self.sync.get_job, job_id)
+
+    async def get_jobs(self, job_ids: List[str]) -> Dict[str, Job]:
+        """여러 Job을 한 번의 쿼리로 조회합니다."""
+        return await self._run(self.sync.get_jobs, job_ids)
+
+    async def get_job_status(self, job_id: str) -> Optional[JobStatusResponse]:
+        """Job의 현재 상태와 최신 실행의 로그 정보를 조회합니다."""
+        return await self._run(self.sync.get_job_status, job_id)
+
+    async def transition_job(
+        self,
+        job_id: str,
+        status: JobStatus,
+        result: Optional[Dict[str, Any]] = None,
+        execution_orm: Optional[ExecutionORM] = None,
+        log_orm: Optional[LogORM] = None,
+    ) -> bool:
+        """Job 상태를 전이 규칙에 따라 하나의 조건부 UPDATE로 변경합니다."""
+        return await self._run(
+            self.sync.transition_job,
+            job_id,
+            status,
+            result=result,
+            execution_orm=execution_orm,
+            log_orm=log_orm,
+        )
+
+    async def update_job_status(self, job_id: str, status: JobStatus) -> bool:
+        """Job 상태를 업데이트합니다."""
+        return await self._run(self.sync.update_job_status, job_id, status)
+
+    async def update_jobs_status(self, job_ids: List[str], status: JobStatus) -> List[str]:
+        """여러 Job의 상태를 전이 규칙에 따라 한 번에 변경하고 실제로 바뀐 Job ID를 반환합니다."""
+        return await self._run(self.sync.update_jobs_status, job_ids, status)
+
+    async def update_job_result(self, job_id: str, result: Dict[str, Any]) -> bool:
+        """실행 결과를 Job에 저장합니다."""
+        return await self._run(self.sync.update_job_result, job_id, result)
+
+    async def to_response(self, job: Job, message: str = "") -> JobResponse:
+        """Job DTO를 JobResponse로 변환합니다."""
+        return await self._run(self.sync.to_response, job, message)
+
+    async def list_job_responses(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: Optional[JobListFilter] = None,
+    ) -> Tuple[List[JobResponse], Optional[str]]:
+        """Job 목록 한 페이지를 응답 DTO와 다음 커서로 반환합니다."""
+        return await self._run(self.sync.list_job_responses, limit, cursor, filters)
+
+    async def list_job_responses_by_project(
+        self,
+        project: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: Optional[JobListFilter] = None,
+    ) -> Tuple[List[JobResponse], Optional[str]]:
+        """특정 프로젝트의 Job 목록 한 페이지를 응답 DTO와 다음 커서로 반환합니다."""
+        return await self._run(self.sync.list_job_responses_by_project, project, limit, cursor, filters)
@@ -0,0 +1,205 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.models.log import LogCacheStats
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LogObjectCache:
+    """한 번 쓰이면 바뀌지 않는 로그 객체를 위한 2단계 읽기 캐시입니다.
+
+    메모리 계층은 바이트 합계로 제한되는 LRU이고, 메모리에서 밀려난 항목은
+    디스크 계층으로 내려갑니다. 디스크 계층도 자체 크기 한도를 넘으면 가장
+    오래 사용되지 않은 파일부터 삭제합니다. 로그 객체는 불변이므로 TTL은 두지 않습니다.
+    """
+
+    def __init__(
+        self,
+        memory_max_bytes: Optional[int] = None,
+        disk_max_bytes: Optional[int] = None,
+        disk_dir: Optional[str] = None,
+        max_object_bytes: Optional[int] = None,
+    ) -> None:
+        """계층별 크기 한도와 디스크 디렉터리를 초기화합니다."""
+        self.memory_max_bytes = memory_max_bytes or settings.LOG_CACHE_MEMORY_MAX_BYTES
+        self.disk_max_bytes = settings.LOG_CACHE_DISK_MAX_BYTES if disk_max_bytes is None else disk_max_bytes
+        self.disk_dir = disk_dir or settings.LOG_CACHE_DIR or os.path.join(
+            tempfile.gettempdir(), "service-server-log-cache"
+        )
+        self.max_object_bytes = max_object_bytes or settings.LOG_CACHE_MAX_OBJECT_BYTES
+        self._memory: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_loaded = False
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, memory_only: bool = False) -> Optional[str]:
+        """캐시된 로그 내용을 반환합니다.
+
+        디스크 계층에서 찾은 항목은 메모리 계층으로 다시 올립니다.
+
+        Args:
+            key: 로그 객체 키.
+            memory_only: True이면 메모리 계층만 확인하고 미적중으로 세지 않습니다.
+
+        Returns:
+            로그 내용 문자열 또는 없으면 None.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return entry[0]
+            if memory_only:
+                return None
+
+        content = self._read_disk(key)
+        with self._lock:
+            if content is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        self._put_memory(key, content)
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        """로그 내용을 메모리 계층에 저장합니다. 한도를 넘는 객체는 저장하지 않습니다."""
+        if len(content.encode("utf-8")) > self.max_object_bytes:
+            return
+        self._put_memory(key, content)
+
+    def clear(self) -> None:
+        """두 계층의 모든 항목을 제거합니다."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            for name in list(self._disk):
+                self._remove_file(name)
+            self._disk.clear()
+            self._disk_bytes = 0
+
+    def stats(self) -> LogCacheStats:
+        """계층별 크기와 적중 통계를 반환합니다."""
+        with self._lock:
+            self._load_disk_index()
+            return LogCacheStats(
+                memory_entries=len(self._memory),
+                memory_bytes=self._memory_bytes,
+                memory_max_bytes=self.memory_max_bytes,
+                disk_entries=len(self._disk),
+                disk_bytes=self._disk_bytes,
+                disk_max_bytes=self.disk_max_bytes,
+                memory_hits=self.memory_hits,
+                disk_hits=self.disk_hits,
+                misses=self.misses,
+                evictions=self.evictions,
+            )
+
+    def _put_memory(self, key: str, content: str) -> None:
+        """메모리 계층에 저장하고, 밀려난 항목을 디스크 계층으로 내립니다."""
+        size = len(content.encode("utf-8"))
+        demoted = []
+        with self._lock:
+            if key in self._memory:
+                self._memory_bytes -= self._memory.pop(key)[1]
+            self._memory[key] = (content, size)
+            self._memory_bytes += size
+            while self._memory and self._memory_bytes > self.memory_max_bytes:
+                old_key, (old_content, old_size) = self._memory.popitem(last=False)
+                self._memory_bytes -= old_size
+                demoted.append((old_key, old_content))
+
+        for old_key, old_content in demoted:
+            self._write_disk(old_key, old_content)
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        """디스크 계층에서 항목을 읽습니다."""
+        if self.disk_max_bytes <= 0:
+            return None
+        name = self._file_name(key)
+        with self._lock:
+            self._load_disk_index()
+            if name not in self._disk:
+                return None
+            self._disk.move_to_end(name)
+        try:
+            with open(os.path.join(self.disk_dir, name), "rb") as f:
+                return f.read().decode("utf-8")
+        except OSError:
+            with self._lock:
+                self._disk_bytes -= self._disk.pop(name, 0)
+            return None
+
+    def _write_disk(self, key: str, content: str) -> None:
+        """디스크 계층에 항목을 쓰고 크기 한도를 넘는 파일을 삭제합니다."""
+        data = content.encode("utf-8")
+        if self.disk_max_bytes <= 0 or len(data) > self.disk_max_bytes:
+            return
+        name = self._file_name(key)
+        path = os.path.join(self.disk_dir, name)
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            # 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체합니다.
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.exception("Failed to write log cache file for %s", key)
+            return
+
+        with self._lock:
+            self._load_disk_index()
+            self._disk_bytes -= self._disk.pop(name, 0)
+            self._disk[name] = len(data)
+            self._disk_bytes += len(data)
+            while self._disk and self._disk_bytes > self.disk_max_bytes:
+                old_name, old_size = self._disk.popitem(last=False)
+                self._disk_bytes -= old_size
+                self._remove_file(old_name)
+                self.evictions += 1
+
+    def _load_disk_index(self) -> None:
+        """이전 프로세스가 남긴 캐시 파일을 수정 시각 순으로 인덱스에 올립니다.
+
+        잠금을 잡은 상태에서 호출해야 합니다.
+        """
+        if self._disk_loaded:
+            return
+        self._disk_loaded = True
+        try:
+            entries = [e for e in os.scandir(self.disk_dir) if e.is_file() and not e.name.endswith(".tmp")]
+        except OSError:
+            return
+        for entry in sorted(entries, key=lambda e: e.stat().st_mtime):
+            size = entry.stat().st_size
+            self._disk[entry.name] = size
+            self._disk_bytes += size
+
+    def _remove_file(self, name: str) -> None:
+        """캐시 파일을 삭제합니다."""
+        try:
+            os.remove(os.path.join(self.disk_dir, name))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _file_name(key: str) -> str:
+        """로그 키를 디스크 파일 이름으로 변환합니다."""
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+log_object_cache = LogObjectCache()
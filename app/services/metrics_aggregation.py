@@ -0,0 +1,112 @@
+import re
+import warnings
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+SUPPORTED_METRICS = ("cpu", "memory")
+SUPPORTED_STATS = ("mean", "min", "max", "sum", "count", "std", "rolling_mean")
+_PERCENTILE_STAT = re.compile(r"^p(\d{1,2}(?:\.\d+)?)$")
+
+
+def validate_stats(stats: Sequence[str]) -> List[str]:
+    """통계 이름을 검증합니다. `p50`, `p99.9`처럼 `p` + 백분위수도 허용합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 통계 이름이 있는 경우.
+    """
+    invalid = [s for s in stats if s not in SUPPORTED_STATS and not _PERCENTILE_STAT.match(s)]
+    if invalid:
+        raise ValueError(f"Unsupported stats: {', '.join(invalid)}")
+    return list(dict.fromkeys(stats))
+
+
+def aggregate_series(
+    timestamps: np.ndarray,
+    series: Dict[str, np.ndarray],
+    bucket_seconds: int,
+    stats: Sequence[str],
+    rolling_window: int = 3,
+) -> Tuple[np.ndarray, Dict[str, Dict[str, np.ndarray]]]:
+    """시계열을 고정 크기 구간으로 나누고 구간별 통계를 계산합니다.
+
+    각 시계열을 (구간 수 × 구간 내 최대 포인트 수) 행렬에 NaN으로 채워 넣은 뒤
+    축 단위 NumPy 연산으로 모든 구간의 통계를 한 번에 계산합니다. 포인트가 없는
+    구간은 결과에 포함되지 않습니다.
+
+    Args:
+        timestamps: epoch 초 배열.
+        series: 메트릭 이름 → 값 배열 (결측값은 NaN).
+        bucket_seconds: 구간 크기(초). 구간은 epoch 기준으로 정렬됩니다.
+        stats: 계산할 통계 이름 목록.
+        rolling_window: `rolling_mean`에 사용할 구간 수.
+
+    Returns:
+        구간 시작 시각(epoch 초) 배열과 메트릭 → 통계 → 구간별 값 배열.
+    """
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    if timestamps.size == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, {name: {stat: empty for stat in stats} for name in series}
+
+    order = np.argsort(timestamps, kind="stable")
+    bucket_ids = np.floor_divide(timestamps[order], bucket_seconds).astype(np.int64)
+    unique_ids, inverse, counts = np.unique(bucket_ids, return_inverse=True, return_counts=True)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    positions = np.arange(bucket_ids.size) - starts[inverse]
+
+    results: Dict[str, Dict[str, np.ndarray]] = {}
+    for name, values in series.items():
+        matrix = np.full((unique_ids.size, int(counts.max())), np.nan)
+        matrix[inverse, positions] = np.asarray(values, dtype=np.float64)[order]
+        results[name] = _bucket_stats(matrix, stats, rolling_window)
+
+    return unique_ids.astype(np.float64) * bucket_seconds, results
+
+
+def _bucket_stats(matrix: np.ndarray, stats: Sequence[str], rolling_window: int) -> Dict[str, np.ndarray]:
+    """구간 행렬의 행마다 통계를 계산합니다."""
+    computed: Dict[str, np.ndarray] = {}
+    with warnings.catch_warnings():
+        # 값이 모두 NaN인 구간의 경고는 무시하고 NaN을 그대로 반환합니다.
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+
+        count = np.count_nonzero(~np.isnan(matrix), axis=1)
+        mean = np.nanmean(matrix, axis=1)
+
+        percentiles = [s for s in stats if _PERCENTILE_STAT.match(s)]
+        if percentiles:
+            qs = [float(_PERCENTILE_STAT.match(s).group(1)) for s in percentiles]
+            values = np.nanpercentile(matrix, qs, axis=1)
+            computed.update(zip(percentiles, values))
+
+        for stat in stats:
+            if stat == "mean":
+                computed[stat] = mean
+            elif stat == "min":
+                computed[stat] = np.nanmin(matrix, axis=1)
+            elif stat == "max":
+                computed[stat] = np.nanmax(matrix, axis=1)
+            elif stat == "sum":
+                computed[stat] = np.where(count > 0, np.nansum(matrix, axis=1), np.nan)
+            elif stat == "count":
+                computed[stat] = count.astype(np.float64)
+            elif stat == "std":
+                computed[stat] = np.nanstd(matrix, axis=1)
+            elif stat == "rolling_mean":
+                computed[stat] = _rolling_mean(mean, rolling_window)
+
+    return computed
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """NaN을 제외한 후행(trailing) 이동 평균을 누적합으로 계산합니다."""
+    present = ~np.isnan(values)
+    value_sums = np.concatenate(([0.0], np.cumsum(np.where(present, values, 0.0))))
+    value_counts = np.concatenate(([0], np.cumsum(present)))
+
+    upper = np.arange(1, values.size + 1)
+    lower = np.maximum(upper - window, 0)
+    sums = value_sums[upper] - value_sums[lower]
+    counts = value_counts[upper] - value_counts[lower]
+    return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
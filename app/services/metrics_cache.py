@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class MetricsCache(Generic[T]):
+    """CloudWatch 메트릭 조회 결과를 위한 TTL 캐시입니다.
+
+    항목은 메트릭 주기(period)의 다음 경계까지 유효합니다. 같은 키의 조회가 동시에
+    들어오면 상류 호출 하나를 공유하고(single-flight), 상류 호출이 실패하면
+    허용 기간 안의 만료된 값을 대신 반환합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        min_ttl_seconds: Optional[float] = None,
+        publish_delay_seconds: Optional[float] = None,
+        max_stale_seconds: Optional[float] = None,
+    ) -> None:
+        """항목 수 한도와 유효 시간 규칙을 초기화합니다."""
+        self.max_entries = max_entries or settings.CLOUDWATCH_CACHE_MAX_ENTRIES
+        self.min_ttl_seconds = settings.CLOUDWATCH_CACHE_MIN_TTL_SECONDS if min_ttl_seconds is None else min_ttl_seconds
+        self.publish_delay_seconds = (
+            settings.CLOUDWATCH_CACHE_PUBLISH_DELAY_SECONDS if publish_delay_seconds is None else publish_delay_seconds
+        )
+        self.max_stale_seconds = (
+            settings.CLOUDWATCH_CACHE_MAX_STALE_SECONDS if max_stale_seconds is None else max_stale_seconds
+        )
+        # 키 → (만료 시각, 저장 시각, 값). 시각은 time.time() 기준입니다.
+        self._entries: "OrderedDict[Hashable, Tuple[float, float, T]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, "asyncio.Task[T]"] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.stale_served = 0
+
+    def ttl_for(self, period: int, now: Optional[float] = None) -> float:
+        """주기의 다음 경계(+ 게시 지연)까지 남은 시간을 유효 시간으로 계산합니다."""
+        now = time.time() if now is None else now
+        remaining = period - (now % period) + self.publish_delay_seconds
+        return max(remaining, self.min_ttl_seconds)
+
+    async def get_or_fetch(self, key: Hashable, period: int, fetch: Callable[[], Awaitable[T]]) -> T:
+        """캐시된 값을 반환하거나, 없으면 상류를 한 번만 호출해 채웁니다.
+
+        Args:
+            key: 캐시 키.
+            period: 메트릭 주기(초). 유효 시간 계산에 사용합니다.
+            fetch: 상류 호출 코루틴 함수.
+
+        Returns:
+            캐시된 값 또는 새로 조회한 값.
+
+        Raises:
+            Exception: 상류 호출이 실패했고 반환할 수 있는 이전 값도 없는 경우.
+        """
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.create_task(self._fetch(key, period, fetch))
+            self._in_flight[key] = task
+
+        try:
+            # 대기 중인 요청 하나가 취소되어도 공유 중인 상류 호출은 계속되도록 합니다.
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            stale = self._entries.get(key)
+            if stale is not None and time.time() - stale[1] <= self.max_stale_seconds:
+                self.stale_served += 1
+                logger.warning("Serving stale metrics for %s after upstream failure", key)
+                return stale[2]
+            raise
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """항목 수와 적중 통계를 반환합니다."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "stale_served": self.stale_served,
+        }
+
+    async def _fetch(self, key: Hashable, period: int, fetch: Callable[[], Awaitable[T]]) -> T:
+        """상류를 호출하고 결과를 저장합니다."""
+        try:
+            value = await fetch()
+            now = time.time()
+            self._entries[key] = (now + self.ttl_for(period, now), now, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return value
+        finally:
+            self._in_flight.pop(key, None)
+
+
+cluster_metrics_cache: "MetricsCache[list]" = MetricsCache()
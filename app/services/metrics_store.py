@@ -0,0 +1,242 @@
+import asyncio
+import bisect
+import logging
+import math
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.clients.aws_io import AsyncCloudWatchClient
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+NAN = float("nan")
+
+
+def merge_cpu_memory_series(
+    raw: Dict[str, Any],
+) -> Tuple[List[datetime], List[Optional[float]], List[Optional[float]]]:
+    """GetMetricData 응답의 CPU/Memory 시계열을 타임스탬프 순으로 병합합니다.
+
+    두 시계열을 각각 정렬한 뒤 한 번에 훑어 병합하므로 포인트마다 딕셔너리를
+    만들지 않습니다. 한쪽에만 있는 시각의 다른 값은 None입니다.
+
+    Returns:
+        타임스탬프, CPU 사용률, Memory 사용률 리스트.
+    """
+    cpu: List[Tuple[datetime, float]] = []
+    memory: List[Tuple[datetime, float]] = []
+    for metric_result in raw.get("MetricDataResults", []):
+        pairs = sorted(zip(metric_result.get("Timestamps", []), metric_result.get("Values", [])))
+        if metric_result["Id"] == "cpu":
+            cpu = pairs
+        else:
+            memory = pairs
+
+    timestamps: List[datetime] = []
+    cpu_values: List[Optional[float]] = []
+    memory_values: List[Optional[float]] = []
+    i = j = 0
+    while i < len(cpu) or j < len(memory):
+        if j >= len(memory) or (i < len(cpu) and cpu[i][0] < memory[j][0]):
+            ts, cpu_value, memory_value = cpu[i][0], cpu[i][1], None
+            i += 1
+        elif i >= len(cpu) or memory[j][0] < cpu[i][0]:
+            ts, cpu_value, memory_value = memory[j][0], None, memory[j][1]
+            j += 1
+        else:
+            ts, cpu_value, memory_value = cpu[i][0], cpu[i][1], memory[j][1]
+            i += 1
+            j += 1
+        timestamps.append(ts)
+        cpu_values.append(cpu_value)
+        memory_values.append(memory_value)
+
+    return timestamps, cpu_values, memory_values
+
+
+class MetricRingBuffer:
+    """한 클러스터의 CPU/Memory 시계열을 담는 고정 크기 링 버퍼입니다.
+
+    타임스탬프(epoch 초)와 값을 `array('d')` 세 개에 나란히 저장하므로 포인트당
+    24바이트만 사용합니다. 값이 없으면 NaN으로 저장합니다.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """버퍼 용량을 초기화합니다."""
+        self.capacity = capacity
+        self._timestamps = array("d", [0.0]) * capacity
+        self._cpu = array("d", [NAN]) * capacity
+        self._memory = array("d", [NAN]) * capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def first_timestamp(self) -> Optional[float]:
+        """가장 오래된 포인트의 타임스탬프를 반환합니다. 비어 있으면 None."""
+        if not self._size:
+            return None
+        return self._timestamps[self._start]
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        """가장 최근 포인트의 타임스탬프를 반환합니다. 비어 있으면 None."""
+        if not self._size:
+            return None
+        return self._timestamps[(self._start + self._size - 1) % self.capacity]
+
+    def append(self, timestamp: float, cpu: Optional[float], memory: Optional[float]) -> bool:
+        """포인트를 추가합니다. 가장 최근 포인트보다 오래된 포인트는 무시합니다.
+
+        Returns:
+            추가 여부.
+        """
+        last = self.last_timestamp
+        if last is not None and timestamp <= last:
+            return False
+
+        index = (self._start + self._size) % self.capacity
+        if self._size == self.capacity:
+            self._start = (self._start + 1) % self.capacity
+        else:
+            self._size += 1
+
+        self._timestamps[index] = timestamp
+        self._cpu[index] = NAN if cpu is None else cpu
+        self._memory[index] = NAN if memory is None else memory
+        return True
+
+    def window(self, since: float) -> Tuple[array, array, array]:
+        """`since` 이후(포함)의 포인트를 시간 순서의 배열 복사본으로 반환합니다."""
+        timestamps = self._ordered(self._timestamps)
+        offset = bisect.bisect_left(timestamps, since)
+        return (
+            timestamps[offset:],
+            self._ordered(self._cpu)[offset:],
+            self._ordered(self._memory)[offset:],
+        )
+
+    def _ordered(self, values: array) -> array:
+        """링 버퍼 배열을 오래된 순서로 펼칩니다."""
+        end = self._start + self._size
+        if end <= self.capacity:
+            return values[self._start:end]
+        return values[self._start:] + values[: end - self.capacity]
+
+
+class ClusterMetricsPoller:
+    """설정된 클러스터의 CPU/Memory 메트릭을 주기적으로 가져와 메모리에 보관합니다.
+
+    매 주기마다 클러스터별로 마지막으로 받은 시각 이후의 완료된 구간만 조회하고,
+    보관 기간만큼의 포인트를 링 버퍼에 유지합니다. 조회 API는 보관 기간 안의
+    구간을 CloudWatch 호출 없이 이 버퍼에서 응답합니다.
+    """
+
+    def __init__(
+        self,
+        clusters: Optional[List[str]] = None,
+        period: Optional[int] = None,
+        retention_minutes: Optional[int] = None,
+        cw_client: Optional[AsyncCloudWatchClient] = None,
+    ) -> None:
+        """대상 클러스터와 주기, 보관 기간을 초기화합니다."""
+        self.clusters = list(clusters or settings.CLOUDWATCH_POLL_CLUSTERS or [settings.AWS_ECS_CLUSTER_NAME])
+        self.period = period or settings.CLOUDWATCH_POLL_PERIOD_SECONDS
+        self.retention_minutes = retention_minutes or settings.CLOUDWATCH_RETENTION_MINUTES
+        self._cw_client = cw_client
+        self.buffers: Dict[str, MetricRingBuffer] = {
+            cluster: MetricRingBuffer(self.retention_minutes * 60 // self.period)
+            for cluster in self.clusters
+        }
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def cw_client(self) -> AsyncCloudWatchClient:
+        """CloudWatch 클라이언트를 필요할 때 생성합니다."""
+        if self._cw_client is None:
+            self._cw_client = AsyncCloudWatchClient()
+        return self._cw_client
+
+    @property
+    def running(self) -> bool:
+        """폴링 작업이 실행 중인지 여부를 반환합니다."""
+        return self._task is not None
+
+    def start(self) -> None:
+        """폴링 작업을 시작합니다."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="cloudwatch-metrics-poller")
+
+    async def stop(self) -> None:
+        """폴링 작업을 중지합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def covers(self, cluster_name: str, minutes: int, period: int) -> bool:
+        """요청한 구간을 버퍼에서 응답할 수 있는지 확인합니다.
+
+        주기와 보관 기간이 맞더라도, 폴링이 실패해 최근 포인트가 두 주기보다 오래됐거나
+        버퍼가 요청한 구간의 시작까지 채워지지 않았으면 False를 반환해 호출자가
+        캐시나 CloudWatch 조회로 넘어가게 합니다.
+        """
+        buffer = self.buffers.get(cluster_name)
+        if buffer is None or period != self.period or minutes > self.retention_minutes:
+            return False
+
+        first, last = buffer.first_timestamp, buffer.last_timestamp
+        if first is None or last is None:
+            return False
+
+        now = datetime.now(timezone.utc).timestamp()
+        # 포인트는 구간 시작 시각으로 기록되므로 첫 포인트는 한 주기만큼 늦을 수 있습니다.
+        return last >= now - 2 * self.period and first <= now - minutes * 60 + self.period
+
+    def window(self, cluster_name: str, minutes: int) -> Tuple[array, array, array]:
+        """최근 N분 동안의 타임스탬프와 CPU/Memory 배열을 반환합니다."""
+        since = datetime.now(timezone.utc).timestamp() - minutes * 60
+        return self.buffers[cluster_name].window(since)
+
+    async def poll_once(self) -> None:
+        """모든 클러스터에 대해 새 포인트를 한 번 가져옵니다."""
+        for cluster_name in self.clusters:
+            try:
+                await self._poll_cluster(cluster_name)
+            except Exception:
+                logger.warning("Failed to poll CloudWatch metrics for %s", cluster_name, exc_info=True)
+
+    async def _run(self) -> None:
+        """주기마다 폴링합니다."""
+        while True:
+            await self.poll_once()
+            await asyncio.sleep(self.period)
+
+    async def _poll_cluster(self, cluster_name: str) -> None:
+        """마지막으로 받은 시각 이후의 완료된 구간을 조회해 버퍼에 추가합니다."""
+        buffer = self.buffers[cluster_name]
+        now = datetime.now(timezone.utc).timestamp()
+        # 아직 값이 바뀔 수 있는 진행 중인 구간은 제외합니다.
+        end = math.floor(now / self.period) * self.period
+        last = buffer.last_timestamp
+        start = last + self.period if last is not None else end - self.retention_minutes * 60
+        if start >= end:
+            return
+
+        raw = await self.cw_client.get_cpu_memory_timeseries(
+            cluster_name=cluster_name,
+            period=self.period,
+            start_time=datetime.fromtimestamp(start, timezone.utc),
+            end_time=datetime.fromtimestamp(end, timezone.utc),
+        )
+        timestamps, cpu_values, memory_values = merge_cpu_memory_series(raw)
+        for ts, cpu, memory in zip(timestamps, cpu_values, memory_values):
+            buffer.append(ts.timestamp(), cpu, memory)
+
+
+cluster_metrics_poller = ClusterMetricsPoller()
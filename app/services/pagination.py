@@ -0,0 +1,49 @@
+import base64
+from datetime import datetime
+from typing import Tuple
+
+import orjson
+
+
+class InvalidCursorError(ValueError):
+    """페이지 커서를 해석할 수 없을 때 발생합니다."""
+
+
+def encode_job_cursor(created_at: datetime, job_id: str) -> str:
+    """Job 목록의 마지막 행으로 다음 페이지 커서를 만듭니다.
+
+    Args:
+        created_at: 마지막 행의 생성 시각.
+        job_id: 마지막 행의 Job ID.
+
+    Returns:
+        URL에 그대로 쓸 수 있는 불투명 커서 문자열.
+    """
+    payload = orjson.dumps([created_at.isoformat(), job_id])
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_job_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Job 목록 커서를 `(created_at, job_id)`로 해석합니다.
+
+    Raises:
+        InvalidCursorError: 형식이 맞지 않는 경우.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, job_id = orjson.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(job_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+def decode_project_cursor(cursor: str) -> int:
+    """프로젝트 목록 커서를 마지막 프로젝트 ID로 해석합니다.
+
+    Raises:
+        InvalidCursorError: 형식이 맞지 않는 경우.
+    """
+    try:
+        return int(cursor)
+    except ValueError as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
@@ -0,0 +1,156 @@
+import cProfile
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs
+
+from config.settings import settings
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_FILE_HEADER = b"x-profile-file"
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class ProfilerBusyError(Exception):
+    """다른 프로파일링이 이미 진행 중일 때 발생합니다."""
+
+
+def profiling_token_valid(token: Optional[str]) -> bool:
+    """프로파일링 토큰이 설정되어 있으면 전달된 값과 일치하는지 확인합니다."""
+    return not settings.PROFILING_TOKEN or token == settings.PROFILING_TOKEN
+
+
+class RequestProfilingMiddleware:
+    """`X-Profile` 헤더나 `profile` 쿼리 파라미터가 있는 요청만 cProfile로 측정하는 ASGI 미들웨어입니다.
+
+    결과는 `.prof` 파일로 저장되고(`snakeviz`, `pstats`로 열 수 있음) 파일 경로는
+    `X-Profile-File` 응답 헤더로 알려 줍니다. cProfile은 스레드 단위로 동작하므로
+    이벤트 루프에서 실행되는 코드(라우트, `run_sync`로 실행되는 동기 서비스,
+    pydantic 변환)는 측정되지만 AWS 실행기 스레드의 boto3 호출은 대기 시간으로만
+    나타납니다. 측정 중에는 같은 루프의 다른 요청도 함께 기록되므로 한 번에 한
+    요청만 측정하며, 이미 측정 중이면 프로파일 없이 처리합니다.
+    """
+
+    def __init__(self, app: Any, output_dir: Optional[str] = None) -> None:
+        """다음 ASGI 앱과 프로파일 저장 디렉터리를 초기화합니다."""
+        self.app = app
+        self.output_dir = output_dir or settings.PROFILING_DIR or os.path.join(
+            tempfile.gettempdir(), "service-server-profiles"
+        )
+        self._active = False
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or self._active or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        path = os.path.join(self.output_dir, self._filename(scope))
+
+        async def send_with_header(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (PROFILE_FILE_HEADER, path.encode("utf-8"))
+                ]
+            await send(message)
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_with_header)
+        finally:
+            profiler.disable()
+            self._active = False
+            os.makedirs(self.output_dir, exist_ok=True)
+            profiler.dump_stats(path)
+
+    @staticmethod
+    def _requested(scope: Dict[str, Any]) -> bool:
+        """요청이 프로파일링을 요청했고 토큰이 맞는지 확인합니다."""
+        token: Optional[str] = None
+        for name, value in scope.get("headers", []):
+            if name == PROFILE_HEADER:
+                token = value.decode("latin-1")
+                break
+        else:
+            query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+            if "profile" not in query:
+                return False
+            token = query["profile"][0]
+
+        return profiling_token_valid(token)
+
+    @staticmethod
+    def _filename(scope: Dict[str, Any]) -> str:
+        """요청 시각과 경로로 프로파일 파일 이름을 만듭니다."""
+        path = _UNSAFE_FILENAME_CHARS.sub("_", scope.get("path", "").strip("/")) or "root"
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+        return f"{stamp}-{scope.get('method', 'GET')}-{path[:80]}-{uuid.uuid4().hex[:8]}.prof"
+
+
+class SamplingProfiler:
+    """모든 스레드의 호출 스택을 주기적으로 수집하는 샘플링 프로파일러입니다.
+
+    별도 스레드에서 `sys._current_frames()`를 읽기만 하므로 측정 대상 코드에
+    훅을 걸지 않고, 간격에 비례하는 낮은 오버헤드로 운영 환경에서도 실행할 수
+    있습니다. 결과는 flamegraph.pl, speedscope 등이 읽는 collapsed stack 형식
+    (`스레드;모듈:함수;... 샘플수`)으로 반환합니다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def sample(self, seconds: float, interval: float) -> str:
+        """지정한 시간 동안 스택을 수집해 collapsed stack 문자열로 반환합니다.
+
+        Args:
+            seconds: 수집 시간(초).
+            interval: 샘플 간격(초).
+
+        Returns:
+            한 줄에 하나씩 `스택 샘플수` 형식의 문자열.
+
+        Raises:
+            ProfilerBusyError: 다른 수집이 진행 중인 경우.
+        """
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("Sampling profiler is already running")
+        try:
+            return self._collapse(self._collect(seconds, interval))
+        finally:
+            self._lock.release()
+
+    @staticmethod
+    def _collect(seconds: float, interval: float) -> Counter:
+        """스택별 샘플 수를 집계합니다."""
+        own_id = threading.get_ident()
+        counts: Counter = Counter()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}")
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                counts[";".join(reversed(stack))] += 1
+            time.sleep(interval)
+        return counts
+
+    @staticmethod
+    def _collapse(counts: Counter) -> str:
+        """집계 결과를 샘플 수가 많은 순서의 collapsed stack 문자열로 만듭니다."""
+        return "".join(f"{stack} {count}\n" for stack, count in counts.most_common())
+
+
+sampling_profiler = SamplingProfiler()
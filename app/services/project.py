@@ -1,6 +1,10 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from app.schemas.project import ProjectORM
 from app.models.project import ProjectResponse
+from app.services.base import AsyncServiceAdapter
+from app.services.project_cache import ProjectCache, project_cache
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
@@ -10,12 +14,18 @@ class ProjectService:
     프로젝트 생성, 조회, 목록 조회 등의 작업을 처리합니다.
     """
     
-    def __init__(self, db: Session) -> None:
-        """데이터베이스 세션을 초기화합니다."""
+    def __init__(self, db: Session, cache: Optional[ProjectCache] = None) -> None:
+        """데이터베이스 세션과 프로젝트 캐시를 초기화합니다."""
         self.db = db
+        self.cache = cache or project_cache
     
     def get_or_create_project(self, project_name: str, description: Optional[str] = None) -> ProjectORM:
         """프로젝트를 조회하거나 없으면 생성합니다.
+
+        여러 요청이 같은 이름으로 동시에 생성하면 UNIQUE 제약에 걸린 쪽이
+        savepoint만 되돌리고 먼저 생성된 행을 다시 조회합니다. 다시 조회할 때는
+        잠금 읽기(`FOR UPDATE`)를 사용하므로 REPEATABLE READ 트랜잭션의 스냅샷에
+        가려지지 않고 다른 요청이 방금 커밋한 행을 읽습니다.
         
         Args:
             project_name: 프로젝트 이름.
@@ -31,10 +41,54 @@ class ProjectService:
                 project=project_name,
                 description=description
             )
-            self.db.add(project_orm)
-            self.db.commit()
+            try:
+                with self.db.begin_nested():
+                    self.db.add(project_orm)
+                self.db.commit()
+            except IntegrityError:
+                project_orm = (
+                    self.db.query(ProjectORM)
+                    .filter(ProjectORM.project == project_name)
+                    .with_for_update()
+                    .one()
+                )
         
+        self.cache.put(project_name, project_orm.project_id)
         return project_orm
+
+    def get_or_create_project_id(self, project_name: str, description: Optional[str] = None) -> int:
+        """프로젝트 ID를 캐시에서 찾고, 없을 때만 조회하거나 생성합니다.
+
+        Args:
+            project_name: 프로젝트 이름.
+            description: 새로 생성할 때 사용할 설명 (선택사항).
+
+        Returns:
+            프로젝트 ID.
+        """
+        project_id = self.cache.get(project_name)
+        if project_id is not None:
+            return project_id
+        return self.get_or_create_project(project_name, description).project_id
+
+    def get_project_id(self, project_name: str) -> Optional[int]:
+        """프로젝트 이름으로 프로젝트 ID를 캐시를 거쳐 조회합니다.
+
+        Args:
+            project_name: 프로젝트 이름.
+
+        Returns:
+            프로젝트 ID 또는 없으면 None.
+        """
+        project_id = self.cache.get(project_name)
+        if project_id is not None:
+            return project_id
+
+        project_orm = self.get_project(project_name)
+        if not project_orm:
+            return None
+        self.cache.put(project_name, project_orm.project_id)
+        return project_orm.project_id
     
     def get_project(self, project_name: str) -> Optional[ProjectORM]:
         """프로젝트 이름으로 프로젝트를 조회합니다.
@@ -68,6 +122,21 @@ class ProjectService:
             프로젝트 ORM 엔티티 리스트.
         """
         return self.db.query(ProjectORM).all()
+
+    def list_projects(self, limit: int = 100, after_id: Optional[int] = None) -> List[ProjectORM]:
+        """프로젝트 ID 오름차순으로 한 페이지를 반환합니다.
+
+        Args:
+            limit: 페이지 크기.
+            after_id: 이전 페이지의 마지막 프로젝트 ID. 없으면 첫 페이지.
+
+        Returns:
+            프로젝트 ORM 엔티티 리스트.
+        """
+        query = self.db.query(ProjectORM)
+        if after_id is not None:
+            query = query.filter(ProjectORM.project_id > after_id)
+        return query.order_by(ProjectORM.project_id).limit(limit).all()
     
     def update_project_description(self, project_name: str, description: str) -> bool:
         """프로젝트 설명을 업데이트합니다.
@@ -86,6 +155,7 @@ class ProjectService:
         
         project_orm.description = description
         self.db.commit()
+        self.cache.invalidate(project_name)
         return True
     
     def _orm_to_dto(self, project_orm: ProjectORM) -> ProjectResponse:
@@ -95,3 +165,54 @@ class ProjectService:
             project=project_orm.project,
             description=project_orm.description,
         )
+
+
+class AsyncProjectService(AsyncServiceAdapter[ProjectService]):
+    """`AsyncSession` 위에서 동작하는 ProjectService의 비동기 버전입니다.
+
+    ORM 엔티티 대신 응답 DTO를 반환하여 세션 밖에서 지연 로딩이 일어나지 않게 합니다.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """비동기 데이터베이스 세션을 초기화합니다."""
+        super().__init__(db, ProjectService(db.sync_session))
+
+    async def get_or_create_project(
+        self, project_name: str, description: Optional[str] = None
+    ) -> ProjectResponse:
+        """프로젝트를 조회하거나 없으면 생성합니다."""
+        def load() -> ProjectResponse:
+            return self.sync._orm_to_dto(
+                self.sync.get_or_create_project(project_name, description)
+            )
+
+        return await self._run(load)
+
+    async def get_project_by_id(self, project_id: int) -> Optional[ProjectResponse]:
+        """프로젝트 ID로 프로젝트를 조회합니다."""
+        return await self._run(self.sync.get_project_by_id, project_id)
+
+    async def get_all_projects(self) -> List[ProjectResponse]:
+        """저장된 모든 프로젝트 정보를 반환합니다."""
+        def load() -> List[ProjectResponse]:
+            return [self.sync._orm_to_dto(p) for p in self.sync.get_all_projects()]
+
+        return await self._run(load)
+
+    async def list_projects(
+        self, limit: int = 100, after_id: Optional[int] = None
+    ) -> Tuple[List[ProjectResponse], Optional[str]]:
+        """프로젝트 한 페이지와 다음 페이지 커서를 반환합니다."""
+        def load() -> Tuple[List[ProjectResponse], Optional[str]]:
+            project_orms = self.sync.list_projects(limit=limit + 1, after_id=after_id)
+            next_cursor = None
+            if len(project_orms) > limit:
+                project_orms = project_orms[:limit]
+                next_cursor = str(project_orms[-1].project_id)
+            return [self.sync._orm_to_dto(p) for p in project_orms], next_cursor
+
+        return await self._run(load)
+
+    async def update_project_description(self, project_name: str, description: str) -> bool:
+        """프로젝트 설명을 업데이트합니다."""
+        return await self._run(self.sync.update_project_description, project_name, description)
@@ -0,0 +1,56 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from config.settings import settings
+
+
+class ProjectCache:
+    """프로젝트 이름 → 프로젝트 ID를 프로세스 전체에서 공유하는 TTL 캐시입니다.
+
+    프로젝트는 거의 생성되지 않고 이름과 ID의 대응은 바뀌지 않으므로, 업로드 경로에서
+    매번 `projects` 테이블을 조회하지 않도록 합니다. 다른 프로세스에서 생긴 변경은
+    TTL이 지나면 반영됩니다.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: Optional[int] = None) -> None:
+        """유효 시간과 최대 항목 수를 초기화합니다."""
+        self.ttl_seconds = ttl_seconds or settings.PROJECT_CACHE_TTL_SECONDS
+        self.max_entries = max_entries or settings.PROJECT_CACHE_MAX_ENTRIES
+        self._entries: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, project_name: str) -> Optional[int]:
+        """캐시된 프로젝트 ID를 반환합니다. 없거나 만료되었으면 None."""
+        with self._lock:
+            entry = self._entries.get(project_name)
+            if entry is None:
+                return None
+            expires_at, project_id = entry
+            if expires_at <= time.monotonic():
+                del self._entries[project_name]
+                return None
+            self._entries.move_to_end(project_name)
+            return project_id
+
+    def put(self, project_name: str, project_id: int) -> None:
+        """프로젝트 ID를 저장하고 한도를 넘는 오래된 항목을 제거합니다."""
+        with self._lock:
+            self._entries[project_name] = (time.monotonic() + self.ttl_seconds, project_id)
+            self._entries.move_to_end(project_name)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, project_name: str) -> None:
+        """프로젝트 항목을 제거합니다."""
+        with self._lock:
+            self._entries.pop(project_name, None)
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._entries.clear()
+
+
+project_cache = ProjectCache()
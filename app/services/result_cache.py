@@ -0,0 +1,112 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.models.execution import ExecutionResult, ExecutionResultCacheStats
+from config.settings import settings
+
+
+class ExecutionResultCache:
+    """코드 내용·언어·입력이 같은 실행 결과를 재사용하는 LRU + TTL 캐시입니다.
+
+    키는 코드 해시, 언어, 입력을 합쳐 만든 SHA-256이며, 항목 수와 결과 크기
+    합계가 한도를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """캐시 한도와 유효 시간을 초기화합니다."""
+        self.enabled = settings.EXECUTION_RESULT_CACHE_ENABLED if enabled is None else enabled
+        self.max_entries = max_entries or settings.EXECUTION_RESULT_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or settings.EXECUTION_RESULT_CACHE_MAX_BYTES
+        self.ttl_seconds = ttl_seconds or settings.EXECUTION_RESULT_CACHE_TTL_SECONDS
+        self._entries: "OrderedDict[str, Tuple[float, int, ExecutionResult]]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(code_hash: str, language: str, input_data: Optional[str]) -> str:
+        """코드 해시, 언어, 입력으로 캐시 키를 만듭니다."""
+        payload = json.dumps([code_hash, language.lower(), input_data or ""], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[ExecutionResult]:
+        """캐시된 결과를 반환합니다. 없거나 만료되었으면 None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, _, result = entry
+            if expires_at <= time.monotonic():
+                self._pop(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: str, result: ExecutionResult) -> None:
+        """결과를 저장하고 한도를 넘는 항목을 제거합니다."""
+        size = self._estimate_size(result)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, size, result)
+            self._size_bytes += size
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._size_bytes > self.max_bytes
+            ):
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> ExecutionResultCacheStats:
+        """캐시 상태와 적중 통계를 반환합니다."""
+        with self._lock:
+            return ExecutionResultCacheStats(
+                enabled=self.enabled,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_entries=self.max_entries,
+                max_bytes=self.max_bytes,
+                ttl_seconds=self.ttl_seconds,
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+            )
+
+    def _pop(self, key: str) -> None:
+        """항목을 제거하고 크기 합계를 갱신합니다. 잠금을 잡은 상태에서 호출해야 합니다."""
+        _, size, _ = self._entries.pop(key)
+        self._size_bytes -= size
+
+    @staticmethod
+    def _estimate_size(result: ExecutionResult) -> int:
+        """결과가 차지하는 메모리를 출력 길이 기준으로 추정합니다."""
+        return len(result.stdout) + len(result.stderr) + 512
+
+
+execution_result_cache = ExecutionResultCache()
@@ -1,22 +1,60 @@
-﻿from app.clients.s3 import CodeS3Client, LogS3Client
+﻿import asyncio
+import zlib
+from app.clients.s3 import (
+    CodeS3Client,
+    LogS3Client,
+    LogRangeNotSatisfiableError,
+)
+from app.clients.aws_io import AsyncCodeS3Client, AsyncLogS3Client
 from app.schemas.log import LogORM
-from typing import Optional
+from app.services.base import AsyncServiceAdapter
+from app.services.log_cache import LogObjectCache, log_object_cache
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-import uuid
+from config.settings import settings
+
+
+@dataclass
+class LogStream:
+    """클라이언트로 스트리밍할 로그 본문과 응답 헤더입니다."""
+
+    body: AsyncIterator[bytes]
+    headers: Dict[str, str]
+    media_type: str
+    partial: bool = False
+
+
+async def _gunzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """gzip 청크 스트림을 순서대로 압축 해제합니다."""
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        data = decompressor.decompress(chunk)
+        if data:
+            yield data
+    tail = decompressor.flush()
+    if tail:
+        yield tail
 
 
 class S3Service:
     """S3에 코드와 로그를 저장하고 메타데이터를 RDS에 기록하는 서비스입니다."""
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session, log_cache: Optional[LogObjectCache] = None) -> None:
         """S3 클라이언트와 데이터베이스 세션을 초기화합니다."""
         self.code_client = CodeS3Client()
         self.log_client = LogS3Client()
+        self.async_code_client = AsyncCodeS3Client(self.code_client)
+        self.async_log_client = AsyncLogS3Client(self.log_client)
+        self.log_cache = log_cache or log_object_cache
         self.db = db
     
     async def upload_user_code(self, project: str, code: str, language: str) -> Optional[str]:
         """사용자 코드를 S3에 업로드합니다.
 
+        업로드는 AWS 전용 스레드 풀에서 실행되어 이벤트 루프를 막지 않습니다.
+
         Args:
             project: 프로젝트 이름.
             code: 업로드할 코드 문자열.
@@ -26,12 +64,14 @@ class S3Service:
             생성된 S3 객체 키 또는 실패 시 None.
         """
         try:
-            return self.code_client.upload_code(project, code, language)
+            return await self.async_code_client.upload_code(project, code, language)
         except Exception:
             return None
 
     def get_log_file(self, log_key: str) -> Optional[str]:
         """S3에서 로그 파일을 조회합니다.
+
+        로그 객체는 바뀌지 않으므로 로그 캐시를 먼저 확인하고, 없을 때만 S3에서 읽습니다.
         
         Args:
             log_key: 조회할 로그 파일의 S3 객체 키.
@@ -39,11 +79,116 @@ class S3Service:
         Returns:
             로그 파일 내용 문자열 또는 실패 시 None.
         """
+        content = self.log_cache.get(log_key)
+        if content is not None:
+            return content
         try:
-            return self.log_client.get_log(log_key)
+            content = self.log_client.get_log(log_key)
         except Exception:
             return None
+        if content is not None:
+            self.log_cache.put(log_key, content)
+        return content
     
+    async def get_log_file_async(self, log_key: str) -> Optional[str]:
+        """S3에서 로그 파일을 AWS 전용 스레드 풀에서 조회합니다.
+
+        메모리 캐시 적중은 바로 반환하고, 디스크 캐시 확인과 기록은 별도 스레드에서 수행합니다.
+
+        Args:
+            log_key: 조회할 로그 파일의 S3 객체 키.
+
+        Returns:
+            로그 파일 내용 문자열 또는 실패 시 None.
+        """
+        content = self.log_cache.get(log_key, memory_only=True)
+        if content is None:
+            content = await asyncio.to_thread(self.log_cache.get, log_key)
+        if content is not None:
+            return content
+        try:
+            content = await self.async_log_client.get_log(log_key)
+        except Exception:
+            return None
+        if content is not None:
+            await asyncio.to_thread(self.log_cache.put, log_key, content)
+        return content
+
+    async def open_log_stream(
+        self,
+        log_key: str,
+        byte_range: Optional[str] = None,
+        accept_gzip: bool = False,
+    ) -> LogStream:
+        """로그 객체를 청크 단위로 프록시하는 스트림을 엽니다.
+
+        gzip으로 저장된 객체는 클라이언트가 gzip을 받을 수 있으면 압축된 그대로
+        `Content-Encoding: gzip`으로 전달하고, 아니면 스트리밍하며 압축을 풉니다.
+        Range는 저장된 바이트 기준이므로 압축을 풀어야 하는 경우에는 받지 않습니다.
+
+        Args:
+            log_key: 조회할 로그 파일의 S3 객체 키.
+            byte_range: HTTP Range 헤더 값.
+            accept_gzip: 클라이언트가 gzip 응답을 받을 수 있는지 여부.
+
+        Returns:
+            본문 스트림과 응답 헤더.
+
+        Raises:
+            LogNotFoundError: 객체가 없는 경우.
+            LogRangeNotSatisfiableError: 범위가 객체 크기를 벗어났거나 적용할 수 없는 경우.
+        """
+        obj = await self.async_log_client.open_log(log_key, byte_range)
+        gzipped = obj.get("ContentEncoding") == "gzip"
+        if gzipped and byte_range and not accept_gzip:
+            obj["Body"].close()
+            raise LogRangeNotSatisfiableError(log_key)
+
+        headers = {"Accept-Ranges": "bytes"}
+        if obj.get("ETag"):
+            headers["ETag"] = obj["ETag"]
+        if obj.get("ContentRange"):
+            headers["Content-Range"] = obj["ContentRange"]
+
+        body = self.async_log_client.iter_body(obj["Body"])
+        if gzipped and not accept_gzip:
+            body = _gunzip(body)
+        else:
+            headers["Content-Length"] = str(obj["ContentLength"])
+            if gzipped:
+                headers["Content-Encoding"] = "gzip"
+
+        return LogStream(
+            body=body,
+            headers=headers,
+            media_type=obj.get("ContentType") or "text/plain; charset=utf-8",
+            partial="ContentRange" in obj,
+        )
+
+    async def get_log_tail(self, log_key: str, lines: int) -> bytes:
+        """로그 객체의 마지막 N줄을 객체 끝부분만 읽어 반환합니다.
+
+        Raises:
+            LogNotFoundError: 객체가 없는 경우.
+            ValueError: gzip으로 저장된 객체인 경우.
+        """
+        content, _ = await self.async_log_client.get_log_tail(log_key, lines)
+        return content
+
+    @staticmethod
+    def build_log_metadata(job_id: str, log_key: str, logs_url: Optional[str] = None) -> LogORM:
+        """저장할 로그 메타데이터 행을 만듭니다.
+
+        `logs_url`이 없으면 로그 버킷의 객체 URL을 만들어 채웁니다.
+        """
+        if not logs_url:
+            logs_url = f"https://{settings.AWS_LOG_BUCKET}.s3.{settings.AWS_LOG_REGION}.amazonaws.com/{log_key}"
+        return LogORM(
+            log_key=log_key,
+            job_id=job_id,
+            logs_url=logs_url
+        )
+
     def save_log_metadata(self, job_id: str, log_key: str, logs_url: str) -> bool:
         """로그 메타데이터를 RDS에 저장합니다.
         
@@ -56,14 +201,43 @@ class S3Service:
             저장 성공 여부.
         """
         try:
-            log_orm = LogORM(
-                log_key=log_key,
-                job_id=job_id,
-                logs_url=logs_url
-            )
+            log_orm = self.build_log_metadata(job_id, log_key, logs_url)
             self.db.add(log_orm)
             self.db.commit()
             return True
         except Exception:
+            self.db.rollback()
             return False
-        
\ No newline at end of file
+
+
+class AsyncS3Service(AsyncServiceAdapter[S3Service]):
+    """`AsyncSession` 위에서 동작하는 S3Service의 비동기 버전입니다."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        """S3 클라이언트와 비동기 데이터베이스 세션을 초기화합니다."""
+        super().__init__(db, S3Service(db.sync_session))
+
+    async def upload_user_code(self, project: str, code: str, language: str) -> Optional[str]:
+        """사용자 코드를 S3에 업로드합니다."""
+        return await self.sync.upload_user_code(project, code, language)
+
+    async def get_log_file(self, log_key: str) -> Optional[str]:
+        """S3에서 로그 파일을 조회합니다."""
+        return await self.sync.get_log_file_async(log_key)
+
+    async def open_log_stream(
+        self,
+        log_key: str,
+        byte_range: Optional[str] = None,
+        accept_gzip: bool = False,
+    ) -> LogStream:
+        """로그 객체를 청크 단위로 프록시하는 스트림을 엽니다."""
+        return await self.sync.open_log_stream(log_key, byte_range, accept_gzip)
+
+    async def get_log_tail(self, log_key: str, lines: int) -> bytes:
+        """로그 객체의 마지막 N줄을 반환합니다."""
+        return await self.sync.get_log_tail(log_key, lines)
+
+    async def save_log_metadata(self, job_id: str, log_key: str, logs_url: str) -> bool:
+        """로그 메타데이터를 RDS에 저장합니다."""
+        return await self._run(self.sync.save_log_metadata, job_id, log_key, logs_url)
@@ -0,0 +1,226 @@
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+
+from config.db import QueryStats, start_query_tracking, statement_shape
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 엔진 실행과 AWS 호출은 HTTP 요청보다 길어질 수 있으므로 상한을 넓게 둡니다.
+_LONG_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+ENGINE_REQUEST_SECONDS = Histogram(
+    "engine_request_duration_seconds",
+    "Execution Engine call latency",
+    ["language", "outcome"],
+    buckets=_LONG_BUCKETS,
+)
+AWS_CALL_SECONDS = Histogram(
+    "aws_call_duration_seconds",
+    "AWS API call latency including botocore retries",
+    ["service", "operation", "outcome"],
+    buckets=_LONG_BUCKETS,
+)
+JOB_TRANSITIONS = Counter(
+    "job_status_transitions_total",
+    "Job status transitions by target status",
+    ["status", "outcome"],
+)
+
+STARTUP_SECONDS = Gauge(
+    "app_startup_duration_seconds",
+    "Time spent in each startup phase",
+    ["phase"],
+)
+
+_UNMATCHED_ROUTE = "unmatched"
+_AWS_STARTED_AT = "metrics_started_at"
+
+
+class MetricsMiddleware:
+    """라우트별 요청 지연 시간을 히스토그램에 기록하는 ASGI 미들웨어입니다.
+
+    레이블에는 실제 경로 대신 라우트 템플릿(`/api/jobs/{jobId}`)을 사용하므로
+    Job ID 같은 값이 늘어나도 시계열 수가 늘지 않습니다.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # 라우터가 매칭한 라우트는 같은 scope에 기록됩니다.
+            route = getattr(scope.get("route"), "path", _UNMATCHED_ROUTE)
+            HTTP_REQUEST_SECONDS.labels(scope["method"], route, str(status_code)).observe(
+                time.perf_counter() - started_at
+            )
+
+
+class QueryTimingMiddleware:
+    """요청마다 SQL 실행 횟수와 시간을 집계해 `Server-Timing` 헤더로 붙이는 ASGI 미들웨어입니다.
+
+    `db` 항목에 쿼리 수와 총 시간을, `db-slow-N` 항목에 가장 느린 문장을 담으며,
+    같은 형태의 SELECT가 한 요청에서 여러 번 반복되면 N+1 의심 경고를 남깁니다.
+    응답 시작 이후(스트리밍 본문)에 실행된 쿼리는 헤더에 포함되지 않습니다.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = start_query_tracking()
+
+        async def send_with_timing(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", server_timing_header(stats).encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            for shape, count in stats.repeated_selects(settings.SQL_N_PLUS_ONE_THRESHOLD):
+                logger.warning(
+                    "Possible N+1: %d identical queries in %s %s: %s",
+                    count,
+                    scope["method"],
+                    scope.get("path", ""),
+                    shape[:500],
+                )
+
+
+def server_timing_header(stats: QueryStats) -> str:
+    """쿼리 집계를 `Server-Timing` 헤더 값으로 만듭니다."""
+    entries: List[str] = [f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries"']
+    for index, (elapsed_ms, statement) in enumerate(stats.slowest, start=1):
+        # desc는 따옴표 문자열이므로 헤더에 쓸 수 없는 문자를 걸러 냅니다.
+        desc = statement_shape(statement)[:80].replace("\\", "").replace('"', "'")
+        desc = desc.encode("latin-1", errors="replace").decode("latin-1")
+        entries.append(f'db-slow-{index};dur={elapsed_ms:.1f};desc="{desc}"')
+    return ", ".join(entries)
+
+
+def record_job_transition(status: Any, applied: bool, count: int = 1) -> None:
+    """Job 상태 전이 시도를 적용 여부별로 집계합니다."""
+    if count > 0:
+        JOB_TRANSITIONS.labels(getattr(status, "value", status), "applied" if applied else "rejected").inc(count)
+
+
+def instrument_boto3_client(client: Any) -> None:
+    """boto3 클라이언트의 모든 API 호출 지연 시간을 기록하도록 이벤트 훅을 등록합니다.
+
+    botocore의 `before-call`/`after-call` 이벤트를 사용하므로 S3, CloudWatch 등
+    서비스와 호출 경로(동기·비동기)에 관계없이 재시도를 포함한 시간이 기록됩니다.
+    """
+    service_name = client.meta.service_model.service_name
+
+    def before_call(context: Dict[str, Any], **kwargs: Any) -> None:
+        context[_AWS_STARTED_AT] = time.perf_counter()
+
+    def after_call(model: Any, context: Dict[str, Any], http_response: Any = None, **kwargs: Any) -> None:
+        failed = http_response is not None and http_response.status_code >= 400
+        _observe_aws_call(service_name, model.name, "error" if failed else "ok", context)
+
+    def after_call_error(model: Any, context: Dict[str, Any], **kwargs: Any) -> None:
+        _observe_aws_call(service_name, model.name, "exception", context)
+
+    client.meta.events.register("before-call", before_call)
+    client.meta.events.register("after-call", after_call)
+    client.meta.events.register("after-call-error", after_call_error)
+
+
+def _observe_aws_call(service_name: str, operation: str, outcome: str, context: Dict[str, Any]) -> None:
+    """`before-call`에서 기록한 시작 시각으로 AWS 호출 시간을 기록합니다."""
+    started_at = context.pop(_AWS_STARTED_AT, None)
+    if started_at is not None:
+        AWS_CALL_SECONDS.labels(service_name, operation, outcome).observe(time.perf_counter() - started_at)
+
+
+class RuntimeCollector:
+    """수집 시점에 DB 연결 풀, 실행 워커, 엔진 HTTP 풀 상태를 읽어 오는 수집기입니다.
+
+    값은 `/metrics` 요청 때만 계산되므로 요청 처리 경로에는 비용이 들지 않습니다.
+    """
+
+    def __init__(self, db_engines: Dict[str, Any], dispatcher: Any, engine_pool: Any) -> None:
+        """관찰할 SQLAlchemy 엔진(이름 → 엔진), 실행 디스패처, 엔진 HTTP 풀을 초기화합니다."""
+        self.db_engines = db_engines
+        self.dispatcher = dispatcher
+        self.engine_pool = engine_pool
+
+    def collect(self) -> Iterable[GaugeMetricFamily]:
+        checked_out = GaugeMetricFamily("db_pool_checked_out", "Connections checked out of the pool", labels=["engine"])
+        overflow = GaugeMetricFamily("db_pool_overflow", "Connections opened beyond the pool size", labels=["engine"])
+        size = GaugeMetricFamily("db_pool_size", "Configured pool size", labels=["engine"])
+        for name, engine in self.db_engines.items():
+            pool = getattr(engine, "sync_engine", engine).pool
+            # QueuePool 계열만 통계를 제공합니다.
+            if not hasattr(pool, "checkedout"):
+                continue
+            checked_out.add_metric([name], pool.checkedout())
+            overflow.add_metric([name], max(pool.overflow(), 0))
+            size.add_metric([name], pool.size())
+        yield checked_out
+        yield overflow
+        yield size
+
+        stats = self.dispatcher.stats()
+        in_flight = GaugeMetricFamily("execution_in_flight", "Executions running per language", labels=["language"])
+        queued = GaugeMetricFamily("execution_queued", "Executions waiting per language", labels=["language"])
+        for language, language_stats in stats.languages.items():
+            in_flight.add_metric([language], language_stats.in_flight)
+            queued.add_metric([language], language_stats.queued)
+        yield in_flight
+        yield queued
+
+        engine_in_flight = GaugeMetricFamily(
+            "engine_http_in_flight", "In-flight Execution Engine HTTP requests", labels=["client"]
+        )
+        for key, pool_stats in self.engine_pool.stats().items():
+            engine_in_flight.add_metric([key], pool_stats["in_flight"])
+        yield engine_in_flight
+
+
+_runtime_collector: Optional[RuntimeCollector] = None
+
+
+def register_runtime_collector(db_engines: Dict[str, Any], dispatcher: Any, engine_pool: Any) -> None:
+    """런타임 상태 수집기를 기본 레지스트리에 한 번만 등록합니다."""
+    global _runtime_collector
+    if _runtime_collector is None:
+        _runtime_collector = RuntimeCollector(db_engines, dispatcher, engine_pool)
+        REGISTRY.register(_runtime_collector)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Prometheus 텍스트 형식의 본문과 Content-Type을 반환합니다."""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,234 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.job import JobStatus, TERMINAL_JOB_STATUSES, job_status_sources
+from app.schemas.execution import ExecutionORM
+from app.schemas.job import JobORM
+from app.schemas.log import LogORM
+from app.services.job import JobService
+from app.services.telemetry import record_job_transition
+from config.db import AsyncSessionLocal
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CompletionRecord:
+    """쓰기 지연 단계에 들어가는 Job 완료 기록입니다."""
+
+    job_id: str
+    status: JobStatus
+    result: Optional[Dict[str, Any]]
+    execution_orm: Optional[ExecutionORM]
+    log_orm: Optional[LogORM]
+    future: "asyncio.Future[bool]"
+
+
+def _row(orm: Any) -> Dict[str, Any]:
+    """ORM 객체를 INSERT용 컬럼 딕셔너리로 변환합니다.
+
+    값이 없는 컬럼은 빼서 컬럼 기본값이 적용되게 합니다.
+    """
+    row = {attr.key: getattr(orm, attr.key) for attr in orm.__mapper__.column_attrs}
+    return {key: value for key, value in row.items() if value is not None}
+
+
+class CompletionWriter:
+    """Job 완료 기록을 모아 한 트랜잭션으로 저장하는 쓰기 지연(write-behind) 단계입니다.
+
+    기록이 `max_batch`개 모이거나 첫 기록 이후 `max_delay_ms`가 지나면 한 번에
+    저장합니다. Job 상태는 기록마다 조건부 UPDATE로 바꾸고, Execution과 로그 행은
+    적용된 기록만 모아 다중 행 INSERT로 넣은 뒤 한 번 커밋합니다. `submit`은 커밋이
+    끝난 뒤에 반환하므로 호출자는 저장이 확정된 다음에 종료 상태를 알릴 수 있습니다.
+    """
+
+    def __init__(self, max_batch: Optional[int] = None, max_delay_ms: Optional[float] = None) -> None:
+        """배치 크기와 최대 지연 시간을 초기화합니다."""
+        self.max_batch = max_batch or settings.EXECUTION_WRITE_BEHIND_MAX_BATCH
+        self.max_delay = (max_delay_ms or settings.EXECUTION_WRITE_BEHIND_MAX_DELAY_MS) / 1000
+        self._pending: List[CompletionRecord] = []
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        """저장 루프가 실행 중인지 여부를 반환합니다."""
+        return self._task is not None and not self._stopping
+
+    async def start(self) -> None:
+        """저장 루프를 시작합니다."""
+        if self._task is not None:
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="completion-writer")
+
+    async def stop(self) -> None:
+        """남은 기록을 모두 저장한 뒤 저장 루프를 종료합니다."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wake.set()
+        await self._task
+        self._task = None
+
+    async def submit(
+        self,
+        job_id: str,
+        status: JobStatus,
+        result: Optional[Dict[str, Any]] = None,
+        execution_orm: Optional[ExecutionORM] = None,
+        log_orm: Optional[LogORM] = None,
+    ) -> bool:
+        """완료 기록을 넣고 저장이 확정될 때까지 기다립니다.
+
+        Args:
+            job_id: 대상 Job ID.
+            status: 종료 상태.
+            result: Job에 저장할 실행 결과 딕셔너리.
+            execution_orm: 함께 저장할 Execution 행.
+            log_orm: 함께 저장할 로그 메타데이터 행.
+
+        Returns:
+            상태 전이 적용 여부. Job이 그 사이 RUNNING이 아니게 되었으면 False.
+
+        Raises:
+            ValueError: 종료 상태가 아닌 경우.
+            RuntimeError: 저장 루프가 실행 중이 아닌 경우.
+        """
+        if status not in TERMINAL_JOB_STATUSES:
+            raise ValueError(f"{status} is not a terminal status")
+        if not self.running:
+            raise RuntimeError("Completion writer is not running")
+
+        future: "asyncio.Future[bool]" = asyncio.get_running_loop().create_future()
+        self._pending.append(CompletionRecord(job_id, status, result, execution_orm, log_orm, future))
+        if len(self._pending) == 1 or len(self._pending) >= self.max_batch:
+            self._wake.set()
+        return await future
+
+    async def _run(self) -> None:
+        """크기 또는 시간 조건이 될 때마다 모인 기록을 저장합니다.
+
+        배치 저장 중 예상하지 못한 오류(세션 연결 실패 등)가 나면 그 배치의 기록에
+        예외를 전달하고 루프는 계속 실행하므로, 기다리는 `submit`이 멈추지 않습니다.
+        """
+        while not self._stopping or self._pending:
+            if not self._pending:
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+
+            if len(self._pending) < self.max_batch and not self._stopping:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.max_delay)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch = self._pending[: self.max_batch]
+            del self._pending[: self.max_batch]
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                logger.exception("Failed to flush %d completions", len(batch))
+                for record in batch:
+                    if not record.future.done():
+                        record.future.set_exception(e)
+
+    async def _flush(self, batch: List[CompletionRecord]) -> None:
+        """배치 하나를 저장하고 기록별 결과를 알립니다.
+
+        배치 저장이 실패하면 기록마다 따로 저장을 다시 시도하여, 한 기록의 오류가
+        다른 Job의 결과를 잃게 하지 않습니다.
+        """
+        async with AsyncSessionLocal() as db:
+            try:
+                applied = await db.run_sync(self._write_batch, batch)
+            except Exception:
+                await db.rollback()
+                logger.exception("Failed to flush %d completions; retrying one by one", len(batch))
+                applied = []
+                for record in batch:
+                    try:
+                        applied.append(await db.run_sync(self._write_one, record))
+                    except Exception as e:
+                        await db.rollback()
+                        applied.append(e)
+
+        for record, outcome in zip(batch, applied):
+            if record.future.done():
+                continue
+            if isinstance(outcome, Exception):
+                record.future.set_exception(outcome)
+            else:
+                record.future.set_result(outcome)
+
+    @staticmethod
+    def _write_batch(session: Session, batch: List[CompletionRecord]) -> List[bool]:
+        """배치의 상태 전이와 Execution/로그 INSERT를 한 트랜잭션으로 저장합니다."""
+        applied: List[bool] = []
+        for record in batch:
+            values = JobService.status_values(record.status)
+            if record.result is not None:
+                values[JobORM.result] = record.result
+            if record.execution_orm is not None:
+                values[JobORM.latest_execution_id] = record.execution_orm.execution_id
+
+            updated = session.query(JobORM).filter(
+                JobORM.job_id == record.job_id,
+                JobORM.status.in_(job_status_sources(record.status)),
+            ).update(values, synchronize_session=False)
+            applied.append(bool(updated))
+            record_job_transition(record.status, bool(updated))
+
+        done = [record for record, ok in zip(batch, applied) if ok]
+
+        execution_rows = [_row(r.execution_orm) for r in done if r.execution_orm is not None]
+        if execution_rows:
+            session.execute(insert(ExecutionORM), execution_rows)
+
+        log_rows: Dict[str, Dict[str, Any]] = {
+            r.log_orm.log_key: _row(r.log_orm) for r in done if r.log_orm is not None
+        }
+        if log_rows:
+            # 같은 log_key의 메타데이터가 이미 있으면 건너뜁니다.
+            existing = session.query(LogORM.log_key).filter(LogORM.log_key.in_(list(log_rows))).all()
+            for (log_key,) in existing:
+                log_rows.pop(log_key, None)
+        if log_rows:
+            session.execute(insert(LogORM), list(log_rows.values()))
+
+        session.commit()
+        return applied
+
+    @staticmethod
+    def _write_one(session: Session, record: CompletionRecord) -> bool:
+        """기록 하나를 단독 트랜잭션으로 저장합니다."""
+        job_service = JobService(session)
+        try:
+            return job_service.transition_job(
+                record.job_id,
+                record.status,
+                result=record.result,
+                execution_orm=record.execution_orm,
+                log_orm=record.log_orm,
+            )
+        except IntegrityError:
+            session.rollback()
+            return job_service.transition_job(
+                record.job_id,
+                record.status,
+                result=record.result,
+                execution_orm=record.execution_orm,
+            )
+
+
+completion_writer = CompletionWriter()
@@ -0,0 +1,70 @@
+"""두 벤치마크 결과 JSON을 엔드포인트별로 비교합니다.
+
+    python -m bench.compare base.json new.json --threshold 10
+
+기준보다 p95가 `threshold`% 넘게 느려지거나 요청당 쿼리 수가 늘어난 엔드포인트가
+있으면 종료 코드 1을 반환하므로 CI에서 회귀 검사로 쓸 수 있습니다.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _change(base: Optional[float], new: Optional[float]) -> Optional[float]:
+    """기준 대비 변화율(%)을 반환합니다."""
+    if base is None or new is None or base == 0:
+        return None
+    return (new - base) / base * 100
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float) -> List[str]:
+    """엔드포인트별 비교 표를 출력하고 회귀한 엔드포인트 이름을 반환합니다."""
+    regressions: List[str] = []
+    print(f"{'endpoint':<40} {'p50':>18} {'p95':>18} {'p99':>18} {'queries':>12}")
+    for name in sorted(set(base["endpoints"]) | set(new["endpoints"])):
+        old_stats = base["endpoints"].get(name, {})
+        new_stats = new["endpoints"].get(name, {})
+        cells = []
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            change = _change(old_stats.get(key), new_stats.get(key))
+            value = new_stats.get(key)
+            cells.append(f"{value:8.2f} ({change:+6.1f}%)" if value is not None and change is not None else f"{'-':>18}")
+
+        old_queries = old_stats.get("queries_per_request")
+        new_queries = new_stats.get("queries_per_request")
+        queries = f"{old_queries or 0:.1f}->{new_queries or 0:.1f}"
+        print(f"{name:<40} {cells[0]:>18} {cells[1]:>18} {cells[2]:>18} {queries:>12}")
+
+        p95_change = _change(old_stats.get("p95_ms"), new_stats.get("p95_ms"))
+        if (p95_change is not None and p95_change > threshold) or (
+            old_queries is not None and new_queries is not None and new_queries > old_queries
+        ):
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=10.0, help="허용할 p95 증가율(%%)")
+    args = parser.parse_args(argv)
+
+    base, new = _load(args.base), _load(args.new)
+    print(f"base: {base['meta'].get('git_revision')}  new: {new['meta'].get('git_revision')}")
+    print(f"sessions/s: {base['totals']['sessions_per_s']:.1f} -> {new['totals']['sessions_per_s']:.1f}")
+
+    regressions = compare(base, new, args.threshold)
+    if regressions:
+        print(f"regressions: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import io
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+
+class _Body:
+    """`StreamingBody`처럼 `read`/`close`를 제공하는 본문 객체입니다."""
+
+    def __init__(self, data: bytes) -> None:
+        self._buffer = io.BytesIO(data)
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        return self._buffer.read(amt)
+
+    def close(self) -> None:
+        self._buffer.close()
+
+
+def _client_error(code: str, operation: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, operation)
+
+
+class FakeS3:
+    """코드/로그 버킷을 메모리에 두는 S3 대체 객체입니다.
+
+    애플리케이션이 쓰는 `put_object`, `upload_fileobj`, `get_object`(Range 포함),
+    `head_object`만 구현하며, 호출마다 `latency_ms`만큼 지연시켜 네트워크 왕복을
+    흉내 냅니다.
+    """
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        self.latency_ms = latency_ms
+        self.objects: Dict[Tuple[str, str], Tuple[bytes, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _wait(self) -> None:
+        if self.latency_ms > 0:
+            time.sleep(self.latency_ms / 1000)
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, ContentType: str = "", **kwargs: Any) -> Dict[str, Any]:
+        self._wait()
+        with self._lock:
+            self.objects[(Bucket, Key)] = (bytes(Body), {"ContentType": ContentType})
+        return {}
+
+    def upload_fileobj(self, body: BinaryIO, bucket: str, key: str, ExtraArgs: Optional[Dict[str, Any]] = None) -> None:
+        self._wait()
+        with self._lock:
+            self.objects[(bucket, key)] = (body.read(), {"ContentType": (ExtraArgs or {}).get("ContentType", "")})
+
+    def head_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        self._wait()
+        data, meta = self._get(Bucket, Key, "HeadObject")
+        return {"ContentLength": len(data), "ContentType": meta["ContentType"], "ETag": f'"{hash(data)}"'}
+
+    def get_object(self, Bucket: str, Key: str, Range: Optional[str] = None) -> Dict[str, Any]:
+        self._wait()
+        data, meta = self._get(Bucket, Key, "GetObject")
+        response: Dict[str, Any] = {"ContentType": meta["ContentType"], "ETag": f'"{hash(data)}"'}
+        if Range:
+            start, end = self._parse_range(Range, len(data))
+            response["ContentRange"] = f"bytes {start}-{end}/{len(data)}"
+            data = data[start:end + 1]
+        response["ContentLength"] = len(data)
+        response["Body"] = _Body(data)
+        return response
+
+    def close(self) -> None:
+        pass
+
+    def _get(self, bucket: str, key: str, operation: str) -> Tuple[bytes, Dict[str, Any]]:
+        with self._lock:
+            entry = self.objects.get((bucket, key))
+        if entry is None:
+            raise _client_error("NoSuchKey" if operation == "GetObject" else "404", operation)
+        return entry
+
+    @staticmethod
+    def _parse_range(value: str, size: int) -> Tuple[int, int]:
+        first, _, last = value.removeprefix("bytes=").partition("-")
+        if not first:
+            start, end = max(size - int(last), 0), size - 1
+        else:
+            start, end = int(first), min(int(last) if last else size - 1, size - 1)
+        if start >= size or start > end:
+            raise _client_error("InvalidRange", "GetObject")
+        return start, end
+
+
+class _ListMetricsPaginator:
+    def __init__(self, names: Tuple[str, ...]) -> None:
+        self.names = names
+
+    def paginate(self, **kwargs: Any) -> Iterator[Dict[str, Any]]:
+        yield {"Metrics": [{"MetricName": name} for name in self.names]}
+
+
+class FakeCloudWatch:
+    """CPU/Memory 사용률을 사인파로 만들어 돌려주는 CloudWatch 대체 객체입니다."""
+
+    METRIC_NAMES = ("CPUUtilization", "MemoryUtilization")
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        self.latency_ms = latency_ms
+
+    def get_paginator(self, operation: str) -> _ListMetricsPaginator:
+        return _ListMetricsPaginator(self.METRIC_NAMES)
+
+    def get_metric_data(
+        self,
+        MetricDataQueries: Any,
+        StartTime: datetime,
+        EndTime: datetime,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        if self.latency_ms > 0:
+            time.sleep(self.latency_ms / 1000)
+
+        results = []
+        for query in MetricDataQueries:
+            period = query["MetricStat"]["Period"]
+            start = int(StartTime.timestamp()) // period * period
+            timestamps = [
+                datetime.fromtimestamp(t, timezone.utc)
+                for t in range(start, int(EndTime.timestamp()), period)
+            ]
+            phase = 0.0 if query["Id"] == "cpu" else math.pi / 3
+            values = [50 + 30 * math.sin(t.timestamp() / 600 + phase) for t in timestamps]
+            results.append({"Id": query["Id"], "Timestamps": timestamps, "Values": values})
+        return {"MetricDataResults": results}
+
+    def close(self) -> None:
+        pass
+
+
+def install(registry: Any, s3: FakeS3, cloudwatch: FakeCloudWatch, regions: Tuple[str, ...]) -> None:
+    """AWS 클라이언트 레지스트리에 대체 객체를 미리 넣어 boto3 클라이언트 대신 쓰이게 합니다."""
+    for region in regions:
+        registry._clients[("s3", region)] = s3
+        registry._clients[("cloudwatch", region)] = cloudwatch
@@ -0,0 +1,93 @@
+import asyncio
+import math
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import uvicorn
+from fastapi import FastAPI, HTTPException
+
+from bench.fake_aws import FakeS3
+
+
+@dataclass
+class EngineProfile:
+    """가짜 Execution Engine의 응답 특성입니다.
+
+    실행 시간은 중앙값 `latency_ms`, 로그 표준편차 `latency_sigma`인 로그정규
+    분포를 따르며, stdout은 `output_bytes` 길이로 만들어집니다.
+    """
+
+    latency_ms: float = 50.0
+    latency_sigma: float = 0.5
+    output_bytes: int = 256
+    log_bytes: int = 4096
+    error_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+def create_app(profile: EngineProfile, s3: FakeS3, log_bucket: str) -> FastAPI:
+    """`GET /{language}/run` 을 제공하는 가짜 엔진 앱을 만듭니다.
+
+    실행마다 로그 객체를 가짜 S3 로그 버킷에 직접 기록해 로그 조회 경로도
+    실제와 같은 키로 동작하게 합니다.
+    """
+    app = FastAPI()
+    rng = random.Random(profile.seed)
+    stdout = ("x" * 79 + "\n") * (profile.output_bytes // 80) + "x" * (profile.output_bytes % 80)
+    log_body = (("log line " + "." * 70 + "\n") * (profile.log_bytes // 80 + 1)).encode("utf-8")[: profile.log_bytes]
+
+    @app.get("/{language}/run")
+    async def run(language: str, code_key: str) -> Dict[str, Any]:
+        if language not in ("python", "node", "java"):
+            raise HTTPException(status_code=404)
+
+        elapsed_ms = profile.latency_ms * math.exp(profile.latency_sigma * rng.gauss(0.0, 1.0))
+        await asyncio.sleep(elapsed_ms / 1000)
+
+        log_key = f"logs/{language}/{uuid.uuid4()}.log"
+        await asyncio.to_thread(s3.put_object, Bucket=log_bucket, Key=log_key, Body=log_body, ContentType="text/plain")
+
+        failed = rng.random() < profile.error_rate
+        return {
+            "stdout": "" if failed else stdout,
+            "stderr": "Traceback: simulated failure\n" if failed else "",
+            "code_key": code_key,
+            "log_key": log_key,
+            "cpu_percent": round(rng.uniform(5, 95), 2),
+            "memory_mb": round(rng.uniform(20, 200), 2),
+            "execution_time_ms": round(elapsed_ms, 2),
+        }
+
+    return app
+
+
+class BackgroundServer:
+    """uvicorn 서버를 별도 스레드에서 실행하는 컨텍스트 관리자입니다."""
+
+    def __init__(self, app: Any, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.server = uvicorn.Server(
+            uvicorn.Config(app, host=host, port=port, log_level="warning", lifespan="off")
+        )
+        self._thread = threading.Thread(target=self.server.run, name="fake-engine", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.servers[0].sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "BackgroundServer":
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("fake engine failed to start")
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.server.should_exit = True
+        self._thread.join(timeout=10)
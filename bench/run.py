@@ -0,0 +1,296 @@
+"""업로드 → 실행 → 상태/로그 조회 흐름을 정해진 동시성으로 반복하는 벤치마크입니다.
+
+Execution Engine은 로컬 가짜 HTTP 서버로, S3/CloudWatch는 프로세스 내 대체
+객체로, DB는 SQLite(기본) 또는 지정한 DB로 바꿔 외부 의존 없이 실행합니다.
+앱은 ASGI 전송으로 프로세스 안에서 호출하며, 엔드포인트별 p50/p95/p99와
+처리량, 요청당 DB 쿼리 수(`Server-Timing` 헤더)를 JSON으로 저장합니다.
+
+    python -m bench.run --sessions 500 --concurrency 32
+    python -m bench.compare bench/results/<old>.json bench/results/<new>.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from bench.fake_aws import FakeCloudWatch, FakeS3, install
+from bench.fake_engine import BackgroundServer, EngineProfile, create_app
+
+_SERVER_TIMING_DB = re.compile(r'(?:^|,\s*)db;dur=([\d.]+);desc="(\d+) queries"')
+_BENCH_CLUSTER = "bench-cluster"
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """정렬된 값에서 nearest-rank 방식으로 백분위수를 구합니다."""
+    if not sorted_values:
+        return None
+    rank = math.ceil(q / 100 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+def summarize(values: List[float]) -> Dict[str, Optional[float]]:
+    """지연 시간 목록의 요약 통계를 만듭니다."""
+    ordered = sorted(values)
+    return {
+        "mean_ms": sum(ordered) / len(ordered) if ordered else None,
+        "p50_ms": percentile(ordered, 50),
+        "p95_ms": percentile(ordered, 95),
+        "p99_ms": percentile(ordered, 99),
+        "max_ms": ordered[-1] if ordered else None,
+    }
+
+
+class Recorder:
+    """엔드포인트별 응답 시간과 DB 쿼리 수를 모읍니다."""
+
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.queries: Dict[str, List[int]] = defaultdict(list)
+        self.db_ms: Dict[str, List[float]] = defaultdict(list)
+        self.sessions: List[float] = []
+        self.session_errors = 0
+        self.status_polls: List[int] = []
+
+    async def call(self, client: Any, name: str, method: str, url: str, **kwargs: Any) -> Any:
+        """요청을 보내고 결과를 `name` 항목으로 기록합니다."""
+        started_at = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        self.latencies[name].append((time.perf_counter() - started_at) * 1000)
+        if response.status_code >= 400:
+            self.errors[name] += 1
+
+        match = _SERVER_TIMING_DB.search(response.headers.get("server-timing", ""))
+        if match:
+            self.db_ms[name].append(float(match.group(1)))
+            self.queries[name].append(int(match.group(2)))
+        return response
+
+    def report(self) -> Dict[str, Any]:
+        """엔드포인트별 요약을 만듭니다."""
+        endpoints: Dict[str, Any] = {}
+        for name, values in sorted(self.latencies.items()):
+            queries = self.queries.get(name, [])
+            db_ms = self.db_ms.get(name, [])
+            endpoints[name] = {
+                "count": len(values),
+                "errors": self.errors.get(name, 0),
+                **summarize(values),
+                "queries_per_request": sum(queries) / len(queries) if queries else None,
+                "queries_max": max(queries) if queries else None,
+                "db_ms_mean": sum(db_ms) / len(db_ms) if db_ms else None,
+            }
+        return endpoints
+
+
+async def run_session(client: Any, recorder: Recorder, index: int, args: argparse.Namespace, terminal: set) -> None:
+    """세션 하나(업로드 → 실행 → 완료까지 상태 조회 → 로그 조회)를 실행합니다."""
+    started_at = time.perf_counter()
+    language = args.languages[index % len(args.languages)]
+    code = f"print({index if not args.same_code else 0})\n" + "#" * args.code_bytes
+
+    response = await recorder.call(
+        client, "POST /api/upload", "POST", "/api/upload",
+        json={"project": f"bench-{index % args.projects}", "code": code, "language": language},
+    )
+    response.raise_for_status()
+    job_id = response.json()["job_id"]
+
+    response = await recorder.call(client, "POST /api/execute/{jobId}", "POST", f"/api/execute/{job_id}")
+    response.raise_for_status()
+
+    polls = 0
+    deadline = time.monotonic() + args.session_timeout
+    while True:
+        polls += 1
+        response = await recorder.call(client, "GET /api/jobs/{jobId}/status", "GET", f"/api/jobs/{job_id}/status")
+        response.raise_for_status()
+        job_status = response.json()
+        if job_status["status"] in terminal:
+            break
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"job {job_id} did not finish")
+        await asyncio.sleep(args.poll_interval_ms / 1000)
+    recorder.status_polls.append(polls)
+
+    if job_status.get("log_key"):
+        response = await recorder.call(client, "GET /api/log", "GET", "/api/log", params={"log_key": job_status["log_key"]})
+        response.raise_for_status()
+
+    if args.cloudwatch:
+        response = await recorder.call(client, "GET /api/cloudwatch/{clusterName}", "GET", f"/api/cloudwatch/{_BENCH_CLUSTER}")
+        response.raise_for_status()
+
+    recorder.sessions.append((time.perf_counter() - started_at) * 1000)
+
+
+async def drive(args: argparse.Namespace, s3: FakeS3, cloudwatch: FakeCloudWatch) -> Dict[str, Any]:
+    """앱 수명 주기 안에서 세션을 동시성 한도만큼 병렬로 실행하고 결과를 요약합니다."""
+    import httpx
+
+    # 환경 변수를 설정한 뒤에 가져와야 설정이 반영됩니다.
+    from app.clients.aws import aws_clients
+    from app.models.job import TERMINAL_JOB_STATUSES
+    from config.settings import settings
+    from main import app
+
+    install(aws_clients, s3, cloudwatch, tuple({settings.AWS_CODE_REGION, settings.AWS_LOG_REGION, settings.AWS_REGION}))
+    terminal = {s.value for s in TERMINAL_JOB_STATUSES}
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=args.session_timeout) as client:
+            # 연결 풀과 캐시를 데우는 세션은 결과에서 제외합니다.
+            warmup = Recorder()
+            await asyncio.gather(*(run_session(client, warmup, -1 - i, args, terminal) for i in range(args.warmup)))
+
+            recorder = Recorder()
+            next_index = iter(range(args.sessions))
+
+            async def worker() -> None:
+                for index in next_index:
+                    try:
+                        await run_session(client, recorder, index, args, terminal)
+                    except Exception as e:
+                        recorder.session_errors += 1
+                        if recorder.session_errors <= 5:
+                            print(f"session {index} failed: {e!r}", file=sys.stderr)
+
+            started_at = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+            elapsed = time.perf_counter() - started_at
+
+    completed = len(recorder.sessions)
+    return {
+        "totals": {
+            "sessions": args.sessions,
+            "completed": completed,
+            "errors": recorder.session_errors,
+            "duration_s": elapsed,
+            "sessions_per_s": completed / elapsed if elapsed else None,
+            "requests_per_s": sum(len(v) for v in recorder.latencies.values()) / elapsed if elapsed else None,
+            "status_polls_mean": (
+                sum(recorder.status_polls) / len(recorder.status_polls) if recorder.status_polls else None
+            ),
+        },
+        "session": summarize(recorder.sessions),
+        "endpoints": recorder.report(),
+    }
+
+
+def configure_environment(args: argparse.Namespace, engine_url: str, workdir: str) -> None:
+    """앱 설정을 벤치마크용 대체 서비스와 DB로 향하게 합니다."""
+    database_url = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}?timeout=30"
+    async_database_url = args.async_database_url or database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+
+    os.environ.update({
+        "SQLALCHEMY_DATABASE_URL": database_url,
+        "SQLALCHEMY_ASYNC_DATABASE_URL": async_database_url,
+        "EXECUTION_ENGINE_PYTHON_RUN_URL": f"{engine_url}/python/run",
+        "EXECUTION_ENGINE_NODE_RUN_URL": f"{engine_url}/node/run",
+        "EXECUTION_ENGINE_JAVA_RUN_URL": f"{engine_url}/java/run",
+        "EXECUTION_RESULT_CACHE_ENABLED": str(args.result_cache).lower(),
+        "CLOUDWATCH_POLL_ENABLED": "false",
+        "SQL_INSTRUMENTATION_ENABLED": "true",
+        "LOG_CACHE_DIR": os.path.join(workdir, "log-cache"),
+    })
+
+
+def git_revision() -> Optional[str]:
+    """현재 커밋 해시를 반환합니다. git 저장소가 아니면 None."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=200, help="측정할 세션 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시에 진행할 세션 수")
+    parser.add_argument("--warmup", type=int, default=5, help="결과에서 제외할 예열 세션 수")
+    parser.add_argument("--languages", nargs="+", default=["python", "node", "java"])
+    parser.add_argument("--projects", type=int, default=10, help="세션이 나누어 쓸 프로젝트 수")
+    parser.add_argument("--code-bytes", type=int, default=512, help="업로드할 코드 크기")
+    parser.add_argument("--same-code", action="store_true", help="모든 세션이 같은 코드를 업로드")
+    parser.add_argument("--result-cache", action="store_true", help="실행 결과 캐시 사용")
+    parser.add_argument("--cloudwatch", action="store_true", help="세션마다 클러스터 메트릭도 조회")
+    parser.add_argument("--engine-latency-ms", type=float, default=50.0, help="엔진 실행 시간 중앙값")
+    parser.add_argument("--engine-latency-sigma", type=float, default=0.5, help="엔진 실행 시간 로그 표준편차")
+    parser.add_argument("--engine-output-bytes", type=int, default=256, help="엔진 stdout 크기")
+    parser.add_argument("--engine-log-bytes", type=int, default=4096, help="실행 로그 크기")
+    parser.add_argument("--engine-error-rate", type=float, default=0.0, help="stderr를 돌려줄 비율")
+    parser.add_argument("--s3-latency-ms", type=float, default=5.0)
+    parser.add_argument("--cloudwatch-latency-ms", type=float, default=20.0)
+    parser.add_argument("--poll-interval-ms", type=float, default=20.0)
+    parser.add_argument("--session-timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--database-url", help="동기 DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--async-database-url", help="비동기 DB URL (기본: --database-url에서 유도)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: bench/results/<시각>-<커밋>.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    s3 = FakeS3(latency_ms=args.s3_latency_ms)
+    cloudwatch = FakeCloudWatch(latency_ms=args.cloudwatch_latency_ms)
+    profile = EngineProfile(
+        latency_ms=args.engine_latency_ms,
+        latency_sigma=args.engine_latency_sigma,
+        output_bytes=args.engine_output_bytes,
+        log_bytes=args.engine_log_bytes,
+        error_rate=args.engine_error_rate,
+        seed=args.seed,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="service-server-bench-") as workdir:
+        log_bucket = os.environ.get("AWS_LOG_BUCKET", "softbank-log-bucket")
+        with BackgroundServer(create_app(profile, s3, log_bucket)) as engine:
+            configure_environment(args, engine.base_url, workdir)
+            result = asyncio.run(drive(args, s3, cloudwatch))
+
+    revision = git_revision()
+    report = {
+        "meta": {
+            "git_revision": revision,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": vars(args),
+        },
+        **result,
+    }
+
+    output = args.output or os.path.join(
+        os.path.dirname(__file__),
+        "results",
+        f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{(revision or 'unknown')[:8]}.json",
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    totals = result["totals"]
+    print(f"{totals['completed']}/{totals['sessions']} sessions in {totals['duration_s']:.2f}s "
+          f"({totals['sessions_per_s']:.1f} sessions/s, {totals['requests_per_s']:.1f} req/s)")
+    for name, stats in result["endpoints"].items():
+        print(f"  {name:<40} p50={stats['p50_ms']:8.2f}ms p95={stats['p95_ms']:8.2f}ms "
+              f"p99={stats['p99_ms']:8.2f}ms queries={stats['queries_per_request']}")
+    print(f"results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,259 @@
-from sqlalchemy import create_engine
+import asyncio
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Column, MetaData, String, Table, create_engine, delete, event, insert, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from config.settings import settings
 
 
 Base = declarative_base()
 
+# 스크립트/마이그레이션용 동기 엔진
 engine = create_engine(settings.DATABASE_URL, echo=False, pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# API 라우트와 실행 워커용 비동기 엔진
+async_engine = create_async_engine(settings.ASYNC_DATABASE_URL, echo=False, pool_pre_ping=True)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+logger = logging.getLogger(__name__)
+
+# `IN (%s, %s, ...)`처럼 길이만 다른 자리표시자 목록을 하나로 접습니다.
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:%s|\?|:\w+)(?:\s*,\s*(?:%s|\?|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class QueryStats:
+    """한 요청에서 실행된 SQL 문의 개수와 시간을 모읍니다."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    slowest: List[Tuple[float, str]] = field(default_factory=list)
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed_ms: float, keep_slowest: int) -> None:
+        """문장 하나의 실행 시간을 반영합니다."""
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.shapes[statement_shape(statement)] += 1
+        if keep_slowest > 0:
+            self.slowest.append((elapsed_ms, statement))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[keep_slowest:]
+
+    def repeated_selects(self, threshold: int) -> List[Tuple[str, int]]:
+        """같은 형태로 `threshold`번 이상 반복된 SELECT 문을 반환합니다(N+1 의심)."""
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= threshold and shape.startswith("SELECT")
+        ]
+
+
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def statement_shape(statement: str) -> str:
+    """자리표시자 목록 길이와 공백 차이를 무시한 SQL 문의 형태를 반환합니다."""
+    return _PLACEHOLDER_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def start_query_tracking() -> QueryStats:
+    """현재 컨텍스트(요청)에서 실행되는 SQL 문을 집계하기 시작합니다.
+
+    `AsyncSession.run_sync`로 실행되는 동기 서비스도 호출한 태스크의 컨텍스트를
+    이어받으므로 같은 집계에 포함됩니다.
+    """
+    stats = QueryStats()
+    _query_stats.set(stats)
+    return stats
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    """실행 시작 시각을 연결 정보에 쌓아 둡니다."""
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    """실행 시간을 느린 쿼리 로그와 현재 요청의 집계에 반영합니다."""
+    elapsed_ms = (time.perf_counter() - conn.info["query_started_at"].pop()) * 1000
+
+    if elapsed_ms >= settings.SQL_SLOW_QUERY_MS:
+        # 파라미터에는 사용자 코드나 입력이 들어 있을 수 있으므로 남기지 않습니다.
+        logger.warning("Slow query (%.1f ms): %s", elapsed_ms, statement_shape(statement)[:1000])
+
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed_ms, settings.SQL_SERVER_TIMING_TOP)
+
+
+def instrument_engine(target: Engine) -> None:
+    """엔진에 SQL 실행 시간 측정 이벤트 훅을 등록합니다."""
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+
+
+if settings.SQL_INSTRUMENTATION_ENABLED:
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+
+
+# 마지막으로 스키마를 확인한 버전을 기록하는 테이블 (ORM 메타데이터와 분리)
+schema_version_table = Table(
+    "service_schema_version",
+    MetaData(),
+    Column("version", String(64), primary_key=True),
+)
+
+# create_all은 이미 있는 테이블에 컬럼을 추가하지 않으므로, 기존 테이블에 추가한
+# 컬럼은 도입한 스키마 버전별로 (테이블, 컬럼, 컬럼 정의)를 여기에 기록합니다.
+# 새 항목을 추가하면 DB_SCHEMA_VERSION도 그 버전으로 올립니다.
+SCHEMA_MIGRATIONS: Dict[int, List[Tuple[str, str, str]]] = {
+    # 큰 stdout/stderr를 S3로 분리해 저장
+    2: [
+        ("executions", "stdout_key", "VARCHAR(500) NULL"),
+        ("executions", "stdout_bytes", "INTEGER NULL"),
+        ("executions", "stderr_key", "VARCHAR(500) NULL"),
+        ("executions", "stderr_bytes", "INTEGER NULL"),
+    ],
+    # 실행 대기열 항목의 인스턴스별 임대
+    3: [
+        ("execution_queue", "claimed_by", "VARCHAR(100) NULL"),
+        ("execution_queue", "claimed_at", "DATETIME NULL"),
+    ],
+}
+
+
+def _parse_version(version: Optional[str]) -> int:
+    """기록된 스키마 버전을 정수로 변환합니다. 없거나 알 수 없는 값은 0으로 봅니다."""
+    try:
+        return int(version) if version is not None else 0
+    except ValueError:
+        return 0
+
+
+def apply_schema_migrations(connection: Connection, after: int = 0, upto: Optional[int] = None) -> int:
+    """`after`보다 크고 `upto` 이하인 버전의 컬럼 추가 단계를 순서대로 적용합니다.
+
+    테이블이 없거나(곧 create_all로 만들어지는 경우) 컬럼이 이미 있으면 건너뛰므로
+    여러 번 실행해도 안전합니다.
+
+    Args:
+        connection: 트랜잭션이 시작된 연결.
+        after: 이미 적용된 스키마 버전.
+        upto: 적용할 마지막 버전. 없으면 등록된 모든 버전을 적용합니다.
+
+    Returns:
+        실행한 `ALTER TABLE` 문 수.
+    """
+    inspector = inspect(connection)
+    tables = set(inspector.get_table_names())
+    applied = 0
+    for version in sorted(SCHEMA_MIGRATIONS):
+        if version <= after or (upto is not None and version > upto):
+            continue
+        for table, column, definition in SCHEMA_MIGRATIONS[version]:
+            if table not in tables:
+                continue
+            if column in {c["name"] for c in inspector.get_columns(table)}:
+                continue
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {definition}"))
+            inspector.clear_cache()
+            applied += 1
+            logger.info("Schema v%d: added %s.%s", version, table, column)
+    return applied
+
+
+def ensure_schema(connection: Connection, mode: Optional[str] = None, version: Optional[str] = None) -> bool:
+    """설정된 방식으로 테이블을 확인하고 없으면 생성합니다.
+
+    - `create`: 매번 `SCHEMA_MIGRATIONS`의 컬럼 추가 단계를 모두 확인하고
+      `create_all(checkfirst=True)`로 없는 테이블을 만듭니다.
+    - `version`: 기록된 스키마 버전이 `version`과 같으면 건너뛰고, 다르면 기록된
+      버전 이후의 컬럼 추가 단계를 적용하고 `create_all` 후 버전을 기록합니다.
+      기동마다 조회 한 번으로 끝납니다.
+    - `off`: 아무것도 하지 않습니다 (마이그레이션 도구로 관리하는 경우).
+
+    컬럼 타입 변경이나 삭제처럼 컬럼 추가가 아닌 변경은 직접 마이그레이션해야 합니다.
 
-def init_db() -> None:
-    """데이터베이스 테이블을 자동으로 생성합니다.
-    
     모든 ORM 엔티티(schemas)를 Base에 등록한 후 호출해야 합니다.
-    이미 존재하는 테이블이나 인덱스는 건너뜁니다.
+
+    Args:
+        connection: 트랜잭션이 시작된 연결.
+        mode: 확인 방식. 없으면 `DB_SCHEMA_CHECK` 설정을 사용합니다.
+        version: 기대하는 스키마 버전. 없으면 `DB_SCHEMA_VERSION` 설정을 사용합니다.
+
+    Returns:
+        스키마를 확인·변경했는지 여부.
+
+    Raises:
+        ValueError: 알 수 없는 확인 방식인 경우.
     """
-    Base.metadata.create_all(bind=engine, checkfirst=True)
+    mode = mode or settings.DB_SCHEMA_CHECK
+    if mode == "off":
+        return False
+    if mode == "create":
+        apply_schema_migrations(connection)
+        Base.metadata.create_all(bind=connection, checkfirst=True)
+        return True
+    if mode != "version":
+        raise ValueError(f"Unknown DB_SCHEMA_CHECK mode: {mode}")
+
+    version = version or settings.DB_SCHEMA_VERSION
+    schema_version_table.create(bind=connection, checkfirst=True)
+    current = connection.execute(select(schema_version_table.c.version)).scalar()
+    if current == version:
+        return False
+
+    apply_schema_migrations(connection, after=_parse_version(current), upto=_parse_version(version))
+    Base.metadata.create_all(bind=connection, checkfirst=True)
+    connection.execute(delete(schema_version_table))
+    connection.execute(insert(schema_version_table).values(version=version))
+    return True
+
+
+def init_db(mode: Optional[str] = None) -> bool:
+    """동기 엔진으로 스키마를 확인합니다. 스크립트와 마이그레이션에서 사용합니다."""
+    with engine.begin() as connection:
+        return ensure_schema(connection, mode)
+
+
+async def init_db_async(mode: Optional[str] = None) -> bool:
+    """비동기 엔진으로 스키마를 확인합니다. 앱 기동(lifespan) 시 사용합니다."""
+    async with async_engine.begin() as connection:
+        return await connection.run_sync(ensure_schema, mode)
+
+
+async def warmup_db_pool(connections: Optional[int] = None) -> None:
+    """비동기 엔진 풀에 연결을 미리 동시에 열어 둡니다.
+
+    연결을 모두 연 뒤에 반납하므로 풀에는 서로 다른 연결이 `connections`개 남고,
+    첫 요청들이 연결 수립 비용을 치르지 않습니다.
+    """
+    count = settings.DB_POOL_WARMUP_CONNECTIONS if connections is None else connections
+    pending = [async_engine.connect() for _ in range(count)]
+    try:
+        await asyncio.gather(*(connection.start() for connection in pending))
+    finally:
+        await asyncio.gather(*(connection.close() for connection in pending), return_exceptions=True)
 
 
 def get_db():
@@ -28,3 +266,12 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """비동기 데이터베이스 세션을 생성하고 반환합니다.
+
+    FastAPI 의존성 주입용 비동기 제너레이터입니다.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
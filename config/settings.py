@@ -21,6 +21,43 @@ class Settings(BaseSettings):
     EXECUTION_ENGINE_NODE_RUN_URL: str = f"{EXECUTION_ENGINE_BASE_URL}/node/run"
     EXECUTION_ENGINE_JAVA_RUN_URL: str = f"{EXECUTION_ENGINE_BASE_URL}/java/run"
 
+    EXECUTION_ENGINE_MAX_CONNECTIONS: dict[str, int] = {"python": 50, "node": 50, "java": 20, "default": 10}
+    EXECUTION_ENGINE_MAX_KEEPALIVE: dict[str, int] = {"python": 20, "node": 20, "java": 10, "default": 5}
+    EXECUTION_ENGINE_KEEPALIVE_EXPIRY: float = 30.0
+    EXECUTION_ENGINE_HTTP2: bool = True
+
+    EXECUTION_WORKER_CONCURRENCY: dict[str, int] = {"python": 8, "node": 8, "java": 4}
+    EXECUTION_QUEUE_MAX_SIZE: int = 1000
+    EXECUTION_MAX_ATTEMPTS: int = 3
+    # 비어 있으면 호스트 이름과 PID로 인스턴스 ID를 만듭니다.
+    EXECUTION_INSTANCE_ID: str = ""
+    EXECUTION_QUEUE_LEASE_SECONDS: float = 60.0
+    EXECUTION_QUEUE_HEARTBEAT_SECONDS: float = 15.0
+    EXECUTION_BATCH_MAX_SIZE: int = 500
+    EXECUTION_WRITE_BEHIND_ENABLED: bool = False
+    EXECUTION_WRITE_BEHIND_MAX_BATCH: int = 200
+    EXECUTION_WRITE_BEHIND_MAX_DELAY_MS: float = 50.0
+
+    EXECUTION_RESULT_CACHE_ENABLED: bool = False
+    EXECUTION_RESULT_CACHE_MAX_ENTRIES: int = 1000
+    EXECUTION_RESULT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    EXECUTION_RESULT_CACHE_TTL_SECONDS: float = 600.0
+
+    EXECUTION_OUTPUT_INLINE_MAX_BYTES: int = 64 * 1024
+    EXECUTION_OUTPUT_PREVIEW_BYTES: int = 4 * 1024
+
+    JOB_EVENTS_HEARTBEAT_SECONDS: float = 15.0
+
+    CLOUDWATCH_CACHE_MAX_ENTRIES: int = 256
+    CLOUDWATCH_CACHE_MIN_TTL_SECONDS: float = 5.0
+    CLOUDWATCH_CACHE_PUBLISH_DELAY_SECONDS: float = 5.0
+    CLOUDWATCH_CACHE_MAX_STALE_SECONDS: float = 600.0
+
+    CLOUDWATCH_POLL_ENABLED: bool = True
+    CLOUDWATCH_POLL_CLUSTERS: list[str] = []
+    CLOUDWATCH_POLL_PERIOD_SECONDS: int = 60
+    CLOUDWATCH_RETENTION_MINUTES: int = 24 * 60
+
     RESOURCE_URL: str = "http://softbank-exec-engine-alb-423729816.ap-northeast-2.elb.amazonaws.com/monitor/"
     RESOURCE_PYTHON_URL: str = f"{RESOURCE_URL}/python"
     RESOURCE_NODE_URL: str = f"{RESOURCE_URL}/node"
@@ -32,6 +69,7 @@ class Settings(BaseSettings):
 
     AWS_CODE_REGION: str = "ap-northeast-2"
     AWS_CODE_BUCKET: str = "softbank-code-bucket"
+    AWS_CODE_KNOWN_KEYS_MAX: int = 100000
 
     AWS_LOG_REGION: str = "ap-northeast-2"
     AWS_LOG_BUCKET: str = "softbank-log-bucket"
@@ -42,13 +80,68 @@ class Settings(BaseSettings):
     AWS_RDS_USERNAME: str | None = None
     AWS_RDS_PASSWORD: str | None = None 
 
+    # 지정하면 RDS 설정 대신 이 연결 문자열을 사용합니다 (벤치마크, 로컬 DB 등).
+    SQLALCHEMY_DATABASE_URL: str | None = None
+    SQLALCHEMY_ASYNC_DATABASE_URL: str | None = None
+
+    # create: 기동마다 create_all / version: 버전이 바뀌었을 때만 / off: 확인하지 않음
+    DB_SCHEMA_CHECK: str = "create"
+    DB_SCHEMA_VERSION: str = "3"
+    DB_POOL_WARMUP_CONNECTIONS: int = 4
+    EXECUTION_ENGINE_WARMUP_CONNECT: bool = True
+
     AWS_ECS_CLUSTER_NAME: str = "softbank-execution-engine"
 
+    AWS_IO_MAX_WORKERS: int = 32
+    AWS_IO_MAX_PENDING: int = 256
+    AWS_IO_TIMEOUT_SECONDS: float = 30.0
+
+    AWS_REGION: str = "ap-northeast-2"
+    AWS_MAX_POOL_CONNECTIONS: int = 50
+    AWS_CONNECT_TIMEOUT_SECONDS: float = 3.0
+    AWS_READ_TIMEOUT_SECONDS: float = 20.0
+    AWS_MAX_ATTEMPTS: int = 3
+    AWS_RETRY_MODE: str = "standard"
+
+    LOG_STREAM_CHUNK_BYTES: int = 64 * 1024
+    LOG_TAIL_INITIAL_BYTES: int = 64 * 1024
+    LOG_TAIL_MAX_BYTES: int = 8 * 1024 * 1024
+
+    LOG_CACHE_MEMORY_MAX_BYTES: int = 32 * 1024 * 1024
+    LOG_CACHE_DISK_MAX_BYTES: int = 512 * 1024 * 1024
+    LOG_CACHE_MAX_OBJECT_BYTES: int = 8 * 1024 * 1024
+    LOG_CACHE_DIR: str | None = None
+
+    PROJECT_CACHE_TTL_SECONDS: float = 300.0
+    PROJECT_CACHE_MAX_ENTRIES: int = 10000
+
+    METRICS_ENABLED: bool = True
+
+    PROFILING_ENABLED: bool = False
+    PROFILING_TOKEN: str | None = None
+    PROFILING_DIR: str | None = None
+    PROFILING_MAX_SECONDS: float = 60.0
+
+    SQL_INSTRUMENTATION_ENABLED: bool = True
+    SQL_SLOW_QUERY_MS: float = 200.0
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+    SQL_SERVER_TIMING_TOP: int = 3
+
     @computed_field
     @property
     def DATABASE_URL(self) -> str:
         """RDS 연결 문자열을 동적으로 생성합니다."""
+        if self.SQLALCHEMY_DATABASE_URL:
+            return self.SQLALCHEMY_DATABASE_URL
         return f"mysql+pymysql://{self.AWS_RDS_USERNAME}:{self.AWS_RDS_PASSWORD}@{self.AWS_RDS_HOST}:{self.AWS_RDS_PORT}/{self.AWS_RDS_DBNAME}"
+
+    @computed_field
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        """비동기 드라이버(aiomysql)용 RDS 연결 문자열을 동적으로 생성합니다."""
+        if self.SQLALCHEMY_ASYNC_DATABASE_URL:
+            return self.SQLALCHEMY_ASYNC_DATABASE_URL
+        return f"mysql+aiomysql://{self.AWS_RDS_USERNAME}:{self.AWS_RDS_PASSWORD}@{self.AWS_RDS_HOST}:{self.AWS_RDS_PORT}/{self.AWS_RDS_DBNAME}"
         
     class Config:
         env_file = ".env"
@@ -1,22 +1,122 @@
-﻿from fastapi import FastAPI
+﻿import time
+
+# 모듈 임포트에 걸린 시간도 기동 시간에 포함해 보고합니다.
+_IMPORT_STARTED_AT = time.perf_counter()
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Awaitable, Dict
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes import router
 from config.settings import settings
-from config.db import init_db
+from config.db import async_engine, engine, init_db_async, warmup_db_pool
+from app.clients.aws import aws_clients
+from app.clients.aws_io import aws_executor
+from app.clients.engine import engine_http_pool
+from app.services.dispatcher import execution_dispatcher
+from app.services.metrics_store import cluster_metrics_poller
+from app.services.profiling import RequestProfilingMiddleware
+from app.services.telemetry import (
+    STARTUP_SECONDS,
+    MetricsMiddleware,
+    QueryTimingMiddleware,
+    register_runtime_collector,
+    render_metrics,
+)
+from app.services.write_behind import completion_writer
 
 # ORM 엔티티 임포트 (Base.metadata에 등록하기 위해)
 from app.schemas.project import ProjectORM
 from app.schemas.job import JobORM
 from app.schemas.execution import ExecutionORM
 from app.schemas.log import LogORM
+from app.schemas.execution_queue import ExecutionQueueORM
+
+IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED_AT
+
+logger = logging.getLogger(__name__)
+
+
+async def _timed(phase: str, timings: Dict[str, float], step: Awaitable[object]) -> None:
+    """기동 단계 하나를 실행하고 걸린 시간을 기록합니다."""
+    started_at = time.perf_counter()
+    try:
+        await step
+    finally:
+        timings[phase] = time.perf_counter() - started_at
+
+
+async def _warmup_db_pool() -> None:
+    """DB 연결을 미리 엽니다. 실패해도 기동은 계속하고 연결은 첫 요청 때 맺습니다."""
+    try:
+        await warmup_db_pool()
+    except Exception:
+        logger.warning("Failed to warm up the database pool", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """스키마 확인, 연결 예열, 실행 디스패처, 완료 기록 쓰기 지연 단계, 메트릭 폴러, AWS 클라이언트와 스레드 풀을 앱 수명 주기에 맞춰 관리합니다.
+
+    서로 의존하지 않는 DB 풀, 엔진 HTTP 연결, boto3 클라이언트 예열은 동시에
+    진행하며, 단계별 소요 시간은 로그와 `/metrics`, `/` 응답으로 보고합니다.
+    """
+    started_at = time.perf_counter()
+    timings: Dict[str, float] = {"imports": IMPORT_SECONDS}
+
+    # 디스패처가 대기열을 복구하기 전에 테이블이 준비되어 있어야 합니다.
+    await _timed("schema", timings, init_db_async())
+
+    languages = list(settings.EXECUTION_WORKER_CONCURRENCY)
+    connect_urls = None
+    if settings.EXECUTION_ENGINE_WARMUP_CONNECT:
+        connect_urls = {lang: settings.EXECUTION_ENGINE_BASE_URL for lang in languages}
+    await asyncio.gather(
+        _timed("db_pool", timings, _warmup_db_pool()),
+        _timed("engine_http", timings, engine_http_pool.warmup(languages, connect_urls)),
+        # 첫 요청이 boto3 클라이언트 생성 비용을 치르지 않도록 미리 만듭니다.
+        _timed("aws_clients", timings, aws_executor.run(aws_clients.warmup)),
+    )
+
+    workers_started_at = time.perf_counter()
+    if settings.EXECUTION_WRITE_BEHIND_ENABLED:
+        await completion_writer.start()
+    await execution_dispatcher.start()
+    if settings.CLOUDWATCH_POLL_ENABLED:
+        cluster_metrics_poller.start()
+    timings["workers"] = time.perf_counter() - workers_started_at
+    timings["lifespan"] = time.perf_counter() - started_at
+
+    for phase, seconds in timings.items():
+        STARTUP_SECONDS.labels(phase).set(seconds)
+    app.state.startup_ms = {phase: round(seconds * 1000, 1) for phase, seconds in timings.items()}
+    logger.info(
+        "Startup finished in %.1f ms (imports %.1f ms): %s",
+        (timings["imports"] + timings["lifespan"]) * 1000,
+        timings["imports"] * 1000,
+        app.state.startup_ms,
+    )
+
+    try:
+        yield
+    finally:
+        await cluster_metrics_poller.stop()
+        await execution_dispatcher.stop()
+        # 워커가 넘긴 완료 기록을 모두 저장한 뒤 종료합니다.
+        await completion_writer.stop()
+        await engine_http_pool.aclose()
+        aws_executor.shutdown()
+        aws_clients.close()
 
-# 애플리케이션 시작 시 테이블 생성
-init_db()
 
 app = FastAPI(
     title="서비스 서버 - 코드 실행 관리자",
     description="코드 업로드/실행 요청을 관리하는 API 게이트웨이",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -27,6 +127,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.SQL_INSTRUMENTATION_ENABLED:
+    app.add_middleware(QueryTimingMiddleware)
+
+if settings.PROFILING_ENABLED:
+    app.add_middleware(RequestProfilingMiddleware)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    register_runtime_collector(
+        {"sync": engine, "async": async_engine},
+        execution_dispatcher,
+        engine_http_pool,
+    )
+
 app.include_router(router, prefix="/api", tags=["execution"])
 
 
@@ -35,15 +149,25 @@ async def root() -> dict:
     """서비스 메타 정보를 반환합니다.
 
     Returns:
-        서비스 이름, 버전, 상태가 포함된 딕셔너리.
+        서비스 이름, 버전, 상태, 기동 단계별 소요 시간(밀리초)이 포함된 딕셔너리.
     """
     return {
         "service": "서비스 서버 - 코드 실행 관리자",
         "version": "0.1.0",
         "status": "running",
+        "startup_ms": getattr(app.state, "startup_ms", None),
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus 형식의 메트릭을 반환합니다."""
+    if not settings.METRICS_ENABLED:
+        return Response(status_code=404)
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 if __name__ == "__main__":
     import uvicorn
 